@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, status
+
+from app.core.security import require_admin
+from app.db.slow_queries import slow_query_log
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get("/slow-queries")
+def list_slow_queries():
+    """Slow statements captured by this worker, newest first."""
+    return slow_query_log.entries()
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries():
+    slow_query_log.clear()
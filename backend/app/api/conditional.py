@@ -0,0 +1,66 @@
+"""
+HTTP conditional request helpers (ETag / Last-Modified / 304).
+
+Handlers compute a cheap version of the resource first, answer 304 when the
+client's validators still match, and only build the full body otherwise.
+"""
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+def make_etag(version: str) -> str:
+    """Return a strong ETag for a version string."""
+    return '"' + hashlib.sha256(version.encode()).hexdigest()[:32] + '"'
+
+
+def _http_date(value: datetime) -> str:
+    # Timestamps are stored as naive UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return format_datetime(value.astimezone(UTC), usegmt=True)
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None = None
+) -> bool:
+    """
+    Evaluate ``If-None-Match`` (or, if absent, ``If-Modified-Since``)
+    against the current validators.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except ValueError:
+            return False
+        modified = last_modified.replace(microsecond=0)
+        if modified.tzinfo is None:
+            modified = modified.replace(tzinfo=UTC)
+        return modified <= since
+
+    return False
+
+
+def set_validators(
+    response: Response, etag: str, last_modified: datetime | None = None
+) -> None:
+    """Attach ``ETag`` and, when known, ``Last-Modified`` to a response."""
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = _http_date(last_modified)
+
+
+def not_modified(etag: str, last_modified: datetime | None = None) -> Response:
+    """Build an empty 304 response carrying the current validators."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
@@ -1,4 +1,14 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+
+from app.core.metrics import observe_pool, render_metrics
+from app.core.security import token_cache
+from app.db.pool import pool_status
+from app.db.session import (
+    async_engine,
+    async_replica_engines,
+    engine,
+    replica_engines,
+)
 
 router = APIRouter(tags=["health"])
 
@@ -6,3 +16,40 @@ router = APIRouter(tags=["health"])
 @router.get("/health")
 def health_check():
     return {"status": "ok"}
+
+
+@router.get("/health/pool")
+def pool_stats():
+    stats = {"sync": pool_status(engine)}
+    if replica_engines:
+        stats["sync_replicas"] = [pool_status(e) for e in replica_engines]
+    if async_engine is not None:
+        stats["async"] = pool_status(async_engine.sync_engine)
+    if async_replica_engines:
+        stats["async_replicas"] = [
+            pool_status(e.sync_engine) for e in async_replica_engines
+        ]
+    return stats
+
+
+@router.get("/health/token-cache")
+def token_cache_stats():
+    return token_cache.stats()
+
+
+def publish_runtime_metrics() -> None:
+    """Copy pool counters of this process into the metric gauges."""
+    observe_pool("primary", pool_status(engine))
+    for i, e in enumerate(replica_engines):
+        observe_pool(f"replica-{i}", pool_status(e))
+    if async_engine is not None:
+        observe_pool("async-primary", pool_status(async_engine.sync_engine))
+    for i, ae in enumerate(async_replica_engines):
+        observe_pool(f"async-replica-{i}", pool_status(ae.sync_engine))
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    publish_runtime_metrics()
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.api.conditional import is_not_modified, make_etag, not_modified, set_validators
+from app.db.session import SessionRunner, get_session_runner
+from app.domain.value_objects import StatusOption
 from app.repositories.status_repo import StatusRepository
 from app.schemas.status import StatusResponse
 from app.services.status_service import StatusService
@@ -9,16 +11,29 @@ from app.services.status_service import StatusService
 router = APIRouter(prefix="/statuses", tags=["statuses"])
 
 
-def get_status_service(db: Session = Depends(get_db)) -> StatusService:  # noqa: B008
+def build_status_service(db: Session) -> StatusService:
     return StatusService(StatusRepository(db))
 
 
 @router.get("/", response_model=list[StatusResponse])
-def get_statuses(
-    service: StatusService = Depends(get_status_service),  # noqa: B008
+async def get_statuses(
+    request: Request,
+    response: Response,
+    runner: SessionRunner = Depends(get_session_runner),  # noqa: B008
     lang: str = "en",
 ):
-    options = service.get_all_options(lang)
+    def load(db: Session) -> tuple[str, list[StatusOption] | None]:
+        service = build_status_service(db)
+        etag = make_etag(f"statuses:{lang}:{service.get_version()}")
+        if is_not_modified(request, etag):
+            return etag, None
+        return etag, service.get_all_options(lang)
+
+    etag, options = await runner.run(load)
+    if options is None:
+        return not_modified(etag)
+
+    set_validators(response, etag)
     return [
         StatusResponse(
             status_id=opt.status_id,
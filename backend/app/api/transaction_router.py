@@ -1,19 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Literal
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.api.conditional import is_not_modified, make_etag, not_modified, set_validators
+from app.core.config.settings import settings
 from app.core.security import get_current_user
-from app.db.session import get_db
+from app.db.session import SessionRunner, get_db, get_session_runner
+from app.domain.models import IdempotencyRecord
+from app.domain.value_objects import TransactionFilter
 from app.repositories.contractor_repo import ContractorRepository
+from app.repositories.idempotency_repo import IdempotencyRepository
 from app.repositories.status_repo import StatusRepository
 from app.repositories.transaction_repo import TransactionRepository
 from app.repositories.transaction_type_repo import TransactionTypeRepository
 from app.schemas.transaction import (
+    MAX_BATCH_DETAIL_IDS,
+    MAX_BULK_STATUS_IDS,
+    TransactionBatchDetailItem,
+    TransactionBatchDetailRequest,
+    TransactionBatchDetailResponse,
+    TransactionBulkCreateRequest,
+    TransactionBulkCreateResponse,
+    TransactionBulkItemResult,
+    TransactionBulkStatusRequest,
+    TransactionBulkStatusResponse,
     TransactionCreateRequest,
     TransactionDetailResponse,
+    TransactionImportResponse,
     TransactionListItem,
     TransactionListResponse,
+    TransactionSummaryItem,
+    TransactionSummaryResponse,
     TransactionUpdateRequest,
 )
+from app.services.idempotency import IdempotencyService, request_fingerprint
 from app.services.transaction_service import TransactionService
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
@@ -22,7 +56,7 @@ router = APIRouter(prefix="/transactions", tags=["transactions"])
 # -----------------------------
 # Dependency: TransactionService
 # -----------------------------
-def get_transaction_service(db: Session = Depends(get_db)) -> TransactionService:  # noqa: B008
+def build_transaction_service(db: Session) -> TransactionService:
     return TransactionService(
         tx_repo=TransactionRepository(db),
         contractor_repo=ContractorRepository(db),
@@ -31,79 +65,393 @@ def get_transaction_service(db: Session = Depends(get_db)) -> TransactionService
     )
 
 
+def build_idempotency_service(db: Session) -> IdempotencyService:
+    return IdempotencyService(IdempotencyRepository(db))
+
+
 # -----------------------------
 # Create transaction
 # -----------------------------
 @router.post("/create", response_model=TransactionDetailResponse)
-def create_transaction(
+async def create_transaction(
     request: TransactionCreateRequest,
-    service: TransactionService = Depends(get_transaction_service),  # noqa: B008
+    runner: SessionRunner = Depends(get_session_runner),  # noqa: B008
+    user_id: int = Depends(get_current_user),
+    idempotency_key: str | None = Header(None, min_length=1, max_length=255),
+):
+    # (key, request hash) when the client made the request idempotent
+    claim: tuple[str, str] | None = None
+    if idempotency_key is not None:
+        claim = (idempotency_key, request_fingerprint(request.model_dump_json()))
+        record = await runner.run(
+            lambda db: build_idempotency_service(db).begin(user_id, *claim)
+        )
+        if record is not None:
+            return _replay(record, claim[1])
+
+    def create(db: Session) -> tuple[int, Any]:
+        service = build_transaction_service(db)
+        try:
+            tx = service.create_transaction(
+                user_id=user_id,
+                contractor_from_id=request.contractor_from_id,
+                contractor_to_id=request.contractor_to_id,
+                amount=request.amount,
+                status_id=request.status_id,
+                transaction_type_id=request.transaction_type_id,
+                # Committed together with the stored response
+                commit=claim is None,
+            )
+        except ValueError as e:
+            # Rejected before anything was written; a retry would fail the
+            # same way, so the error is stored like a response
+            return 400, {"detail": str(e)}
+        detail = service.present_transaction(tx)
+        return 200, jsonable_encoder(TransactionDetailResponse(**detail))  # type: ignore[arg-type]
+
+    if claim is None:
+        status_code, body = await runner.run(create)
+    else:
+        key, request_hash = claim
+        status_code, body = await runner.run(
+            lambda db: build_idempotency_service(db).complete(
+                user_id, key, request_hash, lambda: create(db)
+            )
+        )
+
+    if status_code != 200:
+        raise HTTPException(status_code=status_code, detail=body["detail"])
+    return body
+
+
+def _replay(record: IdempotencyRecord, request_hash: str) -> JSONResponse:
+    if record.request_hash != request_hash:
+        raise HTTPException(
+            status_code=422,
+            detail="Idempotency-Key was already used for a different request.",
+        )
+    if record.status_code is None:
+        raise HTTPException(
+            status_code=409,
+            detail="A request with this Idempotency-Key is still in progress.",
+        )
+    return JSONResponse(
+        record.response,
+        status_code=record.status_code,
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+# -----------------------------
+# Bulk create transactions
+# -----------------------------
+@router.post("/bulk", response_model=TransactionBulkCreateResponse)
+async def create_transactions_bulk(
+    request: TransactionBulkCreateRequest,
+    runner: SessionRunner = Depends(get_session_runner),  # noqa: B008
     user_id: int = Depends(get_current_user),
+):
+    items = [item.model_dump() for item in request.items]
+    results = await runner.run(
+        lambda db: build_transaction_service(db).create_transactions(
+            user_id=user_id, items=items, atomic=request.atomic
+        )
+    )
+
+    created = sum(1 for r in results if r["transaction_id"] is not None)
+    failed = sum(1 for r in results if r["error"] is not None)
+    return TransactionBulkCreateResponse(
+        created=created,
+        failed=failed,
+        results=[TransactionBulkItemResult(**r) for r in results],
+    )
+
+
+# -----------------------------
+# Import transactions (CSV via COPY)
+# -----------------------------
+@router.post("/import", response_model=TransactionImportResponse)
+def import_transactions(
+    file: UploadFile,
+    user_id: int = Depends(get_current_user),
+    db: Session = Depends(get_db),  # noqa: B008
 ):
     try:
-        tx = service.create_transaction(
-            user_id=user_id,
-            contractor_from_id=request.contractor_from_id,
-            contractor_to_id=request.contractor_to_id,
-            amount=request.amount,
-            status_id=request.status_id,
-            transaction_type_id=request.transaction_type_id,
+        summary = build_transaction_service(db).import_transactions(
+            user_id=user_id, stream=file.file
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
-    detail = service.get_transaction_detail(tx.transaction_id)
-    return TransactionDetailResponse(**detail)  # type: ignore[arg-type]
+    return TransactionImportResponse(**summary)
+
+
+# -----------------------------
+# Bulk status transition
+# -----------------------------
+@router.patch("/status", response_model=TransactionBulkStatusResponse)
+async def set_transactions_status(
+    request: TransactionBulkStatusRequest,
+    runner: SessionRunner = Depends(get_session_runner),  # noqa: B008
+    user_id: int = Depends(get_current_user),
+):
+    filters = None
+    if request.filter is not None:
+        f = request.filter
+        filters = TransactionFilter(
+            **f.model_dump(exclude={"status_ids", "transaction_type_ids"}),
+            status_ids=tuple(f.status_ids),
+            transaction_type_ids=tuple(f.transaction_type_ids),
+        )
+
+    try:
+        result = await runner.run(
+            lambda db: build_transaction_service(db).set_status_bulk(
+                user_id=user_id,
+                status_id=request.status_id,
+                tx_ids=request.ids,
+                filters=filters,
+                max_rows=MAX_BULK_STATUS_IDS,
+            )
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return TransactionBulkStatusResponse(**result)
 
 
 # -----------------------------
 # Update transaction
 # -----------------------------
 @router.patch("/{tx_id}", response_model=TransactionDetailResponse)
-def update_transaction(
+async def update_transaction(
     tx_id: int,
     updates: TransactionUpdateRequest,
-    service: TransactionService = Depends(get_transaction_service),  # noqa: B008
+    runner: SessionRunner = Depends(get_session_runner),  # noqa: B008
     user_id: int = Depends(get_current_user),
 ):
-    try:
-        # Convert Pydantic → dict (exclude_unset ensures partial updates)
-        updates_dict = updates.dict(exclude_unset=True)
+    # Convert Pydantic → dict (exclude_unset ensures partial updates)
+    updates_dict = updates.dict(exclude_unset=True)
 
-        service.update_transaction(
-            user_id=user_id,
-            tx_id=tx_id,
-            updates=updates_dict,
+    try:
+        detail = await runner.run(
+            lambda db: build_transaction_service(db).update_transaction(
+                user_id=user_id,
+                tx_id=tx_id,
+                updates=updates_dict,
+            )
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
-    detail = service.get_transaction_detail(tx_id)
-    return TransactionDetailResponse(**detail)  # type: ignore[arg-type]
+    return TransactionDetailResponse(**detail)
 
 
 # -----------------------------
 # List recent transactions
 # -----------------------------
 @router.get("/recent", response_model=TransactionListResponse)
-def list_recent_transactions(
-    limit: int = 50,
+async def list_recent_transactions(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    user_id: int = Depends(get_current_user),
+    runner: SessionRunner = Depends(get_session_runner),  # noqa: B008
+):
+    def load(db: Session) -> tuple[str, datetime | None, tuple | None]:
+        service = build_transaction_service(db)
+        version, last_modified = service.get_recent_version(
+            user_id=user_id, limit=limit, cursor=cursor
+        )
+        etag = make_etag(version)
+        if is_not_modified(request, etag, last_modified):
+            return etag, last_modified, None
+        page = service.list_recent_transactions(
+            user_id=user_id, limit=limit, cursor=cursor
+        )
+        return etag, last_modified, page
+
+    try:
+        etag, last_modified, page = await runner.run(load)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    if page is None:
+        return not_modified(etag, last_modified)
+
+    set_validators(response, etag, last_modified)
+    items, next_cursor = page
+    return TransactionListResponse(
+        items=[TransactionListItem(**i) for i in items],
+        next_cursor=next_cursor,
+    )
+
+
+# -----------------------------
+# Search transactions
+# -----------------------------
+@router.get("/search", response_model=TransactionListResponse)
+async def search_transactions(
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    amount_min: Decimal | None = None,
+    amount_max: Decimal | None = None,
+    status_id: list[int] = Query([]),  # noqa: B008
+    transaction_type_id: list[int] = Query([]),  # noqa: B008
+    contractor_from_id: int | None = None,
+    contractor_to_id: int | None = None,
+    contractor_name: str | None = Query(None, min_length=1, max_length=100),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    user_id: int = Depends(get_current_user),
+    runner: SessionRunner = Depends(get_session_runner),  # noqa: B008
+):
+    filters = TransactionFilter(
+        created_from=created_from,
+        created_to=created_to,
+        amount_min=amount_min,
+        amount_max=amount_max,
+        status_ids=tuple(status_id),
+        transaction_type_ids=tuple(transaction_type_id),
+        contractor_from_id=contractor_from_id,
+        contractor_to_id=contractor_to_id,
+        contractor_name=contractor_name,
+    )
+    try:
+        items, next_cursor = await runner.run(
+            lambda db: build_transaction_service(db).search_transactions(
+                user_id=user_id, filters=filters, limit=limit, cursor=cursor
+            )
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return TransactionListResponse(
+        items=[TransactionListItem(**i) for i in items],
+        next_cursor=next_cursor,
+    )
+
+
+# -----------------------------
+# Summary (rollups)
+# -----------------------------
+@router.get("/summary", response_model=TransactionSummaryResponse)
+async def get_transaction_summary(
+    lang: str = "en",
     user_id: int = Depends(get_current_user),
-    service: TransactionService = Depends(get_transaction_service),  # noqa: B008
+    runner: SessionRunner = Depends(get_session_runner),  # noqa: B008
 ):
-    items = service.list_recent_transactions(user_id=user_id, limit=limit)
-    return TransactionListResponse(items=[TransactionListItem(**i) for i in items])
+    items = await runner.run(
+        lambda db: build_transaction_service(db).get_summary(user_id, lang)
+    )
+    return TransactionSummaryResponse(
+        items=[TransactionSummaryItem(**i) for i in items]
+    )
+
+
+# -----------------------------
+# Export transactions (streaming)
+# -----------------------------
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+@router.get("/export")
+def export_transactions(
+    fmt: Literal["csv", "ndjson"] = Query("csv", alias="format"),
+    user_id: int = Depends(get_current_user),
+    db: Session = Depends(get_db),  # noqa: B008
+):
+    # Sync on purpose: the body is produced lazily from a server-side cursor
+    # on this request's session, which stays open until streaming finishes.
+    chunks = build_transaction_service(db).export_transactions(
+        user_id=user_id, fmt=fmt, chunk_size=settings.EXPORT_CHUNK_SIZE
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="transactions.{fmt}"'},
+    )
+
+
+# -----------------------------
+# Get many transaction details
+# -----------------------------
+async def _batch_details(
+    ids: list[int], user_id: int, runner: SessionRunner
+) -> TransactionBatchDetailResponse:
+    details = await runner.run(
+        lambda db: build_transaction_service(db).get_transaction_details(
+            user_id=user_id, tx_ids=ids
+        )
+    )
+    return TransactionBatchDetailResponse(
+        items=[
+            TransactionBatchDetailItem(
+                transaction_id=tx_id,
+                transaction=TransactionDetailResponse(**detail) if detail else None,
+                error=None if detail else "Transaction not found.",
+            )
+            for tx_id, detail in zip(ids, details, strict=True)
+        ]
+    )
+
+
+@router.get("", response_model=TransactionBatchDetailResponse)
+async def get_transaction_details(
+    ids: str = Query(..., description="Comma-separated transaction IDs"),
+    user_id: int = Depends(get_current_user),
+    runner: SessionRunner = Depends(get_session_runner),  # noqa: B008
+):
+    try:
+        tx_ids = [int(i) for i in ids.split(",") if i.strip()]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid transaction ID.") from e
+    if not 1 <= len(tx_ids) <= MAX_BATCH_DETAIL_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Request between 1 and {MAX_BATCH_DETAIL_IDS} transactions.",
+        )
+
+    return await _batch_details(tx_ids, user_id, runner)
+
+
+@router.post("/batch", response_model=TransactionBatchDetailResponse)
+async def get_transaction_details_batch(
+    request: TransactionBatchDetailRequest,
+    user_id: int = Depends(get_current_user),
+    runner: SessionRunner = Depends(get_session_runner),  # noqa: B008
+):
+    return await _batch_details(request.ids, user_id, runner)
 
 
 # -----------------------------
 # Get transaction detail
 # -----------------------------
 @router.get("/{tx_id}", response_model=TransactionDetailResponse)
-def get_transaction_detail(
+async def get_transaction_detail(
     tx_id: int,
-    service: TransactionService = Depends(get_transaction_service),  # noqa: B008
+    request: Request,
+    response: Response,
+    runner: SessionRunner = Depends(get_session_runner),  # noqa: B008
 ):
-    detail = service.get_transaction_detail(tx_id)
-    if detail is None:
+    def load(db: Session) -> tuple[str, datetime, dict | None] | None:
+        service = build_transaction_service(db)
+        version = service.get_transaction_version(tx_id)
+        if version is None:
+            return None
+        etag = make_etag(version[0])
+        if is_not_modified(request, etag, version[1]):
+            return etag, version[1], None
+        return etag, version[1], service.get_transaction_detail(tx_id)
+
+    result = await runner.run(load)
+    if result is None:
         raise HTTPException(status_code=404, detail="Transaction not found")
+
+    etag, last_modified, detail = result
+    if detail is None:
+        return not_modified(etag, last_modified)
+
+    set_validators(response, etag, last_modified)
     return TransactionDetailResponse(**detail)
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
+from app.api.conditional import is_not_modified, make_etag, not_modified, set_validators
 from app.db.session import get_db
 from app.repositories.transaction_type_repo import TransactionTypeRepository
 from app.schemas.transaction_type import TransactionTypeResponse
@@ -17,10 +18,17 @@ def get_transaction_type_service(
 
 @router.get("/", response_model=list[TransactionTypeResponse])
 def get_transaction_types(
+    request: Request,
+    response: Response,
     service: TransactionTypeService = Depends(get_transaction_type_service),  # noqa: B008
     lang: str = "en",
 ):
+    etag = make_etag(f"transaction-types:{lang}:{service.get_version()}")
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
     options = service.get_all_options(lang)
+    set_validators(response, etag)
     return [
         TransactionTypeResponse(
             transaction_type_id=opt.type_id,
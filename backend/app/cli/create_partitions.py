@@ -0,0 +1,72 @@
+"""
+Create monthly partitions of the transactions table ahead of time.
+
+Usage::
+
+    python -m app.cli.create_partitions [--months-ahead 3] [--from 2025-01]
+        [--from-default] [--test-db]
+
+Creates the partitions from the current month (or ``--from``) through
+``--months-ahead`` months later. Existing partitions are left alone, so the
+command is meant to run daily from cron. ``--from-default`` additionally
+creates a partition for every month with rows in the default partition and
+moves those rows into it.
+"""
+
+import argparse
+import sys
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config.settings import settings
+from app.db.partitions import ensure_monthly_partitions, month_starts, months_in_default
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--months-ahead", type=int, default=3)
+    parser.add_argument(
+        "--from",
+        dest="first",
+        type=lambda v: date.fromisoformat(f"{v}-01"),
+        default=date.today(),
+        help="first month (YYYY-MM), default the current one",
+    )
+    parser.add_argument(
+        "--from-default",
+        action="store_true",
+        help="also create partitions for rows in the default partition",
+    )
+    parser.add_argument(
+        "--test-db",
+        action="store_true",
+        help="target DATABASE_TEST_URL instead of DATABASE_URL",
+    )
+    args = parser.parse_args(argv)
+
+    if args.months_ahead < 0:
+        parser.error("--months-ahead must not be negative")
+
+    url = settings.DATABASE_TEST_URL if args.test_db else settings.DATABASE_URL
+    engine = create_engine(url)
+    db = sessionmaker(autoflush=False, bind=engine)()
+
+    try:
+        months = month_starts(args.first, args.months_ahead + 1)
+        if args.from_default:
+            months = sorted(set(months) | set(months_in_default(db)))
+        created = ensure_monthly_partitions(db, months)
+    finally:
+        db.close()
+        engine.dispose()
+
+    for month in created:
+        print(f"created transactions_{month:%Y_%m}")
+    print(f"{len(created)} partition(s) created.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""
+Generate synthetic users, contractors and transactions for scale testing.
+
+Usage::
+
+    python -m app.cli.generate_data --users 1000 --contractors 20 \\
+        --transactions 10000000 [--seed 42] [--test-db]
+
+Transactions are spread over users and contractors with power-law (Zipf)
+weights, so a few users own most of the data and every user has a handful
+of busy contractors. ``created_at`` is spread uniformly over ``--days``
+before ``--end``. Amounts are log-normally distributed.
+
+All rows are streamed through COPY, so millions of rows load in minutes.
+For a given seed and arguments the generated data is identical; only the
+serial ids depend on what the database already holds. Rollups of the
+generated users are filled in the same transaction.
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import time
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config.settings import settings
+from app.core.security import hash_password
+from app.repositories.rollup_repo import ROLLUP_UPSERT_SQL
+
+DEFAULT_END = "2025-01-01"
+
+
+class _IterFile:
+    """Read-only file object over an iterator of text lines, for COPY."""
+
+    def __init__(self, lines: Iterable[str]):
+        self._lines = iter(lines)
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = "".join(itertools.islice(self._lines, 1000))
+            if not chunk:
+                break
+            self._buffer += chunk.encode()
+
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _copy(db: Session, table: str, columns: str, lines: Iterable[str]) -> None:
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT text)",
+            _IterFile(lines),
+        )
+    finally:
+        cursor.close()
+
+
+def zipf_cum_weights(n: int, exponent: float) -> list[float]:
+    """Cumulative weights of ranks 1..n under a Zipf law."""
+    return list(itertools.accumulate(1 / rank**exponent for rank in range(1, n + 1)))
+
+
+def _pick(rng: random.Random, cum_weights: list[float]) -> int:
+    return bisect_left(cum_weights, rng.random() * cum_weights[-1])
+
+
+def transaction_lines(
+    rng: random.Random,
+    count: int,
+    user_ids: list[int],
+    contractors_by_user: dict[int, list[int]],
+    status_ids: list[int],
+    type_ids: list[int],
+    end: datetime,
+    days: int,
+    user_skew: float,
+    contractor_skew: float,
+) -> Iterator[str]:
+    """Yield ``count`` COPY text lines for the transactions table."""
+    # Shuffle ranks so the heavy users are not simply the lowest ids
+    ranked_users = user_ids[:]
+    rng.shuffle(ranked_users)
+    user_weights = zipf_cum_weights(len(ranked_users), user_skew)
+    contractor_weights = zipf_cum_weights(
+        len(next(iter(contractors_by_user.values()))), contractor_skew
+    )
+    span = days * 86400
+
+    for _ in range(count):
+        user_id = ranked_users[_pick(rng, user_weights)]
+        contractors = contractors_by_user[user_id]
+        sender = _pick(rng, contractor_weights)
+        receiver = _pick(rng, contractor_weights)
+        if receiver == sender:
+            receiver = (receiver + 1) % len(contractors)
+
+        created_at = end - timedelta(seconds=rng.random() * span)
+        amount = min(rng.lognormvariate(4.0, 1.2), 9_999_999_999.99)
+        yield (
+            f"{user_id}\t{contractors[sender]}\t{contractors[receiver]}\t"
+            f"{amount:.2f}\t{rng.choice(type_ids)}\t{rng.choice(status_ids)}\t"
+            f"{created_at.isoformat()}\t{created_at.isoformat()}\n"
+        )
+
+
+def generate(db: Session, args: argparse.Namespace) -> dict[str, Any]:
+    """Load the synthetic data set and return the generated user ids."""
+    rng = random.Random(args.seed)
+    end = datetime.fromisoformat(args.end)
+
+    status_ids = db.execute(
+        text("SELECT status_id FROM transaction_statuses")
+    ).scalars()
+    type_ids = db.execute(
+        text("SELECT transaction_type_id FROM transaction_types")
+    ).scalars()
+    statuses, types = sorted(status_ids), sorted(type_ids)
+    if not statuses or not types:
+        raise ValueError("Load statuses and transaction types first.")
+
+    taken = db.execute(
+        text("SELECT count(*) FROM users WHERE username LIKE :p"),
+        {"p": f"{args.prefix}\\_%"},
+    ).scalar_one()
+    if taken:
+        raise ValueError(f"Users with prefix '{args.prefix}_' already exist.")
+
+    password_hash = hash_password(args.password)
+    _copy(
+        db,
+        "users",
+        "username, password_hash",
+        (f"{args.prefix}_{i:07d}\t{password_hash}\n" for i in range(args.users)),
+    )
+    user_ids = list(
+        db.execute(
+            text("SELECT user_id FROM users WHERE username LIKE :p ORDER BY username"),
+            {"p": f"{args.prefix}\\_%"},
+        ).scalars()
+    )
+
+    _copy(
+        db,
+        "contractors",
+        "user_id, name",
+        (
+            f"{user_id}\tContractor {i:04d}\n"
+            for user_id in user_ids
+            for i in range(args.contractors)
+        ),
+    )
+    contractors_by_user: dict[int, list[int]] = {user_id: [] for user_id in user_ids}
+    for user_id, contractor_id in db.execute(
+        text("""
+        SELECT user_id, contractor_id FROM contractors
+        WHERE user_id = ANY(:uids)
+        ORDER BY user_id, name
+    """),
+        {"uids": user_ids},
+    ):
+        contractors_by_user[user_id].append(contractor_id)
+
+    _copy(
+        db,
+        "transactions",
+        "user_id, contractor_from_id, contractor_to_id, amount, "
+        "transaction_type_id, status_id, created_at, updated_at",
+        transaction_lines(
+            rng,
+            args.transactions,
+            user_ids,
+            contractors_by_user,
+            statuses,
+            types,
+            end,
+            args.days,
+            args.user_skew,
+            args.contractor_skew,
+        ),
+    )
+
+    # The generated users are new, so their rollups can simply be added
+    db.execute(
+        text(
+            ROLLUP_UPSERT_SQL.format(
+                source="(SELECT * FROM transactions WHERE user_id = ANY(:uids))"
+            )
+        ),
+        {"uids": user_ids},
+    )
+    db.commit()
+    return {"user_ids": user_ids}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--contractors", type=int, default=20, help="per user")
+    parser.add_argument("--transactions", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--prefix", default="gen", help="username prefix")
+    parser.add_argument("--password", default="password", help="for every user")
+    parser.add_argument(
+        "--user-skew",
+        type=float,
+        default=1.1,
+        help="Zipf exponent of transactions per user",
+    )
+    parser.add_argument(
+        "--contractor-skew",
+        type=float,
+        default=1.2,
+        help="Zipf exponent of transactions per contractor",
+    )
+    parser.add_argument("--days", type=int, default=365, help="created_at spread")
+    parser.add_argument(
+        "--end", default=DEFAULT_END, help="latest created_at (ISO date)"
+    )
+    parser.add_argument(
+        "--test-db",
+        action="store_true",
+        help="target DATABASE_TEST_URL instead of DATABASE_URL",
+    )
+    args = parser.parse_args(argv)
+
+    if args.users < 1 or args.contractors < 2:
+        parser.error("need at least one user and two contractors per user")
+
+    url = settings.DATABASE_TEST_URL if args.test_db else settings.DATABASE_URL
+    engine = create_engine(url)
+    db = sessionmaker(autoflush=False, bind=engine)()
+
+    started = time.perf_counter()
+    try:
+        generate(db, args)
+        db.execute(text("ANALYZE"))
+        db.commit()
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    finally:
+        db.close()
+        engine.dispose()
+
+    print(
+        f"users: {args.users}  contractors: {args.users * args.contractors}  "
+        f"transactions: {args.transactions}  "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
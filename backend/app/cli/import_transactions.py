@@ -0,0 +1,70 @@
+"""
+Import a CSV ledger for one user through the COPY pipeline.
+
+Usage::
+
+    python -m app.cli.import_transactions --user-id 1 ledger.csv
+
+The CSV header must be
+``contractor_from,contractor_to,amount,status,transaction_type,created_at``.
+Contractors are matched by name and created when missing. Rejected rows are
+printed with their reasons; the exit status is 1 if any row was rejected.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.transaction_router import build_transaction_service
+from app.core.config.settings import settings
+from app.repositories.user_repo import UserRepository
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("csv_file", type=Path)
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument(
+        "--test-db",
+        action="store_true",
+        help="target DATABASE_TEST_URL instead of DATABASE_URL",
+    )
+    parser.add_argument("--max-errors", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    url = settings.DATABASE_TEST_URL if args.test_db else settings.DATABASE_URL
+    engine = create_engine(url)
+    db = sessionmaker(autoflush=False, bind=engine)()
+
+    try:
+        if not UserRepository(db).exists(args.user_id):
+            print(f"User {args.user_id} does not exist.", file=sys.stderr)
+            return 2
+
+        with args.csv_file.open("rb") as stream:
+            summary = build_transaction_service(db).import_transactions(
+                user_id=args.user_id, stream=stream, max_reported=args.max_errors
+            )
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    finally:
+        db.close()
+        engine.dispose()
+
+    print(
+        f"rows: {summary['total']}  imported: {summary['imported']}  "
+        f"contractors created: {summary['contractors_created']}  "
+        f"rejected: {summary['rejected']}"
+    )
+    for error in summary["errors"]:
+        print(f"  row {error['row']}: {error['reason']}")
+
+    return 1 if summary["rejected"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
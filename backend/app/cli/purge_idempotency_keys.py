@@ -0,0 +1,50 @@
+"""
+Delete expired idempotency keys.
+
+Usage::
+
+    python -m app.cli.purge_idempotency_keys [--ttl-seconds 86400] [--test-db]
+
+Keys older than ``--ttl-seconds`` (default ``IDEMPOTENCY_TTL_SECONDS``) no
+longer replay their response, so they can go. Meant to run from cron, e.g.
+hourly.
+"""
+
+import argparse
+import sys
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config.settings import settings
+from app.repositories.idempotency_repo import IdempotencyRepository
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--ttl-seconds", type=int, default=settings.IDEMPOTENCY_TTL_SECONDS
+    )
+    parser.add_argument(
+        "--test-db",
+        action="store_true",
+        help="target DATABASE_TEST_URL instead of DATABASE_URL",
+    )
+    args = parser.parse_args(argv)
+
+    url = settings.DATABASE_TEST_URL if args.test_db else settings.DATABASE_URL
+    engine = create_engine(url)
+    db = sessionmaker(autoflush=False, bind=engine)()
+
+    try:
+        deleted = IdempotencyRepository(db).purge_expired(args.ttl_seconds)
+    finally:
+        db.close()
+        engine.dispose()
+
+    print(f"{deleted} expired idempotency key(s) deleted.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Recompute the transaction rollups from scratch and report drift.
+
+Usage::
+
+    python -m app.cli.rebuild_rollups [--user-id 1] [--dry-run]
+
+Every bucket whose stored count or total differs from the recomputed value
+is printed. The exit status is 1 if any drift was found.
+"""
+
+import argparse
+import sys
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config.settings import settings
+from app.repositories.rollup_repo import TransactionRollupRepository
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--user-id", type=int, help="limit to one user")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="only report drift, keep the stored rollups",
+    )
+    parser.add_argument(
+        "--test-db",
+        action="store_true",
+        help="target DATABASE_TEST_URL instead of DATABASE_URL",
+    )
+    args = parser.parse_args(argv)
+
+    url = settings.DATABASE_TEST_URL if args.test_db else settings.DATABASE_URL
+    engine = create_engine(url)
+    db = sessionmaker(autoflush=False, bind=engine)()
+
+    try:
+        drift = TransactionRollupRepository(db).rebuild(
+            user_id=args.user_id, dry_run=args.dry_run
+        )
+    finally:
+        db.close()
+        engine.dispose()
+
+    for d in drift:
+        print(
+            f"user {d['user_id']} contractor {d['contractor_id']} "
+            f"{d['direction']} status {d['status_id']} "
+            f"type {d['transaction_type_id']}: "
+            f"count {d['stored_count']} -> {d['actual_count']}, "
+            f"total {d['stored_amount']} -> {d['actual_amount']}"
+        )
+    action = "found" if args.dry_run else "fixed"
+    print(f"{len(drift)} drifted bucket(s) {action}.")
+
+    return 1 if drift else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
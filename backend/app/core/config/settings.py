@@ -7,6 +7,32 @@ class Settings(BaseSettings):
     # -------------------------
     DATABASE_URL: str
     DATABASE_TEST_URL: str
+    DATABASE_ASYNC: bool = False  # serve async routers through asyncpg
+    # Read replicas as a JSON list, e.g. '["postgresql+psycopg2://...replica"]'.
+    # A second database on the same server can stand in locally.
+    DATABASE_REPLICA_URLS: list[str] = []
+
+    # -------------------------
+    # Connection pool
+    # -------------------------
+    # Keep workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below the server's
+    # max_connections (50 in db/config/postgres.conf).
+    DB_ECHO: bool = True
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds; -1 disables recycling
+    DB_POOL_PRE_PING: bool = True
+    DB_PGBOUNCER: bool = False  # disable statement caching behind PgBouncer
+
+    # -------------------------
+    # Observability
+    # -------------------------
+    SQL_QUERY_WARN_THRESHOLD: int = 20  # warn above N statements per request; 0 off
+    SLOW_QUERY_CAPTURE: bool = False  # record slow statements (app.db.slow_queries)
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1  # share re-run under EXPLAIN ANALYZE
+    SLOW_QUERY_BUFFER_SIZE: int = 200  # most recent slow queries kept per worker
 
     # -------------------------
     # JWT / Security
@@ -14,6 +40,30 @@ class Settings(BaseSettings):
     JWT_SECRET: str = "supersecret"  # override in .env
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_HOURS: int = 12  # token lifetime
+    ADMIN_USER_IDS: list[int] = []  # users allowed on /admin endpoints
+    BCRYPT_ROUNDS: int = 12  # raising it rehashes passwords on next login
+    # Processes dedicated to bcrypt on login (also the hashing concurrency
+    # limit); 0 hashes in the request threadpool instead.
+    PASSWORD_HASH_WORKERS: int = 2
+
+    # -------------------------
+    # Caching
+    # -------------------------
+    REFERENCE_CACHE_TTL_SECONDS: int = 300  # statuses / transaction types
+    TOKEN_CACHE_SIZE: int = 10_000  # verified JWTs kept in memory; 0 disables
+
+    # -------------------------
+    # Idempotency keys
+    # -------------------------
+    IDEMPOTENCY_TTL_SECONDS: int = 86_400  # how long a key replays its response
+    # How long an unfinished claim blocks retries; must outlast the worker timeout
+    IDEMPOTENCY_LOCK_SECONDS: int = 60
+    IDEMPOTENCY_CACHE_SIZE: int = 10_000  # responses kept in memory; 0 disables
+
+    # -------------------------
+    # Export
+    # -------------------------
+    EXPORT_CHUNK_SIZE: int = 1000  # rows fetched per server-side cursor batch
 
     class Config:
         env_file = ".env"
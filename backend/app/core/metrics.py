@@ -0,0 +1,103 @@
+"""
+Prometheus metrics.
+
+Request latency is recorded per route template, method and status code.
+In-flight requests and connection pool state are exported as gauges, cache
+lookups as a counter. Password hashing time has its own histogram.
+
+With several workers, run them under gunicorn with ``gunicorn.conf.py`` and
+point ``PROMETHEUS_MULTIPROC_DIR`` at an empty directory shared by all
+workers (and wiped on every deploy). ``prometheus_client`` then keeps its
+values in per-process files, and ``render_metrics`` aggregates them, so any
+worker can answer a scrape: histograms and counters are summed, and gauges
+are summed over the live processes. The config's ``child_exit`` hook marks
+exited workers dead, so their gauges drop out of that sum.
+"""
+
+import os
+from typing import Any
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template, method and status code.",
+    ["method", "route", "status"],
+    buckets=(
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.075,
+        0.1,
+        0.25,
+        0.5,
+        0.75,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    ),
+)
+
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+PASSWORD_VERIFY_DURATION = Histogram(
+    "password_verify_duration_seconds",
+    "Time to verify (and possibly rehash) a password on login, including "
+    "the wait for a free hashing worker.",
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0, 10.0),
+)
+
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Database pool connections by engine and state.",
+    ["engine", "state"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKOUTS = Gauge(
+    "db_pool_checkouts",
+    "Cumulative pool checkouts and checkout timeouts by engine.",
+    ["engine", "kind"],
+    multiprocess_mode="livesum",
+)
+
+CACHE_LOOKUPS = Counter(
+    "app_cache_lookups",
+    "In-process cache lookups by cache and result (hit / miss).",
+    ["cache", "result"],
+)
+
+
+def observe_pool(name: str, status: dict[str, Any]) -> None:
+    """Publish a ``pool_status`` snapshot under the given engine name."""
+    for state in ("checked_out", "checked_in", "overflow"):
+        if state in status:
+            DB_POOL_CONNECTIONS.labels(name, state).set(status[state])
+    if "checkouts" in status:
+        DB_POOL_CHECKOUTS.labels(name, "checkout").set(status["checkouts"])
+        DB_POOL_CHECKOUTS.labels(name, "timeout").set(status["checkout_timeouts"])
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Return the exposition body and its content type."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,149 @@
+"""
+HTTP middleware.
+
+``QueryTimingMiddleware`` wraps every HTTP request in ``track_queries``
+and reports the number of SQL statements, the database time and the total
+time spent in the app. The figures go into a ``Server-Timing`` response
+header and a structured log line tagged with the route template. A warning
+is logged when a request issues more than ``SQL_QUERY_WARN_THRESHOLD``
+statements, which is how N+1 query patterns show up.
+
+``MetricsMiddleware`` feeds the Prometheus request histogram and in-flight
+gauge (see ``app.core.metrics``).
+"""
+
+import json
+import logging
+import time
+from collections.abc import Callable
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config.settings import settings
+from app.core.metrics import REQUEST_DURATION, REQUESTS_IN_PROGRESS
+from app.db.instrumentation import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Return the matched route's path template.
+
+    Requests that match no route (404s, scanners) all share one label, so
+    arbitrary paths cannot grow the metric series without bound.
+    """
+    route = scope.get("route")
+    path: str = getattr(route, "path", None) or UNMATCHED_ROUTE
+    return path
+
+
+class QueryTimingMiddleware:
+    """Pure ASGI middleware, so streaming responses are not buffered."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        with track_queries(route=lambda: route_template(scope)) as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    app_ms = (time.perf_counter() - start) * 1000
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f"db;dur={stats.db_seconds * 1000:.2f}, "
+                        f'db-count;desc="{stats.count}", '
+                        f"app;dur={app_ms:.2f}",
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log(scope, status_code, stats.count, stats.db_seconds, start)
+
+    @staticmethod
+    def _log(
+        scope: Scope, status_code: int, count: int, db_seconds: float, start: float
+    ) -> None:
+        route = route_template(scope)
+        record = {
+            "method": scope["method"],
+            "route": route,
+            "status": status_code,
+            "db_queries": count,
+            "db_ms": round(db_seconds * 1000, 2),
+            "app_ms": round((time.perf_counter() - start) * 1000, 2),
+        }
+        logger.info(json.dumps(record))
+
+        threshold = settings.SQL_QUERY_WARN_THRESHOLD
+        if threshold and count > threshold:
+            logger.warning(
+                json.dumps({**record, "warning": f"more than {threshold} queries"})
+            )
+
+
+class MetricsMiddleware:
+    """
+    Records request latency per route template and tracks in-flight requests.
+
+    ``on_request_end`` (at most once per ``refresh_interval`` seconds) lets
+    each worker publish process-local state such as pool and cache counters,
+    so a scrape answered by any worker sees every worker's values.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        on_request_end: Callable[[], None] | None = None,
+        refresh_interval: float = 1.0,
+    ):
+        self.app = app
+        self.on_request_end = on_request_end
+        self.refresh_interval = refresh_interval
+        self._last_refresh = 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(scope["method"])
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            end = time.perf_counter()
+            REQUEST_DURATION.labels(
+                scope["method"], route_template(scope), str(status_code)
+            ).observe(end - start)
+
+            if self.on_request_end and end - self._last_refresh > self.refresh_interval:
+                self._last_refresh = end
+                self.on_request_end()
@@ -1,14 +1,109 @@
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config.settings import settings
+from app.core.metrics import CACHE_LOOKUPS, PASSWORD_VERIFY_DURATION
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of tokens whose signature and claims were verified.
+
+    Entries are keyed by a SHA-256 of the token, hold ``(user_id, exp)`` and
+    are dropped once ``exp`` has passed. The whole cache is cleared when the
+    signing secret or algorithm changes, so a rotated secret takes effect
+    immediately.
+    """
+
+    def __init__(self, maxsize: int, name: str = "verified_token"):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._hit_counter = CACHE_LOOKUPS.labels(name, "hit")
+        self._miss_counter = CACHE_LOOKUPS.labels(name, "miss")
+        self._entries: OrderedDict[bytes, tuple[int, float]] = OrderedDict()
+        self._signing_key: tuple[str, str] | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def _check_signing_key(self) -> None:
+        signing_key = (settings.JWT_SECRET, settings.JWT_ALGORITHM)
+        if signing_key != self._signing_key:
+            self._entries.clear()
+            self._signing_key = signing_key
+
+    def get(self, token: str) -> int | None:
+        """Return the cached user id of a still-valid token, or None."""
+        key = self._key(token)
+        with self._lock:
+            self._check_signing_key()
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.time():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                self._miss_counter.inc()
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._hit_counter.inc()
+            return entry[0]
+
+    def put(self, token: str, user_id: int, exp: float) -> None:
+        """Remember a verified token until its ``exp`` (Unix timestamp)."""
+        if self.maxsize <= 0:
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._check_signing_key()
+            self._entries[key] = (user_id, exp)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+token_cache = VerifiedTokenCache(maxsize=settings.TOKEN_CACHE_SIZE)
+
+
 def get_current_user(token: str = Depends(oauth2_scheme)) -> int:
+    cached_user_id = token_cache.get(token)
+    if cached_user_id is not None:
+        return cached_user_id
+
     try:
         payload = jwt.decode(
             token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
@@ -16,13 +111,28 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> int:
         user_id = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid token")
-        return int(user_id)
     except JWTError as e:
         raise HTTPException(status_code=401, detail="Invalid token") from e
 
+    # Tokens without an expiry are never cached
+    exp = payload.get("exp")
+    if isinstance(exp, int | float):
+        token_cache.put(token, int(user_id), exp)
+    return int(user_id)
+
 
-# Passlib context for hashing + verifying
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+def require_admin(user_id: int = Depends(get_current_user)) -> int:
+    """Allow only the users listed in ``ADMIN_USER_IDS``."""
+    if user_id not in settings.ADMIN_USER_IDS:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return user_id
+
+
+# Passlib context for hashing + verifying. Hashes below BCRYPT_ROUNDS are
+# reported by ``needs_update`` and upgraded on the next successful login.
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 
 def verify_password(plain_password: str, password_hash: str) -> bool:
@@ -39,3 +149,64 @@ def hash_password(password: str) -> str:
     Returns the hashed password.
     """
     return pwd_context.hash(password)  # type: ignore[no-any-return]
+
+
+def verify_and_update_password(
+    plain_password: str, password_hash: str
+) -> tuple[bool, str | None]:
+    """
+    Verify a password and, if it matches but the hash uses outdated
+    settings (e.g. a lower bcrypt cost), return a fresh hash as well.
+
+    Returns ``(valid, new_hash)``; ``new_hash`` is None when no rehash is due.
+    """
+    return pwd_context.verify_and_update(plain_password, password_hash)  # type: ignore[no-any-return]
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop and off the request threadpool.
+
+    Work goes to a dedicated process pool of ``workers`` processes, which is
+    also the concurrency limit: extra logins wait for a free worker without
+    holding a request thread. With ``workers=0`` hashing falls back to the
+    request threadpool.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    async def verify_and_update(
+        self, plain_password: str, password_hash: str
+    ) -> tuple[bool, str | None]:
+        """Async version of ``verify_and_update_password``."""
+        with PASSWORD_VERIFY_DURATION.time():
+            if self.workers <= 0:
+                return await run_in_threadpool(
+                    verify_and_update_password, plain_password, password_hash
+                )
+
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(),
+                verify_and_update_password,
+                plain_password,
+                password_hash,
+            )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+password_hasher = PasswordHasher(workers=settings.PASSWORD_HASH_WORKERS)
@@ -0,0 +1,85 @@
+"""
+Per-request SQL statement counting and timing.
+
+``instrument_engine`` hooks ``before_cursor_execute`` /
+``after_cursor_execute`` on an engine. Statements executed while a
+``RequestQueryStats`` is active (see ``track_queries``) are counted and
+their time is added to it. The active stats live in a context variable,
+so they follow the request into Starlette's threadpool and into
+``AsyncSession.run_sync`` greenlets.
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_START_TIMES = "query_start_times"
+
+
+@dataclass
+class RequestQueryStats:
+    """Statements issued and database time spent on behalf of one request."""
+
+    count: int = 0
+    db_seconds: float = 0.0
+    # Resolves the route lazily; it is only known once routing has happened
+    route: Callable[[], str] | None = None
+
+
+_current_stats: ContextVar[RequestQueryStats | None] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+@contextmanager
+def track_queries(
+    route: Callable[[], str] | None = None,
+) -> Iterator[RequestQueryStats]:
+    """Collect statistics for all statements executed inside the block."""
+    stats = RequestQueryStats(route=route)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def current_route() -> str | None:
+    """Return the route of the request being served, if any."""
+    stats = _current_stats.get()
+    if stats is None or stats.route is None:
+        return None
+    return stats.route()
+
+
+def _before_cursor_execute(conn: Any, *_: Any) -> None:
+    conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, *_: Any) -> None:
+    elapsed = time.perf_counter() - conn.info[_START_TIMES].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.db_seconds += elapsed
+
+
+def _handle_error(context: Any) -> None:
+    # Failed statements never reach after_cursor_execute
+    conn = context.connection
+    if conn is not None and conn.info.get(_START_TIMES):
+        conn.info[_START_TIMES].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count and time the statements of every connection of ``engine``."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
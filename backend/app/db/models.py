@@ -1,6 +1,18 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, Text
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    Text,
+    event,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -99,8 +111,14 @@ class TransactionStatusTranslationORM(Base):  # type: ignore[valid-type,misc]
 # -------------------------
 class TransactionORM(Base):  # type: ignore[valid-type,misc]
     __tablename__ = "transactions"
-
-    transaction_id = Column(Integer, primary_key=True, index=True)
+    # Monthly partitions are created by app.cli.create_partitions
+    __table_args__ = {  # noqa: RUF012
+        "postgresql_partition_by": "RANGE (created_at)"
+    }
+
+    # created_at is part of the key so that ORM updates and deletes carry it
+    # and touch a single partition
+    transaction_id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False)
     contractor_from_id = Column(
         Integer, ForeignKey("contractors.contractor_id"), nullable=False
@@ -115,7 +133,9 @@ class TransactionORM(Base):  # type: ignore[valid-type,misc]
     status_id = Column(
         Integer, ForeignKey("transaction_statuses.status_id"), nullable=False
     )
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime, primary_key=True, default=datetime.utcnow, nullable=False
+    )
     updated_at = Column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
@@ -127,6 +147,51 @@ class TransactionORM(Base):  # type: ignore[valid-type,misc]
     transaction_type = relationship("TransactionTypeORM")
 
 
+# Without partitions a partitioned table accepts no rows. db/init/01_schema.sql
+# also creates the monthly ones; for metadata.create_all the default suffices.
+event.listen(
+    TransactionORM.__table__,
+    "after_create",
+    DDL("CREATE TABLE transactions_default PARTITION OF transactions DEFAULT"),
+)
+
+
+# -------------------------
+# Transaction Rollups
+# -------------------------
+class TransactionRollupORM(Base):  # type: ignore[valid-type,misc]
+    __tablename__ = "transaction_rollups"
+
+    user_id = Column(Integer, ForeignKey("users.user_id"), primary_key=True)
+    contractor_id = Column(
+        Integer, ForeignKey("contractors.contractor_id"), primary_key=True
+    )
+    direction = Column(Text, primary_key=True)  # "outgoing" | "incoming"
+    status_id = Column(
+        Integer, ForeignKey("transaction_statuses.status_id"), primary_key=True
+    )
+    transaction_type_id = Column(
+        Integer, ForeignKey("transaction_types.transaction_type_id"), primary_key=True
+    )
+    tx_count = Column(BigInteger, nullable=False, default=0)
+    total_amount = Column(Numeric(18, 2), nullable=False, default=0)
+
+
+# -------------------------
+# Idempotency Keys
+# -------------------------
+class IdempotencyKeyORM(Base):  # type: ignore[valid-type,misc]
+    __tablename__ = "idempotency_keys"
+
+    user_id = Column(Integer, ForeignKey("users.user_id"), primary_key=True)
+    idempotency_key = Column(Text, primary_key=True)
+    request_hash = Column(Text, nullable=False)
+    status_code = Column(Integer)  # NULL while the first request is in flight
+    response = Column(JSONB)
+    # Stamped by the database, the clock its expiry checks use
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+
 # -------------------------
 # Transaction Types
 # -------------------------
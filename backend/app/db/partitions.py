@@ -0,0 +1,53 @@
+"""
+Monthly range partitions of the ``transactions`` table.
+
+Partitions are named ``transactions_YYYY_MM`` and cover one calendar month
+of ``created_at``. Rows of a month without a partition land in
+``transactions_default``. The ``ensure_transaction_partition`` SQL function
+(see ``db/init/01_schema.sql``) creates one partition and moves that month's
+rows out of the default partition; the helpers below drive it.
+
+Moving rows detaches the default partition for a moment, which takes an
+exclusive lock on ``transactions``. Creating partitions ahead of time keeps
+the default partition empty, so the regular run only adds empty tables.
+"""
+
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+def month_starts(first: date, count: int) -> list[date]:
+    """First days of ``count`` consecutive months starting at ``first``'s."""
+    index = first.year * 12 + first.month - 1
+    return [date((index + i) // 12, (index + i) % 12 + 1, 1) for i in range(count)]
+
+
+def ensure_monthly_partitions(db: Session, months: list[date]) -> list[date]:
+    """
+    Create the partitions of the given months that do not exist yet.
+
+    Returns the months for which a partition was created. Each partition is
+    committed on its own, so a long run holds the table lock only briefly.
+    """
+    created = []
+    for month in months:
+        if db.execute(
+            text("SELECT ensure_transaction_partition(:month)"), {"month": month}
+        ).scalar_one():
+            created.append(month)
+        db.commit()
+    return created
+
+
+def months_in_default(db: Session) -> list[date]:
+    """Months that have rows parked in the default partition."""
+    rows = db.execute(
+        text("""
+        SELECT DISTINCT date_trunc('month', created_at)::DATE
+        FROM transactions_default
+        ORDER BY 1
+    """)
+    ).scalars()
+    return list(rows)
@@ -0,0 +1,128 @@
+"""
+Connection pool configuration and instrumentation.
+
+Pool sizing comes from ``Settings`` so workers can be sized against the
+server's ``max_connections``. The pool classes below extend SQLAlchemy's
+queue pools with checkout wait-time and timeout counters, which are exposed
+by the ``/health/pool`` endpoint.
+"""
+
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.core.config.settings import settings
+
+
+@dataclass
+class PoolStats:
+    """Cumulative checkout statistics for one pool."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout and counts checkout timeouts."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+        self._stats_lock = threading.Lock()
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()  # type: ignore[misc]
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self.stats.timeouts += 1
+            raise
+
+        waited = time.perf_counter() - start
+        with self._stats_lock:
+            self.stats.checkouts += 1
+            self.stats.total_wait_seconds += waited
+            self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, waited)
+        return conn
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(is_async: bool = False) -> dict[str, Any]:
+    """
+    Build ``create_engine`` / ``create_async_engine`` keyword arguments from
+    the pool settings.
+
+    In PgBouncer mode (transaction pooling) server-side prepared statements
+    cannot be reused across transactions, so asyncpg statement caching is
+    turned off and every prepared statement gets a unique name. The matching
+    dialect-level cache is disabled through the URL (see ``to_async_url``).
+    psycopg2 does not use server-side prepared statements.
+    """
+    options: dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+    if settings.DB_PGBOUNCER and is_async:
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+
+    return options
+
+
+def pool_status(engine: Engine) -> dict[str, Any]:
+    """
+    Return a snapshot of the engine's pool: size, checked-out connections,
+    overflow and cumulative checkout wait / timeout counters.
+    """
+    pool: Pool = engine.pool
+    status: dict[str, Any] = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout_seconds=pool.timeout(),
+        )
+
+    stats = getattr(pool, "stats", None)
+    if isinstance(stats, PoolStats):
+        status.update(
+            checkouts=stats.checkouts,
+            checkout_timeouts=stats.timeouts,
+            avg_wait_ms=round(
+                stats.total_wait_seconds / stats.checkouts * 1000
+                if stats.checkouts
+                else 0.0,
+                3,
+            ),
+            max_wait_ms=round(stats.max_wait_seconds * 1000, 3),
+        )
+
+    return status
@@ -0,0 +1,84 @@
+"""
+Primary/replica routing for SQLAlchemy sessions.
+
+``RoutingSession`` holds one writer engine and any number of reader engines.
+Statements run on the writer unless they are issued inside ``use_replica``
+(see ``app.repositories.base.read_only``) and outside ``use_primary``, which
+callers use for reads that must see the latest commits (validation before a
+write). Once a session has flushed or executed anything but a SELECT outside
+``use_replica`` (DML, raw SQL), it sticks to the writer for the rest of its
+life, so a request always reads its own writes.
+"""
+
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.selectable import Select
+
+_REPLICA_DEPTH = "replica_depth"
+_PRIMARY_DEPTH = "primary_depth"
+_WROTE = "wrote"
+
+
+class RoutingSession(Session):
+    """Session that sends replica-safe reads to reader engines."""
+
+    def __init__(
+        self,
+        *args: Any,
+        writer: Engine | None = None,
+        readers: list[Engine] | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.writer = writer
+        self.readers = readers or []
+
+    def get_bind(self, mapper=None, clause=None, **kw):  # type: ignore[no-untyped-def]
+        if self.writer is None:
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+        replica_scope = self.info.get(_REPLICA_DEPTH, 0) > 0
+        if self._flushing or not (replica_scope or isinstance(clause, Select)):
+            self.info[_WROTE] = True
+
+        if (
+            self.readers
+            and replica_scope
+            and not self.info.get(_PRIMARY_DEPTH, 0)
+            and not self.info.get(_WROTE)
+        ):
+            return random.choice(self.readers)
+
+        return self.writer
+
+
+@contextmanager
+def use_replica(session: Session) -> Iterator[None]:
+    """
+    Route reads issued inside the block to a replica, unless the session has
+    already written. Has no effect on sessions without readers.
+    """
+    session.info[_REPLICA_DEPTH] = session.info.get(_REPLICA_DEPTH, 0) + 1
+    try:
+        yield
+    finally:
+        session.info[_REPLICA_DEPTH] -= 1
+
+
+@contextmanager
+def use_primary(session: Session) -> Iterator[None]:
+    """
+    Route every read issued inside the block to the writer, including those
+    of ``use_replica`` blocks nested in it. Does not pin the session to the
+    writer afterwards.
+    """
+    session.info[_PRIMARY_DEPTH] = session.info.get(_PRIMARY_DEPTH, 0) + 1
+    try:
+        yield
+    finally:
+        session.info[_PRIMARY_DEPTH] -= 1
@@ -1,15 +1,39 @@
 # from contextvars import ContextVar
+from collections.abc import AsyncIterator, Callable
+from typing import Protocol, TypeVar
+
+from fastapi import Depends
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config.settings import settings
+from app.db.instrumentation import instrument_engine
+from app.db.pool import engine_options
+from app.db.routing import RoutingSession
+from app.db.slow_queries import capture_slow_queries
+
+T = TypeVar("T")
 
 DATABASE_URL = settings.DATABASE_URL
 DATABASE_TEST_URL = settings.DATABASE_TEST_URL
 
-engine = create_engine(DATABASE_URL, echo=True)
+engine = create_engine(DATABASE_URL, **engine_options())
+
+# Read replicas; reads marked read_only are routed here (see app.db.routing)
+replica_engines = [
+    create_engine(url, **engine_options()) for url in settings.DATABASE_REPLICA_URLS
+]
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    writer=engine,
+    readers=replica_engines,
+)
 
 Base = declarative_base()
 
@@ -20,3 +44,118 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# -------------------------
+# Async engine (opt-in via settings.DATABASE_ASYNC)
+# -------------------------
+def to_async_url(url: str) -> str:
+    """
+    Return the given database URL with its driver swapped for asyncpg.
+
+    In PgBouncer mode the dialect's prepared statement cache is disabled too.
+    """
+    async_url = make_url(url).set(drivername="postgresql+asyncpg")
+    if settings.DB_PGBOUNCER:
+        async_url = async_url.update_query_dict({"prepared_statement_cache_size": "0"})
+    return async_url.render_as_string(hide_password=False)
+
+
+async_engine = (
+    create_async_engine(to_async_url(DATABASE_URL), **engine_options(is_async=True))
+    if settings.DATABASE_ASYNC
+    else None
+)
+
+async_replica_engines = (
+    [
+        create_async_engine(to_async_url(url), **engine_options(is_async=True))
+        for url in settings.DATABASE_REPLICA_URLS
+    ]
+    if async_engine is not None
+    else []
+)
+
+# Per-request statement counting / timing (see app.core.middleware) and
+# opt-in slow-query capture
+_sync_engines = [engine, *replica_engines] + [
+    e.sync_engine for e in [async_engine, *async_replica_engines] if e is not None
+]
+for _engine in _sync_engines:
+    instrument_engine(_engine)
+    if settings.SLOW_QUERY_CAPTURE:
+        capture_slow_queries(_engine)
+
+AsyncSessionLocal = (
+    async_sessionmaker(
+        sync_session_class=RoutingSession,
+        writer=async_engine.sync_engine,
+        readers=[e.sync_engine for e in async_replica_engines],
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    if async_engine is not None
+    else None
+)
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database access is disabled (DATABASE_ASYNC).")
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# -------------------------
+# Session runners
+# -------------------------
+class SessionRunner(Protocol):
+    """
+    Runs repository/service work that expects a sync ``Session``.
+
+    Async routers await ``run`` instead of touching a session directly, so the
+    same repositories serve both the blocking and the non-blocking driver.
+    """
+
+    async def run(self, fn: Callable[[Session], T]) -> T: ...
+
+
+class ThreadpoolSessionRunner:
+    """Runs work on a blocking session inside Starlette's threadpool."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        return await run_in_threadpool(fn, self.db)
+
+
+class AsyncSessionRunner:
+    """
+    Runs work on an ``AsyncSession`` through ``run_sync``.
+
+    SQLAlchemy executes the sync code on a greenlet and awaits the async
+    driver underneath, so no thread is held while waiting on Postgres.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        return await self.db.run_sync(fn)
+
+
+def _get_threadpool_runner(db: Session = Depends(get_db)) -> SessionRunner:  # noqa: B008
+    return ThreadpoolSessionRunner(db)
+
+
+def _get_async_runner(
+    db: AsyncSession = Depends(get_async_db),  # noqa: B008
+) -> SessionRunner:
+    return AsyncSessionRunner(db)
+
+
+get_session_runner = (
+    _get_async_runner if settings.DATABASE_ASYNC else _get_threadpool_runner
+)
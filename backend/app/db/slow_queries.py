@@ -0,0 +1,191 @@
+"""
+Slow-query capture.
+
+When enabled (``SLOW_QUERY_CAPTURE``), every statement slower than
+``SLOW_QUERY_THRESHOLD_MS`` is recorded with the repository method and
+route that issued it and its bound parameters, redacted down to types.
+A sampled share (``SLOW_QUERY_EXPLAIN_SAMPLE_RATE``) of slow SELECTs issued
+by ``@read_only`` repository methods is re-run under
+``EXPLAIN (ANALYZE, BUFFERS)``. EXPLAIN ANALYZE executes the statement, so
+it runs inside a savepoint that is always rolled back: neither a failure
+nor side effects of the statement (volatile functions) reach the caller's
+transaction.
+
+Records are kept in a bounded in-process ring buffer, which the admin
+router serves at ``/admin/slow-queries``.
+"""
+
+import random
+import re
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config.settings import settings
+from app.db.instrumentation import current_route
+
+_START_TIMES = "slow_query_start_times"
+_REPOSITORY_MODULE_PREFIX = "app.repositories."
+_READ_ONLY_WRAPPER = ("app.repositories.base", {"wrapper", "generator_wrapper"})
+_READ_ONLY = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+_WRITES = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+
+@dataclass
+class SlowQuery:
+    """One captured slow statement."""
+
+    captured_at: datetime
+    duration_ms: float
+    statement: str
+    parameters: Any
+    call_site: str | None
+    route: str | None
+    plan: str | None = None
+
+
+class SlowQueryLog:
+    """Thread-safe ring buffer of the most recent slow queries."""
+
+    def __init__(self, maxlen: int):
+        self._entries: deque[SlowQuery] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def add(self, entry: SlowQuery) -> None:
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Return the captured queries, newest first."""
+        with self._lock:
+            return [asdict(e) for e in reversed(self._entries)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(maxlen=settings.SLOW_QUERY_BUFFER_SIZE)
+
+
+def redact(parameters: Any) -> Any:
+    """
+    Replace bound values by placeholders. Ids (ints), booleans and NULLs are
+    kept; everything else is reduced to its type (and length for strings).
+    """
+    if isinstance(parameters, Mapping):
+        return {k: redact(v) for k, v in parameters.items()}
+    if isinstance(parameters, Sequence) and not isinstance(parameters, str | bytes):
+        return [redact(v) for v in parameters]
+    if parameters is None or isinstance(parameters, bool | int):
+        return parameters
+    if isinstance(parameters, str):
+        return f"<str len={len(parameters)}>"
+    return f"<{type(parameters).__name__}>"
+
+
+def find_call_site() -> str | None:
+    """Return ``Class.method`` of the innermost repository frame on the stack."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(_REPOSITORY_MODULE_PREFIX):
+            owner = frame.f_locals.get("self")
+            name = frame.f_code.co_name
+            return f"{type(owner).__name__}.{name}" if owner is not None else name
+        frame = frame.f_back  # type: ignore[assignment]
+    return None
+
+
+def issued_by_read_only() -> bool:
+    """Whether a ``@read_only`` repository method is on the stack."""
+    module, names = _READ_ONLY_WRAPPER
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_globals.get("__name__") == module and frame.f_code.co_name in names:
+            return True
+        frame = frame.f_back  # type: ignore[assignment]
+    return False
+
+
+def _explain(conn: Any, statement: str, parameters: Any) -> str | None:
+    # A raw DBAPI cursor, so the EXPLAIN itself bypasses these event hooks
+    explain_cursor = conn.connection.cursor()
+    try:
+        explain_cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            explain_cursor.execute(
+                "EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters
+            )
+            plan = "\n".join(row[0] for row in explain_cursor.fetchall())
+        except Exception:
+            plan = None
+        # The statement really ran: undo whatever it did, successful or not
+        explain_cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+        explain_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        return plan
+    except Exception:
+        return None
+    finally:
+        explain_cursor.close()
+
+
+def _before_cursor_execute(conn: Any, *_: Any) -> None:
+    conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any,
+    _cursor: Any,
+    statement: str,
+    parameters: Any,
+    _context: Any,
+    executemany: bool,
+) -> None:
+    duration_ms = (time.perf_counter() - conn.info[_START_TIMES].pop()) * 1000
+    if duration_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+        return
+
+    plan = None
+    if (
+        not executemany
+        and _READ_ONLY.match(statement)
+        and not _WRITES.search(statement)
+        and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+        and issued_by_read_only()
+    ):
+        plan = _explain(conn, statement, parameters)
+
+    slow_query_log.add(
+        SlowQuery(
+            captured_at=datetime.now(UTC),
+            duration_ms=round(duration_ms, 3),
+            statement=statement,
+            parameters=redact(parameters),
+            call_site=find_call_site(),
+            route=current_route(),
+            plan=plan,
+        )
+    )
+
+
+def _handle_error(context: Any) -> None:
+    conn = context.connection
+    if conn is not None and conn.info.get(_START_TIMES):
+        conn.info[_START_TIMES].pop()
+
+
+def capture_slow_queries(engine: Engine) -> None:
+    """Record slow statements of ``engine`` in ``slow_query_log``."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
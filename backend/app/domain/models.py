@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
 
 
 # -------------------------
@@ -25,7 +26,7 @@ class Language:
 # -------------------------
 # Contractors
 # -------------------------
-@dataclass
+@dataclass(slots=True)
 class Contractor:
     contractor_id: int
     user_id: int
@@ -73,7 +74,8 @@ class TransactionTypeTranslation:
 # -------------------------
 # Transactions
 # -------------------------
-@dataclass
+# Slotted: read paths build these in bulk straight from result rows
+@dataclass(slots=True)
 class Transaction:
     transaction_id: int
     user_id: int
@@ -86,9 +88,41 @@ class Transaction:
     updated_at: datetime
 
     # Enriched fields (resolved by service layer)
+    contractor_from_name: str | None = None
+    contractor_to_name: str | None = None
+
     transaction_type_code: str | None = None
     transaction_type_display_name: str | None = None
 
     status_code: str | None = None
     status_display_name: str | None = None
     status_color: str | None = None
+
+
+# -------------------------
+# Transaction Rollups
+# -------------------------
+@dataclass
+class TransactionRollup:
+    user_id: int
+    contractor_id: int
+    direction: str  # "outgoing" (contractor_from) | "incoming" (contractor_to)
+    status_id: int
+    transaction_type_id: int
+    tx_count: int
+    total_amount: Decimal
+
+
+# -------------------------
+# Idempotency Keys
+# -------------------------
+@dataclass
+class IdempotencyRecord:
+    user_id: int
+    idempotency_key: str
+    request_hash: str
+    status_code: int | None  # None while the first request is in flight
+    response: Any
+    created_at: datetime
+    # Seconds until the key expires, as computed by the database
+    expires_in: float | None = None
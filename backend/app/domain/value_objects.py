@@ -1,4 +1,9 @@
+import base64
+import binascii
 from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Self
 
 
 @dataclass(frozen=True)
@@ -27,3 +32,60 @@ class TransactionTypeOption:
     type_id: int
     code: str
     display_name: str
+
+
+@dataclass(frozen=True)
+class TransactionFilter:
+    """
+    Search criteria for a user's transactions; unset fields do not filter.
+
+    Date and amount bounds are inclusive. ``contractor_name`` matches a
+    case-insensitive substring of the sender's or the receiver's name.
+    """
+
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    amount_min: Decimal | None = None
+    amount_max: Decimal | None = None
+    status_ids: tuple[int, ...] = ()
+    transaction_type_ids: tuple[int, ...] = ()
+    contractor_from_id: int | None = None
+    contractor_to_id: int | None = None
+    contractor_name: str | None = None
+
+
+@dataclass(frozen=True)
+class TransactionCursor:
+    """
+    Keyset position in a list ordered by (created_at, transaction_id) DESC.
+
+    Clients only ever see the opaque string produced by ``encode``.
+    """
+
+    created_at: datetime
+    transaction_id: int
+
+    def encode(self) -> str:
+        raw = f"{self.created_at.isoformat()}|{self.transaction_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        """
+        Parse a cursor previously produced by ``encode``.
+
+        Raises
+        ------
+        ValueError
+            If the token is malformed.
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            created_at, transaction_id = raw.split("|")
+            return cls(
+                created_at=datetime.fromisoformat(created_at),
+                transaction_id=int(transaction_id),
+            )
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError("Invalid cursor.") from e
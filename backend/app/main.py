@@ -1,13 +1,27 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.admin_router import router as admin_router
 from app.api.auth_router import router as auth_router
 from app.api.contractor_router import router as contractor_router
+from app.api.health_router import publish_runtime_metrics
 from app.api.health_router import router as health_router
 from app.api.status_router import router as status_router
 from app.api.transaction_router import router as transaction_router
 from app.api.transaction_type_router import router as transaction_type_router
 from app.api.user_router import router as user_router
+from app.core.middleware import MetricsMiddleware, QueryTimingMiddleware
+from app.core.security import password_hasher
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Join the bcrypt worker processes on shutdown and on reload
+    password_hasher.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -15,6 +29,7 @@ def create_app() -> FastAPI:
         title="Payments API",
         version="1.0.0",
         description="Clean architecture backend for contractor payments",
+        lifespan=lifespan,
     )
 
     # -----------------------------
@@ -26,8 +41,19 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["Server-Timing", "Idempotent-Replayed"],
     )
 
+    # -----------------------------
+    # Per-request SQL count / timing
+    # -----------------------------
+    app.add_middleware(QueryTimingMiddleware)
+
+    # -----------------------------
+    # Prometheus request metrics (served at /metrics)
+    # -----------------------------
+    app.add_middleware(MetricsMiddleware, on_request_end=publish_runtime_metrics)
+
     # -----------------------------
     # Routers
     # -----------------------------
@@ -38,6 +64,7 @@ def create_app() -> FastAPI:
     app.include_router(status_router)
     app.include_router(transaction_type_router)
     app.include_router(health_router)
+    app.include_router(admin_router)
 
     return app
 
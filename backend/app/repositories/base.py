@@ -6,11 +6,46 @@ implementations must follow. They ensure that the domain layer remains
 decoupled from persistence concerns.
 """
 
+import functools
+import inspect
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from typing import Any, TypeVar
 
 from sqlalchemy.orm import Session
 
+from app.db.routing import use_primary, use_replica
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def read_only(method: F) -> F:  # noqa: UP047
+    """
+    Mark a repository method as a pure read that may be served by a replica.
+
+    Sessions that already wrote in this request keep using the primary.
+    Generator methods stay routed for as long as they are being iterated.
+    Slow-query capture only re-runs statements under EXPLAIN ANALYZE when
+    they come from such a method (``app.db.slow_queries``), which it
+    recognizes by the wrapper names below.
+    """
+    if inspect.isgeneratorfunction(method):
+
+        @functools.wraps(method)
+        def generator_wrapper(self, *args, **kwargs):
+            with use_replica(self.db):
+                yield from method(self, *args, **kwargs)
+
+        return generator_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with use_replica(self.db):
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 class BaseRepository(ABC):
     """Abstract base class for all repositories."""
@@ -18,6 +53,13 @@ class BaseRepository(ABC):
     def __init__(self, db: Session):
         self.db = db
 
+    def on_primary(self) -> AbstractContextManager[None]:
+        """
+        Serve the ``read_only`` methods called inside the block from the
+        primary, for reads that decide a write and must not lag behind it.
+        """
+        return use_primary(self.db)
+
     @abstractmethod
     def _to_domain(self, orm_obj: Any) -> Any:
         """
@@ -2,14 +2,24 @@
 Contractor repository implementation.
 
 Provides access to contractor data, including lookup by user and by ID.
-Converts ORM models into domain Contractor entities.
+Reads map Core result rows straight into domain Contractor entities.
 """
 
+from collections.abc import Iterable
+
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from app.db.models import ContractorORM
 from app.domain.models import Contractor
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, read_only
+
+# The domain Contractor's fields, in declaration order: Contractor(*row)
+CONTRACTOR_COLUMNS = (
+    ContractorORM.contractor_id,
+    ContractorORM.user_id,
+    ContractorORM.name,
+)
 
 
 class ContractorRepository(BaseRepository):
@@ -25,27 +35,43 @@ class ContractorRepository(BaseRepository):
             name=orm.name,  # type: ignore[arg-type]
         )
 
+    @read_only
     def get_by_id(self, contractor_id: int) -> Contractor | None:
         """
         Retrieve a single contractor by its ID.
 
         Returns None if no such contractors exists.
         """
-        orm = (
-            self.db.query(ContractorORM)
-            .filter(ContractorORM.contractor_id == contractor_id)
-            .first()
+        row = self.db.execute(
+            select(*CONTRACTOR_COLUMNS).where(
+                ContractorORM.contractor_id == contractor_id
+            )
+        ).first()
+        return Contractor(*row) if row else None
+
+    @read_only
+    def get_by_ids(self, contractor_ids: Iterable[int]) -> list[Contractor]:
+        """
+        Retrieve all contractors with the given IDs in a single query.
+
+        Unknown IDs are silently skipped.
+        """
+        rows = self.db.execute(
+            select(*CONTRACTOR_COLUMNS).where(
+                ContractorORM.contractor_id.in_(list(contractor_ids))
+            )
         )
-        return self._to_domain(orm) if orm else None
+        return [Contractor(*r) for r in rows]
 
+    @read_only
     def get_by_user(self, user_id: int) -> list[Contractor]:
         """
         Retrieve all contractors belonging to a given user.
         """
-        rows = (
-            self.db.query(ContractorORM).filter(ContractorORM.user_id == user_id).all()
+        rows = self.db.execute(
+            select(*CONTRACTOR_COLUMNS).where(ContractorORM.user_id == user_id)
         )
-        return [self._to_domain(r) for r in rows]
+        return [Contractor(*r) for r in rows]
 
     def create(self, user_id: int, name: str) -> Contractor:
         try:
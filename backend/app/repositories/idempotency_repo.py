@@ -0,0 +1,145 @@
+"""
+Idempotency key repository.
+
+Stores the response of a request under the client's idempotency key, so a
+retried request can be answered with the original response instead of being
+executed again. A key is claimed before the request is processed; the unique
+(user_id, idempotency_key) primary key makes sure only one of several
+concurrent requests with the same key gets to run.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import func, text
+
+from app.db.models import IdempotencyKeyORM
+from app.domain.models import IdempotencyRecord
+from app.repositories.base import BaseRepository
+
+# Inserts a claim, or takes over the row of an expired key or of a claim whose
+# request never finished (its worker died) within the lock window. Returns no
+# row if a live row for the key already exists.
+CLAIM_SQL = """
+    INSERT INTO idempotency_keys (user_id, idempotency_key, request_hash)
+    VALUES (:uid, :key, :request_hash)
+    ON CONFLICT (user_id, idempotency_key) DO UPDATE
+        SET request_hash = EXCLUDED.request_hash,
+            status_code = NULL,
+            response = NULL,
+            created_at = NOW()
+        WHERE idempotency_keys.created_at
+              < NOW() - make_interval(secs => :ttl_seconds)
+           OR (idempotency_keys.status_code IS NULL
+               AND idempotency_keys.created_at
+                   < NOW() - make_interval(secs => :lock_seconds))
+    RETURNING 1
+"""
+
+
+class IdempotencyRepository(BaseRepository):
+    """Repository for idempotency keys and their stored responses."""
+
+    def _to_domain(self, orm: IdempotencyKeyORM) -> IdempotencyRecord:
+        return IdempotencyRecord(
+            user_id=orm.user_id,  # type: ignore[arg-type]
+            idempotency_key=orm.idempotency_key,  # type: ignore[arg-type]
+            request_hash=orm.request_hash,  # type: ignore[arg-type]
+            status_code=orm.status_code,  # type: ignore[arg-type]
+            response=orm.response,
+            created_at=orm.created_at,  # type: ignore[arg-type]
+        )
+
+    def claim(
+        self,
+        user_id: int,
+        key: str,
+        request_hash: str,
+        ttl_seconds: int,
+        lock_seconds: int,
+    ) -> IdempotencyRecord | None:
+        """
+        Claim ``key`` for a new request and commit.
+
+        Returns None if the key was free, expired or held by a claim older
+        than ``lock_seconds`` that never completed, and is now claimed.
+        Otherwise returns the existing record, which may still be in flight,
+        with ``expires_in`` set.
+        """
+        claimed = self.db.execute(
+            text(CLAIM_SQL),
+            {
+                "uid": user_id,
+                "key": key,
+                "request_hash": request_hash,
+                "ttl_seconds": ttl_seconds,
+                "lock_seconds": lock_seconds,
+            },
+        ).first()
+        if claimed is not None:
+            self.db.commit()
+            return None
+
+        # The remaining lifetime comes from the same clock that stamped
+        # created_at, whatever the database's time zone
+        orm, expires_in = (
+            self.db.query(
+                IdempotencyKeyORM,
+                func.extract("epoch", IdempotencyKeyORM.created_at - func.now())
+                + ttl_seconds,
+            )
+            .filter(
+                IdempotencyKeyORM.user_id == user_id,
+                IdempotencyKeyORM.idempotency_key == key,
+            )
+            .one()
+        )
+        record = self._to_domain(orm)
+        record.expires_in = float(expires_in)
+        self.db.commit()
+        return record
+
+    def complete(
+        self, user_id: int, key: str, work: Callable[[], tuple[int, Any]]
+    ) -> tuple[int, Any]:
+        """
+        Run ``work`` for a claimed key, store the ``(status_code, response)``
+        it returns and commit both together.
+
+        ``work`` must not commit. If it or the store fails, everything is
+        rolled back to a savepoint and the claim is released, as nothing was
+        written. A failing COMMIT keeps the claim: its outcome is unknown.
+        """
+        try:
+            with self.db.begin_nested():
+                status_code, response = work()
+                self.db.query(IdempotencyKeyORM).filter(
+                    IdempotencyKeyORM.user_id == user_id,
+                    IdempotencyKeyORM.idempotency_key == key,
+                ).update({"status_code": status_code, "response": response})
+        except Exception:
+            self.release(user_id, key)
+            raise
+        self.db.commit()
+        return status_code, response
+
+    def release(self, user_id: int, key: str) -> None:
+        """Drop an unfinished claim, so the request can be retried, and commit."""
+        self.db.query(IdempotencyKeyORM).filter(
+            IdempotencyKeyORM.user_id == user_id,
+            IdempotencyKeyORM.idempotency_key == key,
+            IdempotencyKeyORM.status_code.is_(None),
+        ).delete()
+        self.db.commit()
+
+    def purge_expired(self, ttl_seconds: int) -> int:
+        """Delete keys older than ``ttl_seconds``, commit, and return how many."""
+        deleted = self.db.execute(
+            text("""
+            DELETE FROM idempotency_keys
+            WHERE created_at < NOW() - make_interval(secs => :ttl_seconds)
+        """),
+            {"ttl_seconds": ttl_seconds},
+        ).rowcount  # type: ignore[attr-defined]
+        self.db.commit()
+        return deleted  # type: ignore[no-any-return]
@@ -0,0 +1,209 @@
+"""
+Transaction rollup repository.
+
+Maintains per-user summary buckets keyed by (user_id, contractor_id,
+direction, status_id, transaction_type_id) holding the transaction count and
+amount total. Every transaction contributes to two buckets: an "outgoing"
+one for its sender contractor and an "incoming" one for its receiver.
+
+Writers call ``apply`` inside their own database transaction, or embed
+``ROLLUP_ON_CONFLICT_SQL`` in their own statement, and commit together with
+the transaction rows, so the rollup never diverges on success. ``rebuild``
+recomputes everything from ``transactions`` and reports any drift.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from decimal import Decimal
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+
+from app.db.models import TransactionRollupORM
+from app.domain.models import Transaction, TransactionRollup
+from app.repositories.base import BaseRepository, read_only
+
+ROLLUP_KEY = (
+    "user_id",
+    "contractor_id",
+    "direction",
+    "status_id",
+    "transaction_type_id",
+)
+
+# Aggregates the rows of ``{source}`` (any relation with transaction columns)
+# into rollup buckets, one per contractor side. Buckets come out in key order
+# so that concurrent upserts lock the rollup rows in the same order and cannot
+# deadlock.
+ROLLUP_AGGREGATE_SQL = """
+    SELECT t.user_id, d.contractor_id, d.direction, t.status_id,
+           t.transaction_type_id, count(*) AS tx_count,
+           sum(t.amount) AS total_amount
+    FROM {source} t,
+         LATERAL (VALUES (t.contractor_from_id, 'outgoing'),
+                         (t.contractor_to_id, 'incoming'))
+             AS d(contractor_id, direction)
+    GROUP BY t.user_id, d.contractor_id, d.direction, t.status_id,
+             t.transaction_type_id
+    ORDER BY t.user_id, d.contractor_id, d.direction, t.status_id,
+             t.transaction_type_id
+"""
+
+# Turns an INSERT INTO transaction_rollups into "add onto the stored buckets"
+ROLLUP_ON_CONFLICT_SQL = """
+    ON CONFLICT (user_id, contractor_id, direction, status_id,
+                 transaction_type_id)
+    DO UPDATE SET
+        tx_count = transaction_rollups.tx_count + EXCLUDED.tx_count,
+        total_amount = transaction_rollups.total_amount + EXCLUDED.total_amount
+"""
+
+# Adds the aggregate of ``{source}`` onto the stored buckets.
+ROLLUP_UPSERT_SQL = (
+    "INSERT INTO transaction_rollups (user_id, contractor_id, direction, "
+    "status_id, transaction_type_id, tx_count, total_amount) "
+    + ROLLUP_AGGREGATE_SQL
+    + ROLLUP_ON_CONFLICT_SQL
+)
+
+
+class TransactionRollupRepository(BaseRepository):
+    """Repository for reading and maintaining transaction rollups."""
+
+    def _to_domain(self, orm: TransactionRollupORM) -> TransactionRollup:
+        return TransactionRollup(
+            user_id=orm.user_id,  # type: ignore[arg-type]
+            contractor_id=orm.contractor_id,  # type: ignore[arg-type]
+            direction=orm.direction,  # type: ignore[arg-type]
+            status_id=orm.status_id,  # type: ignore[arg-type]
+            transaction_type_id=orm.transaction_type_id,  # type: ignore[arg-type]
+            tx_count=orm.tx_count,  # type: ignore[arg-type]
+            total_amount=orm.total_amount,  # type: ignore[arg-type]
+        )
+
+    @read_only
+    def get_for_user(self, user_id: int) -> list[TransactionRollup]:
+        """
+        Retrieve all non-empty rollup buckets of a user.
+        """
+        rows = (
+            self.db.query(TransactionRollupORM)
+            .filter(
+                TransactionRollupORM.user_id == user_id,
+                TransactionRollupORM.tx_count > 0,
+            )
+            .order_by(
+                TransactionRollupORM.contractor_id,
+                TransactionRollupORM.direction,
+                TransactionRollupORM.status_id,
+                TransactionRollupORM.transaction_type_id,
+            )
+            .all()
+        )
+        return [self._to_domain(r) for r in rows]
+
+    def apply(self, transactions: Iterable[Transaction], sign: int = 1) -> None:
+        """
+        Add (``sign=1``) or remove (``sign=-1``) transactions from their
+        buckets with one multi-row upsert. Does not commit.
+
+        Rows are sent in key order, like ``ROLLUP_AGGREGATE_SQL``, so
+        concurrent writers lock shared buckets in the same order.
+        """
+        deltas: dict[tuple, list] = defaultdict(lambda: [0, Decimal(0)])
+        for tx in transactions:
+            for contractor_id, direction in (
+                (tx.contractor_from_id, "outgoing"),
+                (tx.contractor_to_id, "incoming"),
+            ):
+                delta = deltas[
+                    (
+                        tx.user_id,
+                        contractor_id,
+                        direction,
+                        tx.status_id,
+                        tx.transaction_type_id,
+                    )
+                ]
+                delta[0] += sign
+                delta[1] += sign * Decimal(tx.amount)
+
+        if not deltas:
+            return
+
+        stmt = insert(TransactionRollupORM).values(
+            [
+                {
+                    **dict(zip(ROLLUP_KEY, key, strict=True)),
+                    "tx_count": count,
+                    "total_amount": amount,
+                }
+                for key, (count, amount) in sorted(deltas.items())
+            ]
+        )
+        self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=list(ROLLUP_KEY),
+                set_={
+                    "tx_count": TransactionRollupORM.tx_count + stmt.excluded.tx_count,
+                    "total_amount": TransactionRollupORM.total_amount
+                    + stmt.excluded.total_amount,
+                },
+            )
+        )
+
+    def rebuild(self, user_id: int | None = None, dry_run: bool = False) -> list[dict]:
+        """
+        Recompute the rollups of one user (or everyone) from ``transactions``.
+
+        Returns the buckets whose stored values differed from the recomputed
+        ones, as dicts with the bucket key plus ``stored_count``,
+        ``actual_count``, ``stored_amount`` and ``actual_amount`` (None for a
+        missing side). Unless ``dry_run`` is set the stored rollups are then
+        replaced and committed.
+
+        A real rebuild locks ``transaction_rollups`` against concurrent
+        writers until it commits, so a transaction committed between the
+        drift report, the DELETE and the re-aggregation is neither lost nor
+        counted twice. A dry run reads one snapshot and takes no lock.
+        """
+        user_filter = "WHERE user_id = :uid" if user_id is not None else ""
+        source = f"(SELECT * FROM transactions {user_filter})"
+        params = {"uid": user_id} if user_id is not None else {}
+
+        if not dry_run:
+            self.db.execute(
+                text("LOCK TABLE transaction_rollups IN SHARE ROW EXCLUSIVE MODE")
+            )
+
+        drift = self.db.execute(
+            text(f"""
+            WITH fresh AS ({ROLLUP_AGGREGATE_SQL.format(source=source)}),
+                 stored AS (
+                     SELECT * FROM transaction_rollups {user_filter}
+                 )
+            SELECT user_id, contractor_id, direction, status_id,
+                   transaction_type_id,
+                   s.tx_count AS stored_count, f.tx_count AS actual_count,
+                   s.total_amount AS stored_amount,
+                   f.total_amount AS actual_amount
+            FROM fresh f
+            FULL OUTER JOIN stored s
+                USING (user_id, contractor_id, direction, status_id,
+                       transaction_type_id)
+            WHERE COALESCE(s.tx_count, 0) <> COALESCE(f.tx_count, 0)
+               OR COALESCE(s.total_amount, 0) <> COALESCE(f.total_amount, 0)
+            ORDER BY user_id, contractor_id, direction, status_id,
+                     transaction_type_id
+        """),
+            params,
+        ).mappings()
+        report = [dict(row) for row in drift]
+
+        if dry_run:
+            return report
+
+        self.db.execute(text(f"DELETE FROM transaction_rollups {user_filter}"), params)
+        self.db.execute(text(ROLLUP_UPSERT_SQL.format(source=source)), params)
+        self.db.commit()
+        return report
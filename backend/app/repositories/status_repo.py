@@ -5,6 +5,8 @@ Provides access to status metadata including code, color, and translations.
 Converts ORM models into domain status-related entities.
 """
 
+from collections.abc import Iterable
+
 from app.db.models import (
     TransactionStatusColorORM,
     TransactionStatusORM,
@@ -15,7 +17,7 @@ from app.domain.models import (
     TransactionStatusColor,
     TransactionStatusTranslation,
 )
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, read_only
 
 
 class StatusRepository(BaseRepository):
@@ -27,6 +29,7 @@ class StatusRepository(BaseRepository):
         """
         return TransactionStatus(status_id=orm.status_id, code=orm.code)  # type: ignore[arg-type]
 
+    @read_only
     def get_all(self) -> list[TransactionStatus]:
         """
         Retrieve all status definitions.
@@ -34,6 +37,7 @@ class StatusRepository(BaseRepository):
         rows = self.db.query(TransactionStatusORM).all()
         return [self._to_domain(r) for r in rows]
 
+    @read_only
     def get_by_id(self, status_id: int) -> TransactionStatus | None:
         """
         Retrieve a single status definition by ID.
@@ -47,6 +51,21 @@ class StatusRepository(BaseRepository):
         )
         return self._to_domain(orm) if orm else None
 
+    @read_only
+    def get_by_ids(self, status_ids: Iterable[int]) -> list[TransactionStatus]:
+        """
+        Retrieve all status definitions with the given IDs in a single query.
+
+        Unknown IDs are silently skipped.
+        """
+        rows = (
+            self.db.query(TransactionStatusORM)
+            .filter(TransactionStatusORM.status_id.in_(list(status_ids)))
+            .all()
+        )
+        return [self._to_domain(r) for r in rows]
+
+    @read_only
     def get_color(self, status_id: int) -> TransactionStatusColor | None:
         """
         Retrieve the color associated with a given status ID.
@@ -62,6 +81,7 @@ class StatusRepository(BaseRepository):
             return None
         return TransactionStatusColor(status_id=orm.status_id, color=orm.color)  # type: ignore[arg-type]
 
+    @read_only
     def get_translation(
         self, status_id: int, lang: str
     ) -> TransactionStatusTranslation | None:
@@ -86,6 +106,7 @@ class StatusRepository(BaseRepository):
             display_name=orm.display_name,  # type: ignore[arg-type]
         )
 
+    @read_only
     def get_all_colors(self) -> list[TransactionStatusColor]:
         """
         Retrieve all status colors.
@@ -96,6 +117,7 @@ class StatusRepository(BaseRepository):
             for r in rows
         ]
 
+    @read_only
     def get_all_translations(self) -> list[TransactionStatusTranslation]:
         """
         Retrieve all status translations.
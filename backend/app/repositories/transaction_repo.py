@@ -2,22 +2,164 @@
 Transaction repository implementation.
 
 Handles retrieval and creation of transactions, including batch queries
-for recent transactions. Converts ORM models into domain Transaction
-entities.
+for recent transactions. Reads map Core result rows straight into domain
+Transaction entities; writes go through the ORM.
 """
 
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
 from decimal import Decimal
+from typing import IO
 
-from sqlalchemy import desc
+import psycopg2
+from sqlalchemy import Row, and_, desc, func, insert, or_, select, text, tuple_
+from sqlalchemy.orm import Session, aliased
 
-from app.db.models import TransactionORM
+from app.db.models import (
+    ContractorORM,
+    TransactionORM,
+    TransactionStatusColorORM,
+    TransactionStatusORM,
+    TransactionStatusTranslationORM,
+    TransactionTypeORM,
+    TransactionTypeTranslationORM,
+)
 from app.domain.models import Transaction
-from app.repositories.base import BaseRepository
+from app.domain.value_objects import TransactionCursor, TransactionFilter
+from app.repositories.base import BaseRepository, read_only
+from app.repositories.rollup_repo import (
+    ROLLUP_ON_CONFLICT_SQL,
+    ROLLUP_UPSERT_SQL,
+    TransactionRollupRepository,
+)
+
+# The domain Transaction's own fields, in declaration order. Hot reads select
+# these with a Core SELECT and build ``Transaction(*row)`` from each result
+# row, skipping ORM instances, identity map and attribute instrumentation.
+TRANSACTION_COLUMNS = (
+    TransactionORM.transaction_id,
+    TransactionORM.user_id,
+    TransactionORM.contractor_from_id,
+    TransactionORM.contractor_to_id,
+    TransactionORM.amount,
+    TransactionORM.transaction_type_id,
+    TransactionORM.status_id,
+    TransactionORM.created_at,
+    TransactionORM.updated_at,
+)
+
+# Status change of the user's transactions among :ids to :status_id in one
+# round-trip. ``owned`` locks the rows first, so the old status used for the
+# rollup deltas is the one actually replaced. Rows already in the target
+# status are returned with moved = FALSE and keep their updated_at. Rows
+# are locked in ID order, so overlapping bulk transitions cannot deadlock.
+SET_STATUS_SQL = (
+    """
+    WITH owned AS (
+        SELECT transaction_id, created_at, status_id
+        FROM transactions
+        WHERE transaction_id = ANY(:ids) AND user_id = :uid
+        ORDER BY transaction_id
+        FOR UPDATE
+    ),
+    moved AS (
+        UPDATE transactions t
+        SET status_id = :status_id
+        FROM owned o
+        WHERE t.transaction_id = o.transaction_id
+          AND t.created_at = o.created_at
+          AND o.status_id <> :status_id
+        RETURNING t.*, o.status_id AS old_status_id
+    ),
+    rollups AS (
+        INSERT INTO transaction_rollups (user_id, contractor_id, direction,
+                                         status_id, transaction_type_id,
+                                         tx_count, total_amount)
+        SELECT m.user_id, d.contractor_id, d.direction, s.status_id,
+               m.transaction_type_id, sum(s.sign), sum(s.sign * m.amount)
+        FROM moved m,
+             LATERAL (VALUES (m.contractor_from_id, 'outgoing'),
+                             (m.contractor_to_id, 'incoming'))
+                 AS d(contractor_id, direction),
+             LATERAL (VALUES (m.old_status_id, -1), (m.status_id, 1))
+                 AS s(status_id, sign)
+        GROUP BY m.user_id, d.contractor_id, d.direction, s.status_id,
+                 m.transaction_type_id
+        ORDER BY m.user_id, d.contractor_id, d.direction, s.status_id,
+                 m.transaction_type_id
+    """
+    + ROLLUP_ON_CONFLICT_SQL
+    + """
+    )
+    SELECT r.*, cf.name AS contractor_from_name, ct.name AS contractor_to_name
+    FROM (
+        SELECT transaction_id, user_id, contractor_from_id, contractor_to_id,
+               amount, transaction_type_id, status_id, created_at, updated_at,
+               TRUE AS moved
+        FROM moved
+        UNION ALL
+        SELECT t.transaction_id, t.user_id, t.contractor_from_id,
+               t.contractor_to_id, t.amount, t.transaction_type_id, t.status_id,
+               t.created_at, t.updated_at, FALSE
+        FROM transactions t
+        JOIN owned o ON o.transaction_id = t.transaction_id
+                    AND o.created_at = t.created_at
+        WHERE o.status_id = :status_id
+    ) r
+    LEFT JOIN contractors cf ON cf.contractor_id = r.contractor_from_id
+    LEFT JOIN contractors ct ON ct.contractor_id = r.contractor_to_id
+"""
+)
+
+# First pass over staged CSV rows: trims contractor names, so they match
+# existing contractors, and rejects rows where one is missing
+IMPORT_TRIM_SQL = """
+    UPDATE import_staging
+    SET contractor_from = btrim(contractor_from),
+        contractor_to = btrim(contractor_to),
+        error = CASE
+            WHEN NULLIF(btrim(contractor_from), '') IS NULL
+              OR NULLIF(btrim(contractor_to), '') IS NULL
+            THEN 'Missing contractor name.'
+        END
+"""
+
+# (SQL condition on staging row ``s``, rejection reason) for CSV imports,
+# checked after IMPORT_TRIM_SQL
+IMPORT_RULES = (
+    (
+        "char_length(s.contractor_from) > 100 OR char_length(s.contractor_to) > 100",
+        "Contractor name too long.",
+    ),
+    ("s.contractor_from = s.contractor_to", "Receiver and Sender must differ."),
+    (
+        "s.amount IS NULL OR NOT pg_input_is_valid(s.amount, 'numeric(12,2)')",
+        "Invalid amount.",
+    ),
+    (
+        "NOT EXISTS (SELECT 1 FROM transaction_statuses st WHERE st.code = s.status)",
+        "Unknown status.",
+    ),
+    (
+        "NOT EXISTS (SELECT 1 FROM transaction_types tt "
+        "WHERE tt.code = s.transaction_type)",
+        "Unknown transaction type.",
+    ),
+    (
+        "s.created_at IS NOT NULL AND NOT pg_input_is_valid(s.created_at, 'timestamp')",
+        "Invalid created_at.",
+    ),
+)
 
 
 class TransactionRepository(BaseRepository):
     """Repository for accessing and manipulating Transaction data."""
 
+    def __init__(self, db: Session):
+        super().__init__(db)
+        # Written in the same DB transaction as every transaction change
+        self.rollups = TransactionRollupRepository(db)
+
     def _to_domain(self, orm: TransactionORM) -> Transaction:
         """
         Convert an ORM transaction instance to a domain Transaction entity.
@@ -34,48 +176,343 @@ class TransactionRepository(BaseRepository):
             updated_at=orm.updated_at,  # type: ignore[arg-type]
         )
 
+    @read_only
     def get_by_id(self, transaction_id: int) -> Transaction | None:
         """
         Retrieve a single transaction by its ID.
 
         Returns None if no such transaction exists.
         """
-        orm = (
-            self.db.query(TransactionORM)
+        row = self.db.execute(
+            select(*TRANSACTION_COLUMNS).where(
+                TransactionORM.transaction_id == transaction_id
+            )
+        ).first()
+        return Transaction(*row) if row else None
+
+    @read_only
+    def get_by_ids(
+        self, transaction_ids: Iterable[int], user_id: int | None = None
+    ) -> list[Transaction]:
+        """
+        Retrieve all transactions with the given IDs in a single query,
+        optionally only those owned by ``user_id``.
+
+        Unknown IDs are silently skipped.
+        """
+        stmt = select(*TRANSACTION_COLUMNS).where(
+            TransactionORM.transaction_id.in_(list(transaction_ids))
+        )
+        if user_id is not None:
+            stmt = stmt.where(TransactionORM.user_id == user_id)
+        return [Transaction(*r) for r in self.db.execute(stmt)]
+
+    def get_ids(
+        self, user_id: int, filters: TransactionFilter, limit: int
+    ) -> list[int]:
+        """
+        Return up to ``limit`` IDs of the user's transactions matching
+        ``filters``. Reads the primary, as the IDs are about to be written.
+        """
+        return list(
+            self.db.scalars(
+                select(TransactionORM.transaction_id)
+                .where(
+                    TransactionORM.user_id == user_id,
+                    *self._filter_conditions(user_id, filters),
+                )
+                .limit(limit)
+            )
+        )
+
+    @read_only
+    def get_updated_at(self, transaction_id: int) -> datetime | None:
+        """
+        Return when a transaction was last modified, or None if it does not
+        exist. Reads a single column, without any enrichment.
+        """
+        return (  # type: ignore[no-any-return]
+            self.db.query(TransactionORM.updated_at)
             .filter(TransactionORM.transaction_id == transaction_id)
-            .first()
+            .scalar()
         )
-        return self._to_domain(orm) if orm else None
 
+    @read_only
     def get_for_contractors(self, contractor_ids: list[int]) -> list[Transaction]:
         """
         Retrieve all transactions where any of the given contractor is either
         the sender or the receiver.
         """
-        rows = (
-            self.db.query(TransactionORM)
-            .filter(
+        rows = self.db.execute(
+            select(*TRANSACTION_COLUMNS)
+            .where(
                 (TransactionORM.contractor_from_id.in_(contractor_ids))
                 | (TransactionORM.contractor_to_id.in_(contractor_ids))
             )
             .order_by(desc(TransactionORM.created_at))
-            .all()
         )
-        return [self._to_domain(r) for r in rows]
+        return [Transaction(*r) for r in rows]
 
+    @read_only
     def get_recent(self, user_id: int, limit: int) -> list[Transaction]:
         """
         Retrieve the most recent transactions, ordered by creation date
         descending, limited by the given count.
         """
-        rows = (
-            self.db.query(TransactionORM)
-            .filter(TransactionORM.user_id == user_id)
+        rows = self.db.execute(
+            select(*TRANSACTION_COLUMNS)
+            .where(TransactionORM.user_id == user_id)
             .order_by(desc(TransactionORM.created_at))
             .limit(limit)
-            .all()
         )
-        return [self._to_domain(r) for r in rows]
+        return [Transaction(*r) for r in rows]
+
+    @read_only
+    def get_recent_enriched(
+        self,
+        user_id: int,
+        limit: int,
+        lang: str = "en",
+        before: TransactionCursor | None = None,
+        filters: TransactionFilter | None = None,
+    ) -> list[Transaction]:
+        """
+        Retrieve the most recent transactions together with their contractor
+        names, status code, color and localized status / type labels.
+
+        Everything is resolved by a single joined SELECT, so the cost does not
+        grow with the number of rows returned. Enriched fields are None where
+        the related row or translation is missing.
+
+        Rows are ordered by (created_at, transaction_id) descending. When
+        ``before`` is given only rows strictly after that keyset position are
+        returned, which lets the (user_id, created_at, transaction_id) index
+        serve every page at the same cost.
+
+        ``filters`` narrows the rows down within the same statement; see
+        ``_filter_conditions`` for the indexes each criterion relies on.
+
+        The page is selected from ``transactions`` in a subquery and only
+        its rows are joined. Planning the joins directly against the
+        partitioned table costs far more than executing the query.
+        """
+        page = select(*TRANSACTION_COLUMNS).where(TransactionORM.user_id == user_id)
+        if filters is not None:
+            page = page.where(*self._filter_conditions(user_id, filters))
+        if before is not None:
+            page = page.where(
+                # The plain bound lets the planner prune later partitions;
+                # it cannot see through the row comparison
+                TransactionORM.created_at <= before.created_at,
+                tuple_(TransactionORM.created_at, TransactionORM.transaction_id)
+                < (before.created_at, before.transaction_id),
+            )
+        page_rows = page.order_by(
+            desc(TransactionORM.created_at), desc(TransactionORM.transaction_id)
+        ).limit(limit)
+        paged = page_rows.subquery()
+
+        contractor_from = aliased(ContractorORM)
+        contractor_to = aliased(ContractorORM)
+
+        # Enrichments follow the core columns in the order the domain
+        # Transaction declares them, so each row maps to it positionally
+        rows = self.db.execute(
+            select(
+                *paged.c,
+                contractor_from.name,
+                contractor_to.name,
+                TransactionTypeORM.code,
+                TransactionTypeTranslationORM.display_name,
+                TransactionStatusORM.code,
+                TransactionStatusTranslationORM.display_name,
+                TransactionStatusColorORM.color,
+            )
+            .outerjoin(
+                contractor_from,
+                contractor_from.contractor_id == paged.c.contractor_from_id,
+            )
+            .outerjoin(
+                contractor_to,
+                contractor_to.contractor_id == paged.c.contractor_to_id,
+            )
+            .outerjoin(
+                TransactionStatusORM,
+                TransactionStatusORM.status_id == paged.c.status_id,
+            )
+            .outerjoin(
+                TransactionStatusColorORM,
+                TransactionStatusColorORM.status_id == paged.c.status_id,
+            )
+            .outerjoin(
+                TransactionStatusTranslationORM,
+                and_(
+                    TransactionStatusTranslationORM.status_id == paged.c.status_id,
+                    TransactionStatusTranslationORM.language_code == lang,
+                ),
+            )
+            .outerjoin(
+                TransactionTypeORM,
+                TransactionTypeORM.transaction_type_id == paged.c.transaction_type_id,
+            )
+            .outerjoin(
+                TransactionTypeTranslationORM,
+                and_(
+                    TransactionTypeTranslationORM.transaction_type_id
+                    == paged.c.transaction_type_id,
+                    TransactionTypeTranslationORM.language_code == lang,
+                ),
+            )
+            .order_by(desc(paged.c.created_at), desc(paged.c.transaction_id))
+        )
+        return [Transaction(*r) for r in rows]
+
+    @staticmethod
+    def _filter_conditions(user_id: int, filters: TransactionFilter) -> list:
+        """
+        WHERE conditions for ``filters``.
+
+        Sender / receiver, status and type each have a composite index ending
+        in (created_at, transaction_id), so a page is read in order from it.
+        Date bounds narrow the (user_id, created_at, transaction_id) index and
+        prune partitions. Contractor names are matched through the trigram
+        index on contractors.name, then by contractor id.
+        """
+        conditions = []
+        if filters.created_from is not None:
+            conditions.append(TransactionORM.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            conditions.append(TransactionORM.created_at <= filters.created_to)
+        if filters.amount_min is not None:
+            conditions.append(TransactionORM.amount >= filters.amount_min)
+        if filters.amount_max is not None:
+            conditions.append(TransactionORM.amount <= filters.amount_max)
+        if filters.status_ids:
+            conditions.append(TransactionORM.status_id.in_(filters.status_ids))
+        if filters.transaction_type_ids:
+            conditions.append(
+                TransactionORM.transaction_type_id.in_(filters.transaction_type_ids)
+            )
+        if filters.contractor_from_id is not None:
+            conditions.append(
+                TransactionORM.contractor_from_id == filters.contractor_from_id
+            )
+        if filters.contractor_to_id is not None:
+            conditions.append(
+                TransactionORM.contractor_to_id == filters.contractor_to_id
+            )
+        if filters.contractor_name:
+            matching = select(ContractorORM.contractor_id).where(
+                ContractorORM.user_id == user_id,
+                ContractorORM.name.icontains(filters.contractor_name, autoescape=True),
+            )
+            conditions.append(
+                or_(
+                    TransactionORM.contractor_from_id.in_(matching),
+                    TransactionORM.contractor_to_id.in_(matching),
+                )
+            )
+        return conditions
+
+    @read_only
+    def get_recent_page_state(
+        self,
+        user_id: int,
+        limit: int,
+        before: TransactionCursor | None = None,
+    ) -> tuple[int, int, datetime | None]:
+        """
+        Summarize the page ``get_recent_enriched`` would return for the same
+        arguments as ``(row_count, id_sum, newest_updated_at)``.
+
+        Any insert into or update within the page changes the result. Only the
+        (user_id, created_at, transaction_id) index and the page's own rows
+        are touched; nothing is joined.
+        """
+        page = select(TransactionORM.transaction_id, TransactionORM.updated_at).where(
+            TransactionORM.user_id == user_id
+        )
+        if before is not None:
+            page = page.where(
+                TransactionORM.created_at <= before.created_at,
+                tuple_(TransactionORM.created_at, TransactionORM.transaction_id)
+                < (before.created_at, before.transaction_id),
+            )
+        sub = (
+            page.order_by(
+                desc(TransactionORM.created_at), desc(TransactionORM.transaction_id)
+            )
+            .limit(limit)
+            .subquery()
+        )
+
+        count, id_sum, newest = self.db.execute(
+            select(
+                func.count(),
+                func.coalesce(func.sum(sub.c.transaction_id), 0),
+                func.max(sub.c.updated_at),
+            )
+        ).one()
+        return count, id_sum, newest
+
+    @read_only
+    def iter_export_rows(
+        self, user_id: int, chunk_size: int
+    ) -> Iterator[Sequence[Row]]:
+        """
+        Stream all transactions of a user as plain result rows, newest first,
+        in chunks of ``chunk_size``.
+
+        Uses a server-side cursor and a Core SELECT, so no ORM objects are
+        built and memory use stays flat regardless of the user's history.
+        Rows carry transaction_id, created_at, updated_at, contractor_from,
+        contractor_to, amount, transaction_type and status (codes).
+        """
+        contractor_from = aliased(ContractorORM)
+        contractor_to = aliased(ContractorORM)
+
+        stmt = (
+            select(
+                TransactionORM.transaction_id,
+                TransactionORM.created_at,
+                TransactionORM.updated_at,
+                contractor_from.name.label("contractor_from"),
+                contractor_to.name.label("contractor_to"),
+                TransactionORM.amount,
+                TransactionTypeORM.code.label("transaction_type"),
+                TransactionStatusORM.code.label("status"),
+            )
+            .outerjoin(
+                contractor_from,
+                contractor_from.contractor_id == TransactionORM.contractor_from_id,
+            )
+            .outerjoin(
+                contractor_to,
+                contractor_to.contractor_id == TransactionORM.contractor_to_id,
+            )
+            .outerjoin(
+                TransactionTypeORM,
+                TransactionTypeORM.transaction_type_id
+                == TransactionORM.transaction_type_id,
+            )
+            .outerjoin(
+                TransactionStatusORM,
+                TransactionStatusORM.status_id == TransactionORM.status_id,
+            )
+            .where(TransactionORM.user_id == user_id)
+            .order_by(
+                desc(TransactionORM.created_at), desc(TransactionORM.transaction_id)
+            )
+        )
+
+        result = self.db.execute(
+            stmt,
+            execution_options={"stream_results": True, "yield_per": chunk_size},
+        )
+        try:
+            yield from result.partitions()
+        finally:
+            result.close()
 
     def create(
         self,
@@ -85,10 +522,14 @@ class TransactionRepository(BaseRepository):
         amount: Decimal,
         status_id: int,
         transaction_type_id: int,
+        commit: bool = True,
     ) -> Transaction:
         """
         Create and persist a new transaction.
 
+        With ``commit`` False the row is only flushed, so the caller can
+        commit it together with other writes.
+
         Returns the created domain Transaction entity.
         """
         orm = TransactionORM(
@@ -100,29 +541,209 @@ class TransactionRepository(BaseRepository):
             transaction_type_id=transaction_type_id,
         )
         self.db.add(orm)
-        self.db.commit()
-        self.db.refresh(orm)
+        self.db.flush()
+        self.rollups.apply([self._to_domain(orm)])
+        if commit:
+            self.db.commit()
+            self.db.refresh(orm)
         return self._to_domain(orm)
 
-    def update(self, tx_id: int, updates: dict):
+    def create_many(self, rows: list[dict]) -> list[Transaction]:
         """
-        Update transaction.
+        Insert many transactions with one multi-row INSERT ... RETURNING and
+        a single commit.
 
-        Returns the updated domain Transaction entity.
+        Each row holds the same fields as ``create``. Returns the created
+        domain Transaction entities in input order.
         """
-        orm = (
-            self.db.query(TransactionORM)
-            .filter(TransactionORM.transaction_id == tx_id)
-            .first()
+        if not rows:
+            return []
+
+        created = self.db.scalars(
+            insert(TransactionORM).returning(
+                TransactionORM, sort_by_parameter_order=True
+            ),
+            rows,
+        ).all()
+        # Convert before commit: committing expires the returned instances
+        result = [self._to_domain(orm) for orm in created]
+        self.rollups.apply(result)
+        self.db.commit()
+        return result
+
+    def import_csv(self, user_id: int, stream: IO, max_reported: int = 1000) -> dict:
+        """
+        Bulk-load transactions for a user from a CSV stream.
+
+        The CSV must have the header
+        ``contractor_from,contractor_to,amount,status,transaction_type,created_at``
+        where contractors are given by name, status and type by code and
+        ``created_at`` may be empty (defaults to now).
+
+        The file is staged into a temp table with ``COPY FROM STDIN`` and
+        validated with set-based UPDATEs (see ``IMPORT_TRIM_SQL`` and
+        ``IMPORT_RULES``); contractor names are trimmed. Missing
+        contractors referenced by valid rows are created in bulk, then all
+        valid rows are inserted with one ``INSERT ... SELECT``. Everything
+        runs in one transaction.
+
+        Returns a summary with ``total``, ``imported``,
+        ``contractors_created``, ``rejected`` (count) and ``errors``: up to
+        ``max_reported`` ``(row, reason)`` pairs, rows numbered from 1.
+
+        Raises
+        ------
+        ValueError
+            If the stream is not CSV in the expected layout.
+        """
+        # Staging runs in a savepoint, so a malformed file only undoes this
+        # step and not the caller's transaction
+        savepoint = self.db.begin_nested()
+        self.db.execute(
+            text("""
+            CREATE TEMP TABLE import_staging (
+                row_no BIGINT GENERATED ALWAYS AS IDENTITY,
+                contractor_from TEXT,
+                contractor_to TEXT,
+                amount TEXT,
+                status TEXT,
+                transaction_type TEXT,
+                created_at TEXT,
+                error TEXT
+            ) ON COMMIT DROP
+        """)
         )
 
-        if not orm:
-            return None
+        dbapi_conn = self.db.connection().connection.dbapi_connection
+        try:
+            with dbapi_conn.cursor() as cursor:  # type: ignore[union-attr]
+                cursor.copy_expert(
+                    """
+                    COPY import_staging (contractor_from, contractor_to, amount,
+                                         status, transaction_type, created_at)
+                    FROM STDIN WITH (FORMAT csv, HEADER MATCH)
+                    """,
+                    stream,
+                )
+        except psycopg2.DataError as e:
+            savepoint.rollback()
+            raise ValueError(f"Malformed CSV: {e.diag.message_primary}") from e
+        savepoint.commit()
+
+        # Validation: first failing rule wins, evaluated in this order
+        self.db.execute(text(IMPORT_TRIM_SQL))
+        for condition, reason in IMPORT_RULES:
+            self.db.execute(
+                text(
+                    "UPDATE import_staging s SET error = :reason "
+                    f"WHERE s.error IS NULL AND ({condition})"
+                ),
+                {"reason": reason},
+            )
 
-        # Apply updates selectively
-        if "status_id" in updates:
-            orm.status_id = updates["status_id"]
+        contractors_created = self.db.execute(
+            text("""
+            INSERT INTO contractors (user_id, name)
+            SELECT DISTINCT :uid, name
+            FROM import_staging,
+                 LATERAL (VALUES (contractor_from), (contractor_to)) AS n(name)
+            WHERE error IS NULL
+            ON CONFLICT (user_id, name) DO NOTHING
+        """),
+            {"uid": user_id},
+        ).rowcount  # type: ignore[attr-defined]
+
+        # Insert and fold the new rows into the rollups in one statement
+        imported = self.db.execute(
+            text(
+                """
+            WITH inserted AS (
+            INSERT INTO transactions (user_id, contractor_from_id,
+                                      contractor_to_id, amount,
+                                      transaction_type_id, status_id,
+                                      created_at, updated_at)
+            SELECT :uid, cf.contractor_id, ct.contractor_id,
+                   s.amount::NUMERIC(12, 2), tt.transaction_type_id,
+                   st.status_id,
+                   COALESCE(s.created_at::TIMESTAMP, NOW()),
+                   COALESCE(s.created_at::TIMESTAMP, NOW())
+            FROM import_staging s
+            JOIN contractors cf
+              ON cf.user_id = :uid AND cf.name = s.contractor_from
+            JOIN contractors ct
+              ON ct.user_id = :uid AND ct.name = s.contractor_to
+            JOIN transaction_statuses st ON st.code = s.status
+            JOIN transaction_types tt ON tt.code = s.transaction_type
+            WHERE s.error IS NULL
+            ORDER BY s.row_no
+            RETURNING *
+            ),
+            rolled_up AS ("""
+                + ROLLUP_UPSERT_SQL.format(source="inserted")
+                + """)
+            SELECT count(*) FROM inserted
+        """
+            ),
+            {"uid": user_id},
+        ).scalar_one()
+
+        total, rejected = self.db.execute(
+            text("SELECT count(*), count(error) FROM import_staging")
+        ).one()
+        errors = self.db.execute(
+            text("""
+            SELECT row_no, error FROM import_staging
+            WHERE error IS NOT NULL
+            ORDER BY row_no
+            LIMIT :limit
+        """),
+            {"limit": max_reported},
+        ).all()
 
         self.db.commit()
-        self.db.refresh(orm)
-        return self._to_domain(orm)
+
+        return {
+            "total": total,
+            "imported": imported,
+            "contractors_created": contractors_created,
+            "rejected": rejected,
+            "errors": [(row_no, error) for row_no, error in errors],
+        }
+
+    def set_status(
+        self, tx_ids: Sequence[int], user_id: int, status_id: int
+    ) -> tuple[list[Transaction], set[int]]:
+        """
+        Move the user's transactions among ``tx_ids`` to ``status_id`` and
+        commit.
+
+        Ownership check, update and rollup maintenance are one statement
+        (see ``SET_STATUS_SQL``). Returns the user's matching transactions
+        after the change, with contractor names, and the IDs whose status
+        actually changed; those already in ``status_id`` are left untouched.
+        IDs that do not exist or belong to someone else are absent.
+        """
+        rows = self.db.execute(
+            text(SET_STATUS_SQL),
+            {"ids": list(tx_ids), "uid": user_id, "status_id": status_id},
+        ).all()
+        self.db.commit()
+
+        moved = {r.transaction_id for r in rows if r.moved}
+        result: list[Transaction] = []
+        for r in rows:
+            tx = Transaction(
+                transaction_id=r.transaction_id,
+                user_id=r.user_id,
+                contractor_from_id=r.contractor_from_id,
+                contractor_to_id=r.contractor_to_id,
+                amount=r.amount,
+                transaction_type_id=r.transaction_type_id,
+                status_id=r.status_id,
+                created_at=r.created_at,
+                updated_at=r.updated_at,
+            )
+            tx.contractor_from_name = r.contractor_from_name
+            tx.contractor_to_name = r.contractor_to_name
+            result.append(tx)
+        return result, moved
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from app.db.models import (
     TransactionTypeORM,
     TransactionTypeTranslationORM,
@@ -6,7 +8,7 @@ from app.domain.models import (
     TransactionType,
     TransactionTypeTranslation,
 )
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, read_only
 
 
 class TransactionTypeRepository(BaseRepository):
@@ -16,6 +18,7 @@ class TransactionTypeRepository(BaseRepository):
             code=orm.code,  # type: ignore[arg-type]
         )
 
+    @read_only
     def get_by_id(self, type_id: int) -> TransactionType | None:
         orm = (
             self.db.query(TransactionTypeORM)
@@ -24,10 +27,21 @@ class TransactionTypeRepository(BaseRepository):
         )
         return self._to_domain(orm) if orm else None
 
+    @read_only
+    def get_by_ids(self, type_ids: Iterable[int]) -> list[TransactionType]:
+        rows = (
+            self.db.query(TransactionTypeORM)
+            .filter(TransactionTypeORM.transaction_type_id.in_(list(type_ids)))
+            .all()
+        )
+        return [self._to_domain(r) for r in rows]
+
+    @read_only
     def get_all(self) -> list[TransactionType]:
         rows = self.db.query(TransactionTypeORM).all()
         return [self._to_domain(r) for r in rows]
 
+    @read_only
     def get_translation(
         self, type_id: int, lang: str
     ) -> TransactionTypeTranslation | None:
@@ -48,6 +62,7 @@ class TransactionTypeRepository(BaseRepository):
             display_name=orm.display_name,  # type: ignore[arg-type]
         )
 
+    @read_only
     def get_all_translations(self) -> list[TransactionTypeTranslation]:
         rows = self.db.query(TransactionTypeTranslationORM).all()
         return [
@@ -45,6 +45,15 @@ class UserRepository(BaseRepository):
         orm = self.db.query(UserORM).filter(UserORM.username == username).first()
         return self._to_domain(orm) if orm else None
 
+    def update_password_hash(self, user_id: int, password_hash: str) -> None:
+        """
+        Replace a user's password hash.
+        """
+        self.db.query(UserORM).filter(UserORM.user_id == user_id).update(
+            {UserORM.password_hash: password_hash}
+        )
+        self.db.commit()
+
     def add(self, user: UserORM):
         """
         Add a user to the DB.
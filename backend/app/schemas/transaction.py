@@ -1,7 +1,8 @@
 from datetime import datetime
 from decimal import Decimal
+from typing import Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 from app.schemas.status import StatusPresentation, StatusResponse
 from app.schemas.transaction_type import TransactionTypeResponse
@@ -15,6 +16,24 @@ class TransactionCreateRequest(BaseModel):
     transaction_type_id: int
 
 
+class TransactionBulkCreateRequest(BaseModel):
+    items: list[TransactionCreateRequest] = Field(..., min_length=1, max_length=5000)
+    # all-or-nothing by default; False inserts the valid items only
+    atomic: bool = True
+
+
+class TransactionBulkItemResult(BaseModel):
+    index: int
+    transaction_id: int | None = None
+    error: str | None = None
+
+
+class TransactionBulkCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: list[TransactionBulkItemResult]
+
+
 class TransactionDetailResponse(BaseModel):
     transaction_id: int
     contractor_from: str
@@ -28,6 +47,23 @@ class TransactionDetailResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+MAX_BATCH_DETAIL_IDS = 1000
+
+
+class TransactionBatchDetailRequest(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=MAX_BATCH_DETAIL_IDS)
+
+
+class TransactionBatchDetailItem(BaseModel):
+    transaction_id: int
+    transaction: TransactionDetailResponse | None = None
+    error: str | None = None
+
+
+class TransactionBatchDetailResponse(BaseModel):
+    items: list[TransactionBatchDetailItem]
+
+
 class TransactionListItem(BaseModel):
     transaction_id: int
     contractor_from: str
@@ -42,8 +78,74 @@ class TransactionListItem(BaseModel):
 
 class TransactionListResponse(BaseModel):
     items: list[TransactionListItem]
+    next_cursor: str | None = None
 
 
 class TransactionUpdateRequest(BaseModel):
     status_id: int | None = None
     # Add more fields later as needed
+
+
+MAX_BULK_STATUS_IDS = 10_000
+
+
+class TransactionFilterRequest(BaseModel):
+    """Same criteria as the query parameters of /transactions/search."""
+
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    amount_min: Decimal | None = None
+    amount_max: Decimal | None = None
+    status_ids: list[int] = []
+    transaction_type_ids: list[int] = []
+    contractor_from_id: int | None = None
+    contractor_to_id: int | None = None
+    contractor_name: str | None = Field(None, min_length=1, max_length=100)
+
+
+class TransactionBulkStatusRequest(BaseModel):
+    status_id: int
+    # exactly one of the two
+    ids: list[int] | None = Field(None, min_length=1, max_length=MAX_BULK_STATUS_IDS)
+    filter: TransactionFilterRequest | None = None
+
+    @model_validator(mode="after")
+    def _ids_or_filter(self) -> Self:
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Give either ids or filter.")
+        return self
+
+
+class TransactionBulkStatusResponse(BaseModel):
+    updated: list[int]
+    # already in the target status
+    skipped: list[int]
+    # unknown or owned by another user
+    not_found: list[int]
+
+
+class TransactionImportError(BaseModel):
+    row: int
+    reason: str
+
+
+class TransactionImportResponse(BaseModel):
+    total: int
+    imported: int
+    contractors_created: int
+    rejected: int
+    errors: list[TransactionImportError]
+
+
+class TransactionSummaryItem(BaseModel):
+    contractor_id: int
+    contractor: str
+    direction: str
+    status: StatusResponse
+    transaction_type: TransactionTypeResponse
+    count: int
+    total_amount: Decimal
+
+
+class TransactionSummaryResponse(BaseModel):
+    items: list[TransactionSummaryItem]
@@ -4,6 +4,9 @@ Authentication service.
 Handles user login, password verification, and token creation.
 This service enforces authentication-related domain rules and delegates
 persistence to the UserRepository.
+
+Password hashing is CPU-bound, so it runs on the ``PasswordHasher`` process
+pool while database work goes through the request's ``SessionRunner``.
 """
 
 from datetime import datetime, timedelta
@@ -11,32 +14,49 @@ from datetime import datetime, timedelta
 from jose import jwt
 
 from app.core.config.settings import settings
-from app.core.security import verify_password
+from app.core.security import PasswordHasher, password_hasher
+from app.db.session import SessionRunner
 from app.repositories.user_repo import UserRepository
 
 
 class AuthService:
     """Service responsible for user authentication."""
 
-    def __init__(self, user_repo: UserRepository):
-        self.user_repo = user_repo
+    def __init__(self, runner: SessionRunner, hasher: PasswordHasher | None = None):
+        self.runner = runner
+        self.hasher = hasher or password_hasher
 
-    def authenticate(self, username: str, password: str) -> str:
+    async def authenticate(self, username: str, password: str) -> str:
         """
         Authenticate a user and return a JWT access token.
 
+        A stored hash with outdated settings (e.g. a lower bcrypt cost) is
+        replaced by a fresh one on successful login.
+
         Raises
         ------
         ValueError
             If the username does not exist or the password is invalid.
         """
-        user = self.user_repo.get_by_username(username)
+        user = await self.runner.run(
+            lambda db: UserRepository(db).get_by_username(username)
+        )
         if not user:
             raise ValueError("Invalid username or password.")
 
-        if not verify_password(password, user.password_hash):
+        valid, new_hash = await self.hasher.verify_and_update(
+            password, user.password_hash
+        )
+        if not valid:
             raise ValueError("Invalid username or password.")
 
+        if new_hash is not None:
+            await self.runner.run(
+                lambda db: UserRepository(db).update_password_hash(
+                    user.user_id, new_hash
+                )
+            )
+
         expire = datetime.utcnow() + timedelta(hours=settings.JWT_EXPIRE_HOURS)
 
         payload = {
@@ -0,0 +1,152 @@
+"""
+Idempotency-Key handling.
+
+A client may send ``Idempotency-Key`` on a write. The first request with a
+key claims it in the ``idempotency_keys`` table, runs, and stores its
+response there. Retries with the same key get the stored response back and
+never reach the business logic; a retry that arrives while the first request
+is still running is told so.
+
+Completed responses are also kept in a bounded in-process LRU, so replays
+during a retry storm usually cost no database round-trip at all. The table
+stays the source of truth across workers.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from app.core.config.settings import settings
+from app.core.metrics import CACHE_LOOKUPS
+from app.domain.models import IdempotencyRecord
+from app.repositories.idempotency_repo import IdempotencyRepository
+
+
+def request_fingerprint(payload: str) -> str:
+    """Hash of a request body, to detect a key reused for another request."""
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class IdempotencyCache:
+    """Bounded LRU of completed idempotency records, dropped after their TTL."""
+
+    def __init__(self, maxsize: int, name: str = "idempotency"):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._hit_counter = CACHE_LOOKUPS.labels(name, "hit")
+        self._miss_counter = CACHE_LOOKUPS.labels(name, "miss")
+        # (user_id, key) -> (record, expiry on the monotonic clock)
+        self._entries: OrderedDict[tuple[int, str], tuple[IdempotencyRecord, float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int, key: str) -> IdempotencyRecord | None:
+        with self._lock:
+            entry = self._entries.get((user_id, key))
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[(user_id, key)]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                self._miss_counter.inc()
+                return None
+
+            self._entries.move_to_end((user_id, key))
+            self.hits += 1
+            self._hit_counter.inc()
+            return entry[0]
+
+    def put(self, record: IdempotencyRecord, ttl_seconds: float) -> None:
+        if self.maxsize <= 0 or ttl_seconds <= 0:
+            return
+
+        cache_key = (record.user_id, record.idempotency_key)
+        with self._lock:
+            self._entries[cache_key] = (record, time.monotonic() + ttl_seconds)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+idempotency_cache = IdempotencyCache(maxsize=settings.IDEMPOTENCY_CACHE_SIZE)
+
+
+class IdempotencyService:
+    """Claims keys, replays stored responses and records new ones."""
+
+    def __init__(
+        self,
+        repo: IdempotencyRepository,
+        cache: IdempotencyCache | None = None,
+        ttl_seconds: int | None = None,
+        lock_seconds: int | None = None,
+    ):
+        self.repo = repo
+        self.cache = cache or idempotency_cache
+        self.ttl_seconds = ttl_seconds or settings.IDEMPOTENCY_TTL_SECONDS
+        self.lock_seconds = lock_seconds or settings.IDEMPOTENCY_LOCK_SECONDS
+
+    def begin(
+        self, user_id: int, key: str, request_hash: str
+    ) -> IdempotencyRecord | None:
+        """
+        Claim ``key`` for a new request.
+
+        Returns None if the caller should go ahead and process the request,
+        otherwise the existing record: either a stored response to replay
+        (``status_code`` set) or a request still in flight. A claim left
+        unfinished for ``lock_seconds`` (its worker was killed) is taken
+        over. The caller must compare ``request_hash`` itself.
+        """
+        record = self.cache.get(user_id, key)
+        if record is not None:
+            return record
+
+        record = self.repo.claim(
+            user_id, key, request_hash, self.ttl_seconds, self.lock_seconds
+        )
+        if record is not None and record.status_code is not None:
+            self.cache.put(record, record.expires_in or 0)
+        return record
+
+    def complete(
+        self,
+        user_id: int,
+        key: str,
+        request_hash: str,
+        work: Callable[[], tuple[int, Any]],
+    ) -> tuple[int, Any]:
+        """
+        Process a request that ``begin`` let through.
+
+        ``work`` performs the request without committing and returns its
+        ``(status_code, body)``, which is stored in the same database
+        transaction as its writes (see ``IdempotencyRepository.complete``).
+        """
+        status_code, body = self.repo.complete(user_id, key, work)
+        self.cache.put(
+            IdempotencyRecord(
+                user_id=user_id,
+                idempotency_key=key,
+                request_hash=request_hash,
+                status_code=status_code,
+                response=body,
+                created_at=datetime.now(UTC),
+                expires_in=self.ttl_seconds,
+            ),
+            self.ttl_seconds,
+        )
+        return status_code, body
@@ -0,0 +1,209 @@
+"""
+Reference data cache.
+
+Statuses, status colors, status translations, transaction types and type
+translations are small lookup tables that almost never change. This module
+keeps a process-wide snapshot of them so that hot endpoints do not spend
+database round-trips on lookup data.
+
+Snapshots are loaded lazily through the regular repositories, expire after
+``settings.REFERENCE_CACHE_TTL_SECONDS`` and can be dropped explicitly with
+``ReferenceDataCache.invalidate``. Each snapshot carries a content-derived
+``version`` that changes whenever the underlying rows change, which HTTP
+handlers use as an ETag.
+"""
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass, field
+
+from app.core.config.settings import settings
+from app.core.metrics import CACHE_LOOKUPS
+from app.domain.models import TransactionStatus, TransactionType
+from app.domain.value_objects import StatusOption, TransactionTypeOption
+from app.repositories.status_repo import StatusRepository
+from app.repositories.transaction_type_repo import TransactionTypeRepository
+
+
+@dataclass(frozen=True)
+class StatusCatalog:
+    """Immutable snapshot of all status metadata."""
+
+    statuses: dict[int, TransactionStatus]
+    colors: dict[int, str]
+    translations: dict[tuple[int, str], str]
+    version: str = ""
+    _options: dict[str, list[StatusOption]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def code(self, status_id: int) -> str | None:
+        status = self.statuses.get(status_id)
+        return status.code if status else None
+
+    def color(self, status_id: int) -> str | None:
+        return self.colors.get(status_id)
+
+    def display_name(self, status_id: int, lang: str) -> str | None:
+        return self.translations.get((status_id, lang))
+
+    def options(self, lang: str) -> list[StatusOption]:
+        """
+        Return all statuses as presentation options for a language.
+
+        The list is built once per language and reused afterwards.
+        """
+        options = self._options.get(lang)
+        if options is None:
+            options = [
+                StatusOption(
+                    status_id=status.status_id,
+                    code=status.code,
+                    display_name=self.translations.get(
+                        (status.status_id, lang), status.code
+                    ),
+                    color=self.colors.get(status.status_id, "#000000"),
+                )
+                for status in self.statuses.values()
+            ]
+            self._options[lang] = options
+        return list(options)
+
+
+@dataclass(frozen=True)
+class TransactionTypeCatalog:
+    """Immutable snapshot of all transaction type metadata."""
+
+    types: dict[int, TransactionType]
+    translations: dict[tuple[int, str], str]
+    version: str = ""
+    _options: dict[str, list[TransactionTypeOption]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def get(self, type_id: int) -> TransactionType | None:
+        return self.types.get(type_id)
+
+    def display_name(self, type_id: int, lang: str) -> str | None:
+        return self.translations.get((type_id, lang))
+
+    def options(self, lang: str) -> list[TransactionTypeOption]:
+        """
+        Return all transaction types as presentation options for a language.
+
+        The list is built once per language and reused afterwards.
+        """
+        options = self._options.get(lang)
+        if options is None:
+            options = [
+                TransactionTypeOption(
+                    type_id=typ.transaction_type_id,
+                    code=typ.code,
+                    display_name=self.translations.get(
+                        (typ.transaction_type_id, lang), typ.code
+                    ),
+                )
+                for typ in self.types.values()
+            ]
+            self._options[lang] = options
+        return list(options)
+
+
+def _fingerprint(*parts: dict) -> str:
+    """Return a short, order-independent hash of the given mappings."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(sorted(part.items())).encode())
+    return digest.hexdigest()[:16]
+
+
+class ReferenceDataCache:
+    """Process-wide, TTL-bound cache of status and transaction type catalogs."""
+
+    def __init__(self, ttl_seconds: float, name: str = "reference_data"):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._statuses: StatusCatalog | None = None
+        self._statuses_loaded_at = 0.0
+        self._types: TransactionTypeCatalog | None = None
+        self._types_loaded_at = 0.0
+        # Approximate counters; incremented without the lock on the fast path
+        self.hits = 0
+        self.misses = 0
+        self._hit_counter = CACHE_LOOKUPS.labels(name, "hit")
+        self._miss_counter = CACHE_LOOKUPS.labels(name, "miss")
+
+    def _is_fresh(self, loaded_at: float) -> bool:
+        return time.monotonic() - loaded_at < self.ttl_seconds
+
+    def statuses(self, status_repo: StatusRepository) -> StatusCatalog:
+        """
+        Return the cached status catalog, loading it through the repository
+        if it is missing or expired.
+        """
+        catalog = self._statuses
+        if catalog is not None and self._is_fresh(self._statuses_loaded_at):
+            self.hits += 1
+            self._hit_counter.inc()
+            return catalog
+
+        self.misses += 1
+        self._miss_counter.inc()
+        with self._lock:
+            if self._statuses is None or not self._is_fresh(self._statuses_loaded_at):
+                statuses = {s.status_id: s for s in status_repo.get_all()}
+                colors = {c.status_id: c.color for c in status_repo.get_all_colors()}
+                translations = {
+                    (t.status_id, t.language_code): t.display_name
+                    for t in status_repo.get_all_translations()
+                }
+                self._statuses = StatusCatalog(
+                    statuses=statuses,
+                    colors=colors,
+                    translations=translations,
+                    version=_fingerprint(statuses, colors, translations),
+                )
+                self._statuses_loaded_at = time.monotonic()
+            return self._statuses
+
+    def transaction_types(
+        self, type_repo: TransactionTypeRepository
+    ) -> TransactionTypeCatalog:
+        """
+        Return the cached transaction type catalog, loading it through the
+        repository if it is missing or expired.
+        """
+        catalog = self._types
+        if catalog is not None and self._is_fresh(self._types_loaded_at):
+            self.hits += 1
+            self._hit_counter.inc()
+            return catalog
+
+        self.misses += 1
+        self._miss_counter.inc()
+        with self._lock:
+            if self._types is None or not self._is_fresh(self._types_loaded_at):
+                types = {t.transaction_type_id: t for t in type_repo.get_all()}
+                translations = {
+                    (t.transaction_type_id, t.language_code): t.display_name
+                    for t in type_repo.get_all_translations()
+                }
+                self._types = TransactionTypeCatalog(
+                    types=types,
+                    translations=translations,
+                    version=_fingerprint(types, translations),
+                )
+                self._types_loaded_at = time.monotonic()
+            return self._types
+
+    def invalidate(self) -> None:
+        """
+        Drop all cached catalogs; the next read reloads them from the database.
+        """
+        with self._lock:
+            self._statuses = None
+            self._types = None
+
+
+reference_cache = ReferenceDataCache(ttl_seconds=settings.REFERENCE_CACHE_TTL_SECONDS)
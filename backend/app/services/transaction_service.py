@@ -7,17 +7,43 @@ and ensures that transactions are enriched with contractor and status
 information for UI consumption.
 """
 
+import csv
+import io
+import json
+from collections.abc import Iterator
+from datetime import datetime
 from decimal import Decimal
+from typing import IO
 
+from app.domain.models import Transaction
 from app.domain.value_objects import (
     StatusOption,
     StatusPresentation,
+    TransactionCursor,
+    TransactionFilter,
     TransactionTypeOption,
 )
 from app.repositories.contractor_repo import ContractorRepository
 from app.repositories.status_repo import StatusRepository
 from app.repositories.transaction_repo import TransactionRepository
 from app.repositories.transaction_type_repo import TransactionTypeRepository
+from app.services.reference_data import (
+    ReferenceDataCache,
+    StatusCatalog,
+    TransactionTypeCatalog,
+    reference_cache,
+)
+
+EXPORT_COLUMNS = (
+    "transaction_id",
+    "created_at",
+    "updated_at",
+    "contractor_from",
+    "contractor_to",
+    "amount",
+    "transaction_type",
+    "status",
+)
 
 
 class TransactionService:
@@ -29,11 +55,13 @@ class TransactionService:
         contractor_repo: ContractorRepository,
         status_repo: StatusRepository,
         type_repo: TransactionTypeRepository,
+        cache: ReferenceDataCache | None = None,
     ):
         self.tx_repo = tx_repo
         self.contractor_repo = contractor_repo
         self.status_repo = status_repo
         self.type_repo = type_repo
+        self.cache = cache or reference_cache
 
     # ---------------------------------------------------------
     # Creation
@@ -46,14 +74,18 @@ class TransactionService:
         amount: Decimal,
         status_id: int,
         transaction_type_id: int,
-    ):
+        commit: bool = True,
+    ) -> Transaction:
         """
-        Create a new transaction.
+        Create a new transaction, with its contractor names resolved.
 
         Domain rules:
         - contractor_from_id must belong to the user.
         - contractor_to_id must belong to the user.
 
+        With ``commit`` False the row is only flushed, so the caller can
+        commit it together with other writes.
+
         Raises
         ------
         ValueError
@@ -61,57 +93,257 @@ class TransactionService:
             equals the client's primary account.
         """
 
-        # Validate sender contractor
-        sender = self.contractor_repo.get_by_id(contractor_from_id)
-        if not sender or sender.user_id != user_id:
-            raise ValueError("Invalid sender contractor for this user.")
-
-        # Validate receiver contractor
-        receiver = self.contractor_repo.get_by_id(contractor_to_id)
-        if not receiver:
-            raise ValueError("Receiver contractor does not exist.")
-        if receiver == sender:
-            raise ValueError("Receiver and Sender must differ.")
-        if receiver.user_id != user_id:
-            raise ValueError("Receiver contractor must belong to the same user.")
-
-        # Validate transaction type
-        tx_type = self.type_repo.get_by_id(transaction_type_id)
-        if not tx_type:
-            raise ValueError("Invalid transaction type.")
+        # Validation reads go to the primary: a replica may not have the
+        # contractor created just before yet
+        with self.contractor_repo.on_primary(), self.type_repo.on_primary():
+            # Validate sender contractor
+            sender = self.contractor_repo.get_by_id(contractor_from_id)
+            if not sender or sender.user_id != user_id:
+                raise ValueError("Invalid sender contractor for this user.")
+
+            # Validate receiver contractor
+            receiver = self.contractor_repo.get_by_id(contractor_to_id)
+            if not receiver:
+                raise ValueError("Receiver contractor does not exist.")
+            if receiver == sender:
+                raise ValueError("Receiver and Sender must differ.")
+            if receiver.user_id != user_id:
+                raise ValueError("Receiver contractor must belong to the same user.")
+
+            # Validate transaction type
+            tx_type = self.type_repo.get_by_id(transaction_type_id)
+            if not tx_type:
+                raise ValueError("Invalid transaction type.")
 
         # Create transaction
-        return self.tx_repo.create(
+        tx = self.tx_repo.create(
             user_id=user_id,
             contractor_from_id=contractor_from_id,
             contractor_to_id=contractor_to_id,
             amount=amount,
             status_id=status_id,
             transaction_type_id=transaction_type_id,
+            commit=commit,
+        )
+        tx.contractor_from_name = sender.name
+        tx.contractor_to_name = receiver.name
+        return tx
+
+    # ---------------------------------------------------------
+    # Bulk creation
+    # ---------------------------------------------------------
+    def create_transactions(
+        self,
+        user_id: int,
+        items: list[dict],
+        atomic: bool = True,
+    ) -> list[dict]:
+        """
+        Validate and create many transactions at once.
+
+        Each item carries the same fields as ``create_transaction`` and is
+        checked against the same domain rules, but contractors, statuses and
+        transaction types are resolved for the whole batch with one query
+        each. Valid rows are inserted with a single multi-row INSERT.
+
+        With ``atomic`` set, nothing is inserted unless every item is valid,
+        and the valid items of a rejected batch report that they were not
+        created. Otherwise valid items are inserted and invalid ones are
+        reported.
+
+        Returns one result per item, in request order, with ``index``,
+        ``transaction_id`` (None when not created) and ``error``.
+        """
+        # Validation reads go to the primary, as in ``create_transaction``
+        with (
+            self.contractor_repo.on_primary(),
+            self.type_repo.on_primary(),
+            self.status_repo.on_primary(),
+        ):
+            contractors = {
+                c.contractor_id: c
+                for c in self.contractor_repo.get_by_ids(
+                    {i["contractor_from_id"] for i in items}
+                    | {i["contractor_to_id"] for i in items}
+                )
+            }
+            type_ids = {
+                t.transaction_type_id
+                for t in self.type_repo.get_by_ids(
+                    {i["transaction_type_id"] for i in items}
+                )
+            }
+            status_ids = {
+                s.status_id
+                for s in self.status_repo.get_by_ids({i["status_id"] for i in items})
+            }
+
+        results: list[dict] = []
+        valid: list[tuple[int, dict]] = []
+        for index, item in enumerate(items):
+            sender = contractors.get(item["contractor_from_id"])
+            receiver = contractors.get(item["contractor_to_id"])
+
+            error = None
+            if not sender or sender.user_id != user_id:
+                error = "Invalid sender contractor for this user."
+            elif not receiver:
+                error = "Receiver contractor does not exist."
+            elif receiver == sender:
+                error = "Receiver and Sender must differ."
+            elif receiver.user_id != user_id:
+                error = "Receiver contractor must belong to the same user."
+            elif item["transaction_type_id"] not in type_ids:
+                error = "Invalid transaction type."
+            elif item["status_id"] not in status_ids:
+                error = "Invalid status."
+
+            results.append({"index": index, "transaction_id": None, "error": error})
+            if error is None:
+                valid.append((index, item))
+
+        if atomic and len(valid) != len(items):
+            for index, _ in valid:
+                results[index]["error"] = "Not created: batch rejected."
+            return results
+        if not valid:
+            return results
+
+        created = self.tx_repo.create_many(
+            [
+                {
+                    "user_id": user_id,
+                    "contractor_from_id": item["contractor_from_id"],
+                    "contractor_to_id": item["contractor_to_id"],
+                    "amount": item["amount"],
+                    "status_id": item["status_id"],
+                    "transaction_type_id": item["transaction_type_id"],
+                }
+                for _, item in valid
+            ]
         )
+        for (index, _), tx in zip(valid, created, strict=True):
+            results[index]["transaction_id"] = tx.transaction_id
+
+        return results
+
+    # ---------------------------------------------------------
+    # Bulk import (COPY)
+    # ---------------------------------------------------------
+    def import_transactions(
+        self, user_id: int, stream: IO, max_reported: int = 1000
+    ) -> dict:
+        """
+        Import a CSV ledger for the user through the COPY pipeline.
+
+        Contractors are matched by name and created when missing; status and
+        type are given by code. Invalid rows are skipped and reported.
+
+        Raises
+        ------
+        ValueError
+            If the CSV is malformed.
+        """
+        summary = self.tx_repo.import_csv(user_id, stream, max_reported)
+        summary["errors"] = [
+            {"row": row, "reason": reason} for row, reason in summary["errors"]
+        ]
+        return summary
 
     # ---------------------------------------------------------
     # Update transaction
     # ---------------------------------------------------------
-    def update_transaction(self, user_id: int, tx_id: int, updates: dict):
-        tx = self.tx_repo.get_by_id(tx_id)
-        if not tx:
-            raise ValueError("Transaction not found.")
+    def update_transaction(
+        self, user_id: int, tx_id: int, updates: dict, lang: str = "en"
+    ) -> dict:
+        """
+        Apply ``updates`` to one of the user's transactions and return its
+        detail view.
 
-        if tx.user_id != user_id:
-            raise ValueError("You do not have permission to modify this transaction.")
+        A status change is checked and applied by a single conditional
+        UPDATE; the detail is built from the returned row and cached
+        reference data.
 
+        Raises
+        ------
+        ValueError
+            If the transaction does not exist or belongs to another user, or
+            the status is invalid.
+        """
         # Normalize: remove None values
         updates = {k: v for k, v in updates.items() if v is not None}
 
-        # Validate status
-        if "status_id" in updates and not self.status_repo.get_by_id(
-            updates["status_id"]
-        ):
+        if "status_id" not in updates:
+            detail = self.get_transaction_details(user_id, [tx_id], lang)[0]
+            if detail is None:
+                raise ValueError(self._not_updatable_reason(tx_id))
+            return detail
+
+        status_id = updates["status_id"]
+        if not self._status_exists(status_id):
             raise ValueError("Invalid status.")
 
-        # Apply updates
-        return self.tx_repo.update(tx_id, updates)
+        txs, _ = self.tx_repo.set_status([tx_id], user_id, status_id)
+        if not txs:
+            raise ValueError(self._not_updatable_reason(tx_id))
+
+        return self.present_transaction(txs[0], lang)
+
+    def set_status_bulk(
+        self,
+        user_id: int,
+        status_id: int,
+        tx_ids: list[int] | None = None,
+        filters: TransactionFilter | None = None,
+        max_rows: int = 10_000,
+    ) -> dict[str, list[int]]:
+        """
+        Move many of the user's transactions, given by ID or by ``filters``,
+        to ``status_id`` in one set-based statement and one commit.
+
+        Returns the IDs that were ``updated``, ``skipped`` (already in the
+        target status) and ``not_found`` (unknown or owned by another user).
+
+        Raises
+        ------
+        ValueError
+            If the status is invalid or ``filters`` matches more than
+            ``max_rows`` transactions.
+        """
+        if not self._status_exists(status_id):
+            raise ValueError("Invalid status.")
+
+        if tx_ids is None:
+            tx_ids = self.tx_repo.get_ids(
+                user_id, filters or TransactionFilter(), max_rows + 1
+            )
+            if len(tx_ids) > max_rows:
+                raise ValueError(
+                    f"The filter matches more than {max_rows} transactions."
+                )
+
+        txs, moved = self.tx_repo.set_status(tx_ids, user_id, status_id)
+        owned = {tx.transaction_id for tx in txs}
+        requested = list(dict.fromkeys(tx_ids))
+        return {
+            "updated": [i for i in requested if i in moved],
+            "skipped": [i for i in requested if i in owned and i not in moved],
+            "not_found": [i for i in requested if i not in owned],
+        }
+
+    def _status_exists(self, status_id: int) -> bool:
+        # A status created since the cache was filled is found in the table
+        statuses = self.cache.statuses(self.status_repo)
+        return (
+            statuses.code(status_id) is not None
+            or self.status_repo.get_by_id(status_id) is not None
+        )
+
+    def _not_updatable_reason(self, tx_id: int) -> str:
+        # Only reached on failure, to tell the two cases apart
+        if self.tx_repo.get_by_id(tx_id) is None:
+            return "Transaction not found."
+        return "You do not have permission to modify this transaction."
 
     # ---------------------------------------------------------
     # Detail view
@@ -125,40 +357,92 @@ class TransactionService:
         if not tx:
             return None
 
-        contractor_from = self.contractor_repo.get_by_id(tx.contractor_from_id)
-        contractor_to = self.contractor_repo.get_by_id(tx.contractor_to_id)
+        contractors = self.contractor_repo.get_by_ids(
+            {tx.contractor_from_id, tx.contractor_to_id}
+        )
+        return self._present_detail(
+            tx, {c.contractor_id: c.name for c in contractors}, lang
+        )
+
+    def present_transaction(self, tx: Transaction, lang: str = "en") -> dict:
+        """
+        Return the detail view of a transaction whose contractor names are
+        already resolved, such as one just written. Costs no query unless
+        the cached reference data is stale.
+        """
+        names = {
+            tx.contractor_from_id: tx.contractor_from_name or "Unknown",
+            tx.contractor_to_id: tx.contractor_to_name or "Unknown",
+        }
+        return self._present_detail(tx, names, lang)
+
+    def get_transaction_details(
+        self,
+        user_id: int,
+        tx_ids: list[int],
+        lang: str = "en",
+    ) -> list[dict | None]:
+        """
+        Return the detail view of each requested transaction of the user, in
+        request order, with None for IDs that do not exist or belong to
+        someone else.
 
-        # Status presentation
-        status = self.status_repo.get_by_id(tx.status_id)
-        translation = self.status_repo.get_translation(tx.status_id, lang)
-        color = self.status_repo.get_color(tx.status_id)
+        Transactions and their contractors are fetched with one query each,
+        statuses and types come from the reference data cache, so the cost
+        does not grow with the number of IDs.
+        """
+        txs = {t.transaction_id: t for t in self.tx_repo.get_by_ids(tx_ids, user_id)}
+        contractors = self.contractor_repo.get_by_ids(
+            {t.contractor_from_id for t in txs.values()}
+            | {t.contractor_to_id for t in txs.values()}
+        )
+        names = {c.contractor_id: c.name for c in contractors}
+
+        details: list[dict | None] = []
+        for tx_id in tx_ids:
+            tx = txs.get(tx_id)
+            details.append(self._present_detail(tx, names, lang) if tx else None)
+        return details
+
+    def _reference_catalogs(
+        self, status_id: int, type_id: int
+    ) -> tuple[StatusCatalog, TransactionTypeCatalog]:
+        statuses = self.cache.statuses(self.status_repo)
+        types = self.cache.transaction_types(self.type_repo)
+        if statuses.code(status_id) is None or types.get(type_id) is None:
+            # Created since the catalogs were cached: reload them once
+            self.cache.invalidate()
+            statuses = self.cache.statuses(self.status_repo)
+            types = self.cache.transaction_types(self.type_repo)
+        return statuses, types
+
+    def _present_detail(
+        self, tx: Transaction, contractor_names: dict[int, str], lang: str
+    ) -> dict:
+        statuses, types = self._reference_catalogs(tx.status_id, tx.transaction_type_id)
+
+        # Status presentation (cached reference data)
         status_option = StatusOption(
             status_id=tx.status_id,
-            code=status.code if status else "unknown",
-            display_name=translation.display_name if translation else "Unknown",
-            color=color.color if color else "gray",
+            code=statuses.code(tx.status_id) or "unknown",
+            display_name=statuses.display_name(tx.status_id, lang) or "Unknown",
+            color=statuses.color(tx.status_id) or "gray",
         )
 
-        # Transaction type presentation
-        tx_type = self.type_repo.get_by_id(tx.transaction_type_id)
-        if not tx_type:
-            raise ValueError("Invalid transaction type.")
-
-        tx_type_translation = self.type_repo.get_translation(
-            tx.transaction_type_id, lang
-        )
+        # Transaction type presentation (cached reference data)
+        tx_type = types.get(tx.transaction_type_id)
+        type_code = tx_type.code if tx_type else "unknown"
         type_option = TransactionTypeOption(
-            type_id=tx_type.transaction_type_id,
-            code=tx_type.code,
-            display_name=tx_type_translation.display_name
-            if tx_type_translation
-            else tx_type.code,
+            type_id=tx.transaction_type_id,
+            code=type_code,
+            display_name=types.display_name(tx.transaction_type_id, lang)
+            or (type_code if tx_type else "Unknown"),
         )
 
         return {
             "transaction_id": tx.transaction_id,
-            "contractor_from": contractor_from.name if contractor_from else "Unknown",
-            "contractor_to": contractor_to.name if contractor_to else "Unknown",
+            "contractor_from": contractor_names.get(tx.contractor_from_id, "Unknown"),
+            "contractor_to": contractor_names.get(tx.contractor_to_id, "Unknown"),
             "amount": tx.amount,
             "transaction_type": {
                 "transaction_type_id": type_option.type_id,
@@ -183,7 +467,9 @@ class TransactionService:
         user_id: int,
         limit: int = 50,
         lang: str = "en",
-    ) -> list[dict]:
+        cursor: str | None = None,
+        filters: TransactionFilter | None = None,
+    ) -> tuple[list[dict], str | None]:
         """
         Retrieve recent transactions in a single batch query and enrich them.
 
@@ -192,61 +478,265 @@ class TransactionService:
         - contractor name
         - amount
         - status label and color
+
+        Contractors, status and type labels are joined in by the repository,
+        so the whole list costs one round-trip regardless of ``limit``.
+
+        Results are keyset-paginated: pass the returned cursor back to fetch
+        the next page. The cursor is None once the last page is reached.
+
+        Raises
+        ------
+        ValueError
+            If the cursor is malformed.
         """
+        before = TransactionCursor.decode(cursor) if cursor else None
 
-        # Fetch contractors for this user
-        contractors = {
-            c.contractor_id: c for c in self.contractor_repo.get_by_user(user_id)
-        }
+        # Fetch one extra row to learn whether another page exists
+        txs = self.tx_repo.get_recent_enriched(
+            user_id=user_id, limit=limit + 1, lang=lang, before=before, filters=filters
+        )
+        has_more = len(txs) > limit
+        txs = txs[:limit]
+
+        next_cursor = (
+            TransactionCursor(
+                created_at=txs[-1].created_at, transaction_id=txs[-1].transaction_id
+            ).encode()
+            if has_more
+            else None
+        )
 
-        # Fetch status colors
-        colors = {c.status_id: c.color for c in self.status_repo.get_all_colors()}
+        items = [
+            {
+                "transaction_id": tx.transaction_id,
+                "contractor_from": tx.contractor_from_name or "Unknown",
+                "contractor_to": tx.contractor_to_name or "Unknown",
+                "amount": tx.amount,
+                "transaction_type": tx.transaction_type_display_name or "Unknown",
+                "status": StatusPresentation(
+                    code=tx.status_code or "unknown",
+                    display_name=tx.status_display_name or "Unknown",
+                    color=tx.status_color or "gray",
+                ),
+                "created_at": tx.created_at,
+            }
+            for tx in txs
+        ]
+        return items, next_cursor
 
-        # Fetch status translations
-        translations = {
-            (t.status_id, t.language_code): t.display_name
-            for t in self.status_repo.get_all_translations()
-        }
+    # ---------------------------------------------------------
+    # Search
+    # ---------------------------------------------------------
+    def search_transactions(
+        self,
+        user_id: int,
+        filters: TransactionFilter,
+        limit: int = 50,
+        lang: str = "en",
+        cursor: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """
+        Like ``list_recent_transactions``, restricted to the transactions
+        matching ``filters``. All criteria go into the same single query.
 
-        # Fetch transaction type translations
-        type_translations = {
-            (t.transaction_type_id, t.language_code): t.display_name
-            for t in self.type_repo.get_all_translations()
-        }
+        Raises
+        ------
+        ValueError
+            If a range is empty or the cursor is malformed.
+        """
+        if (
+            filters.created_from is not None
+            and filters.created_to is not None
+            and filters.created_from > filters.created_to
+        ):
+            raise ValueError("created_from must not be after created_to.")
+        if (
+            filters.amount_min is not None
+            and filters.amount_max is not None
+            and filters.amount_min > filters.amount_max
+        ):
+            raise ValueError("amount_min must not exceed amount_max.")
 
-        # Fetch recent transactions
-        txs = self.tx_repo.get_recent(user_id=user_id, limit=limit)
+        return self.list_recent_transactions(
+            user_id=user_id, limit=limit, lang=lang, cursor=cursor, filters=filters
+        )
 
-        result: list[dict] = []
-        for tx in txs:
-            contractor_from = contractors.get(tx.contractor_from_id)
-            contractor_to = self.contractor_repo.get_by_id(tx.contractor_to_id)
+    # ---------------------------------------------------------
+    # Versions (conditional requests)
+    # ---------------------------------------------------------
+    def get_transaction_version(self, tx_id: int) -> tuple[str, datetime] | None:
+        """
+        Return a version string and the ``updated_at`` of a transaction, or
+        None if it does not exist, without building the detail view.
 
-            status = self.status_repo.get_by_id(tx.status_id)
-            status_label = translations.get((tx.status_id, lang), "Unknown")
-            status_color = colors.get(tx.status_id, "gray")
+        The version changes whenever the transaction or the reference data
+        shown in its detail view changes.
+        """
+        updated_at = self.tx_repo.get_updated_at(tx_id)
+        if updated_at is None:
+            return None
 
-            tx_type_label = type_translations.get(
-                (tx.transaction_type_id, lang),
-                "Unknown",
-            )
+        version = ":".join(
+            [
+                str(tx_id),
+                updated_at.isoformat(),
+                self._reference_version(),
+            ]
+        )
+        return version, updated_at
 
+    def get_recent_version(
+        self,
+        user_id: int,
+        limit: int = 50,
+        lang: str = "en",
+        cursor: str | None = None,
+    ) -> tuple[str, datetime | None]:
+        """
+        Return a version string and the newest ``updated_at`` of the page
+        ``list_recent_transactions`` would return for the same arguments.
+
+        The version changes whenever a row enters, leaves or changes within
+        the page (including the extra row that decides ``next_cursor``) or
+        the reference data changes. Costs one join-free query.
+
+        Raises
+        ------
+        ValueError
+            If the cursor is malformed.
+        """
+        before = TransactionCursor.decode(cursor) if cursor else None
+        count, id_sum, newest = self.tx_repo.get_recent_page_state(
+            user_id=user_id, limit=limit + 1, before=before
+        )
+        version = ":".join(
+            [
+                str(count),
+                str(id_sum),
+                newest.isoformat() if newest else "",
+                cursor or "",
+                str(limit),
+                lang,
+                self._reference_version(),
+            ]
+        )
+        return version, newest
+
+    def _reference_version(self) -> str:
+        statuses = self.cache.statuses(self.status_repo)
+        types = self.cache.transaction_types(self.type_repo)
+        return f"{statuses.version}:{types.version}"
+
+    # ---------------------------------------------------------
+    # Summary (rollups)
+    # ---------------------------------------------------------
+    def get_summary(self, user_id: int, lang: str = "en") -> list[dict]:
+        """
+        Return the user's per-contractor totals from the rollup table,
+        broken down by direction, status and transaction type.
+
+        Reads only pre-aggregated buckets, so the cost does not depend on
+        the number of transactions.
+        """
+        rollups = self.tx_repo.rollups.get_for_user(user_id)
+        contractors = {
+            c.contractor_id: c.name
+            for c in self.contractor_repo.get_by_ids({r.contractor_id for r in rollups})
+        }
+        statuses = self.cache.statuses(self.status_repo)
+        types = self.cache.transaction_types(self.type_repo)
+
+        result: list[dict] = []
+        for r in rollups:
+            status_code = statuses.code(r.status_id) or "unknown"
+            tx_type = types.get(r.transaction_type_id)
+            type_code = tx_type.code if tx_type else "unknown"
             result.append(
                 {
-                    "transaction_id": tx.transaction_id,
-                    "contractor_from": contractor_from.name
-                    if contractor_from
-                    else "Unknown",
-                    "contractor_to": contractor_to.name if contractor_to else "Unknown",
-                    "amount": tx.amount,
-                    "transaction_type": tx_type_label,
-                    "status": StatusPresentation(
-                        code=status.code if status else "unknown",
-                        display_name=status_label,
-                        color=status_color,
-                    ),
-                    "created_at": tx.created_at,
+                    "contractor_id": r.contractor_id,
+                    "contractor": contractors.get(r.contractor_id, "Unknown"),
+                    "direction": r.direction,
+                    "status": {
+                        "status_id": r.status_id,
+                        "code": status_code,
+                        "display_name": statuses.display_name(r.status_id, lang)
+                        or status_code,
+                        "color": statuses.color(r.status_id) or "gray",
+                    },
+                    "transaction_type": {
+                        "transaction_type_id": r.transaction_type_id,
+                        "code": type_code,
+                        "display_name": types.display_name(r.transaction_type_id, lang)
+                        or type_code,
+                    },
+                    "count": r.tx_count,
+                    "total_amount": r.total_amount,
                 }
             )
-
         return result
+
+    # ---------------------------------------------------------
+    # Export (streaming)
+    # ---------------------------------------------------------
+    def export_transactions(
+        self,
+        user_id: int,
+        fmt: str = "csv",
+        chunk_size: int = 1000,
+    ) -> Iterator[str]:
+        """
+        Yield the user's full transaction history as CSV or NDJSON text,
+        one chunk of rows at a time.
+
+        Rows are read from a server-side cursor, so only one chunk is held
+        in memory at any point.
+
+        Raises
+        ------
+        ValueError
+            If the format is not supported.
+        """
+        if fmt not in ("csv", "ndjson"):
+            raise ValueError("Unsupported export format.")
+
+        return self._iter_export(user_id, fmt, chunk_size)
+
+    def _iter_export(self, user_id: int, fmt: str, chunk_size: int) -> Iterator[str]:
+        chunks = self.tx_repo.iter_export_rows(user_id, chunk_size)
+
+        if fmt == "ndjson":
+            for rows in chunks:
+                yield "".join(
+                    json.dumps(
+                        dict(zip(EXPORT_COLUMNS, _export_values(r), strict=True))
+                    )
+                    + "\n"
+                    for r in rows
+                )
+            return
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        yield buffer.getvalue()
+
+        for rows in chunks:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(_export_values(r) for r in rows)
+            yield buffer.getvalue()
+
+
+def _export_values(row) -> tuple:
+    """Render one export row as JSON/CSV-safe values in EXPORT_COLUMNS order."""
+    return (
+        row.transaction_id,
+        row.created_at.isoformat(),
+        row.updated_at.isoformat(),
+        row.contractor_from,
+        row.contractor_to,
+        str(row.amount),
+        row.transaction_type,
+        row.status,
+    )
@@ -0,0 +1 @@
+"""Service-level micro-benchmarks run against a local PostgreSQL database."""
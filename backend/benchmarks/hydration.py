@@ -0,0 +1,181 @@
+"""
+Benchmark the per-row cost of turning query results into domain objects.
+
+Usage::
+
+    python -m benchmarks.hydration [--rows 100 1000 10000] [--iterations 20]
+                                   [--output hydration.json]
+
+For ``get_recent`` and ``get_for_contractors``, the repository methods (Core
+SELECT of the domain columns, ``Transaction(*row)``) are timed against the
+ORM path they replaced: ``session.query(TransactionORM)`` and ``_to_domain``
+on every instance. Both paths run the same SQL shape on a fresh session per
+call, so the difference is hydration. Results are reported as microseconds
+per row (median call time divided by the rows returned).
+
+The benchmark user of ``benchmarks.run`` is topped up to each row count in
+turn and removed at the end unless ``--keep-data`` is given.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine, desc
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config.settings import settings
+from app.db.models import TransactionORM
+from app.domain.models import Transaction
+from app.repositories.transaction_repo import TransactionRepository
+from benchmarks.run import drop_fixture, ensure_fixture, top_up_transactions
+
+
+# -------------------------
+# Read paths
+# -------------------------
+def orm_get_recent(db: Session, user_id: int, limit: int) -> list[Transaction]:
+    repo = TransactionRepository(db)
+    rows = (
+        db.query(TransactionORM)
+        .filter(TransactionORM.user_id == user_id)
+        .order_by(desc(TransactionORM.created_at))
+        .limit(limit)
+        .all()
+    )
+    return [repo._to_domain(r) for r in rows]
+
+
+def orm_get_for_contractors(
+    db: Session, contractor_ids: list[int]
+) -> list[Transaction]:
+    repo = TransactionRepository(db)
+    rows = (
+        db.query(TransactionORM)
+        .filter(
+            (TransactionORM.contractor_from_id.in_(contractor_ids))
+            | (TransactionORM.contractor_to_id.in_(contractor_ids))
+        )
+        .order_by(desc(TransactionORM.created_at))
+        .all()
+    )
+    return [repo._to_domain(r) for r in rows]
+
+
+def paths(
+    fixture: dict[str, Any], rows: int
+) -> dict[str, dict[str, Callable[[Session], list[Transaction]]]]:
+    """Map each method to its ORM and Core implementation for ``rows`` rows."""
+    uid = fixture["user_id"]
+    # Every benchmark transaction is between two of these contractors, so
+    # with the user topped up to exactly ``rows`` all of them are returned
+    contractors = fixture["contractor_ids"]
+    return {
+        "get_recent": {
+            "orm": lambda db: orm_get_recent(db, uid, rows),
+            "core": lambda db: TransactionRepository(db).get_recent(uid, rows),
+        },
+        "get_for_contractors": {
+            "orm": lambda db: orm_get_for_contractors(db, contractors),
+            "core": lambda db: TransactionRepository(db).get_for_contractors(
+                contractors
+            ),
+        },
+    }
+
+
+def time_per_row(
+    factory: sessionmaker,
+    fn: Callable[[Session], list[Transaction]],
+    iterations: int,
+) -> dict[str, Any]:
+    """Median call time of ``fn`` and its cost per returned row."""
+    with factory() as db:
+        fn(db)
+
+    timings: list[float] = []
+    returned = 0
+    for _ in range(iterations):
+        with factory() as db:
+            start = time.perf_counter()
+            returned = len(fn(db))
+            timings.append(time.perf_counter() - start)
+
+    median = statistics.median(timings)
+    return {
+        "rows": returned,
+        "p50_ms": round(median * 1000, 3),
+        "us_per_row": round(median * 1e6 / max(returned, 1), 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[100, 1_000, 10_000],
+        help="result sizes to measure at",
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument(
+        "--keep-data",
+        action="store_true",
+        help="keep the benchmark user and its transactions afterwards",
+    )
+    parser.add_argument(
+        "--test-db",
+        action="store_true",
+        help="target DATABASE_TEST_URL instead of DATABASE_URL",
+    )
+    args = parser.parse_args(argv)
+
+    url = settings.DATABASE_TEST_URL if args.test_db else settings.DATABASE_URL
+    engine = create_engine(url)
+    factory = sessionmaker(autoflush=False, bind=engine)
+
+    results: dict[str, Any] = {}
+    with factory() as db:
+        fixture = ensure_fixture(db)
+    try:
+        for rows in sorted(args.rows):
+            with factory() as db:
+                top_up_transactions(db, fixture, rows)
+
+            for method, impls in paths(fixture, rows).items():
+                measured = {
+                    name: time_per_row(factory, fn, args.iterations)
+                    for name, fn in impls.items()
+                }
+                measured["speedup"] = round(
+                    measured["orm"]["us_per_row"]
+                    / max(measured["core"]["us_per_row"], 1e-9),
+                    2,
+                )
+                results.setdefault(str(rows), {})[method] = measured
+                print(
+                    f"{method:<20} rows={measured['core']['rows']:>7}  "
+                    f"orm {measured['orm']['us_per_row']:>7.2f} us/row  "
+                    f"core {measured['core']['us_per_row']:>7.2f} us/row  "
+                    f"({measured['speedup']}x)"
+                )
+    finally:
+        if not args.keep_data:
+            with factory() as db:
+                drop_fixture(db, fixture)
+        engine.dispose()
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,458 @@
+"""
+Benchmark the hot service calls at realistic data volumes.
+
+Usage::
+
+    python -m benchmarks.run [--sizes 10000 1000000 10000000] [--iterations 50]
+                             [--output results.json] [--baseline baseline.json]
+
+For every size, a dedicated benchmark user is topped up to that many
+transactions (set-based INSERT ... SELECT, then a rollup rebuild and
+ANALYZE). Then each operation is timed and the SQL statements it issues
+are counted. Results are written as JSON. With ``--baseline`` they are
+compared against a previous run. The exit status is 1 if any p50 latency
+grew by more than ``--threshold`` (and by at least ``--min-delta-ms``) or
+any query count grew at all.
+
+The benchmark user and its data are removed at the end unless
+``--keep-data`` is given.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config.settings import settings
+from app.core.security import hash_password
+from app.db.session import ThreadpoolSessionRunner
+from app.domain.value_objects import TransactionFilter
+from app.repositories.contractor_repo import ContractorRepository
+from app.repositories.rollup_repo import TransactionRollupRepository
+from app.repositories.status_repo import StatusRepository
+from app.repositories.transaction_repo import TransactionRepository
+from app.repositories.transaction_type_repo import TransactionTypeRepository
+from app.services.auth_service import AuthService
+from app.services.reference_data import reference_cache
+from app.services.status_service import StatusService
+from app.services.transaction_service import TransactionService
+from app.services.transaction_type_service import TransactionTypeService
+
+BENCH_USERNAME = "__bench__"
+BENCH_PASSWORD = "bench-password"
+BENCH_CONTRACTORS = 50
+
+
+# -------------------------
+# Query counting
+# -------------------------
+class QueryCounter:
+    """Counts statements executed on an engine."""
+
+    def __init__(self, engine: Engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *_: Any) -> None:
+        self.count += 1
+
+    @contextmanager
+    def measure(self) -> Iterator[list[int]]:
+        """Yield a one-element list that receives the statement count."""
+        result = [0]
+        start = self.count
+        try:
+            yield result
+        finally:
+            result[0] = self.count - start
+
+
+# -------------------------
+# Data setup
+# -------------------------
+def ensure_fixture(db: Session) -> dict[str, Any]:
+    """
+    Create (or reuse) the benchmark user with contractors, one status and one
+    transaction type, and return their ids.
+    """
+    user_id = db.execute(
+        text("SELECT user_id FROM users WHERE username = :u"), {"u": BENCH_USERNAME}
+    ).scalar()
+    if user_id is None:
+        user_id = db.execute(
+            text(
+                "INSERT INTO users (username, password_hash) "
+                "VALUES (:u, :h) RETURNING user_id"
+            ),
+            {"u": BENCH_USERNAME, "h": hash_password(BENCH_PASSWORD)},
+        ).scalar_one()
+
+    contractor_ids = (
+        db.execute(
+            text("SELECT contractor_id FROM contractors WHERE user_id = :uid"),
+            {"uid": user_id},
+        )
+        .scalars()
+        .all()
+    )
+    if not contractor_ids:
+        contractor_ids = (
+            db.execute(
+                text("""
+                INSERT INTO contractors (user_id, name)
+                SELECT :uid, 'Bench contractor ' || g
+                FROM generate_series(1, :n) AS g
+                RETURNING contractor_id
+            """),
+                {"uid": user_id, "n": BENCH_CONTRACTORS},
+            )
+            .scalars()
+            .all()
+        )
+
+    status_id = (
+        db.execute(text("SELECT min(status_id) FROM transaction_statuses")).scalar()
+        or db.execute(
+            text(
+                "INSERT INTO transaction_statuses (code) VALUES ('BENCH') "
+                "RETURNING status_id"
+            )
+        ).scalar_one()
+    )
+    type_id = (
+        db.execute(
+            text("SELECT min(transaction_type_id) FROM transaction_types")
+        ).scalar()
+        or db.execute(
+            text(
+                "INSERT INTO transaction_types (code) VALUES ('BENCH') "
+                "RETURNING transaction_type_id"
+            )
+        ).scalar_one()
+    )
+
+    db.commit()
+    return {
+        "user_id": user_id,
+        "contractor_ids": list(contractor_ids),
+        "status_id": status_id,
+        "type_id": type_id,
+    }
+
+
+def top_up_transactions(db: Session, fixture: dict[str, Any], size: int) -> None:
+    """Insert transactions until the benchmark user owns ``size`` of them."""
+    existing = db.execute(
+        text("SELECT count(*) FROM transactions WHERE user_id = :uid"),
+        {"uid": fixture["user_id"]},
+    ).scalar_one()
+    missing = size - existing
+    if missing <= 0:
+        return
+
+    contractors = fixture["contractor_ids"]
+    db.execute(
+        text("""
+        INSERT INTO transactions (user_id, contractor_from_id, contractor_to_id,
+                                  amount, transaction_type_id, status_id,
+                                  created_at, updated_at)
+        SELECT :uid,
+               (:contractors)[1 + g % cardinality(:contractors)],
+               (:contractors)[1 + (g + 1) % cardinality(:contractors)],
+               round((random() * 1000)::numeric, 2),
+               :tid, :sid,
+               now() - g * interval '1 minute',
+               now() - g * interval '1 minute'
+        FROM generate_series(:start, :stop) AS g
+    """),
+        {
+            "uid": fixture["user_id"],
+            "contractors": contractors,
+            "tid": fixture["type_id"],
+            "sid": fixture["status_id"],
+            "start": existing + 1,
+            "stop": size,
+        },
+    )
+    db.commit()
+    TransactionRollupRepository(db).rebuild(user_id=fixture["user_id"])
+    db.execute(text("ANALYZE transactions"))
+    db.commit()
+
+
+def drop_fixture(db: Session, fixture: dict[str, Any]) -> None:
+    params = {"uid": fixture["user_id"]}
+    for table in ("transaction_rollups", "transactions", "contractors"):
+        db.execute(text(f"DELETE FROM {table} WHERE user_id = :uid"), params)
+    db.execute(text("DELETE FROM users WHERE user_id = :uid"), params)
+    db.commit()
+
+
+# -------------------------
+# Operations
+# -------------------------
+def build_transaction_service(db: Session) -> TransactionService:
+    return TransactionService(
+        tx_repo=TransactionRepository(db),
+        contractor_repo=ContractorRepository(db),
+        status_repo=StatusRepository(db),
+        type_repo=TransactionTypeRepository(db),
+    )
+
+
+def operations(
+    fixture: dict[str, Any], rng: random.Random
+) -> dict[str, Callable[[Session], Any]]:
+    """Map benchmark names to callables that run one operation on a session."""
+    uid = fixture["user_id"]
+    contractors = fixture["contractor_ids"]
+
+    def create_transaction(db: Session) -> Any:
+        sender, receiver = rng.sample(contractors, 2)
+        return build_transaction_service(db).create_transaction(
+            user_id=uid,
+            contractor_from_id=sender,
+            contractor_to_id=receiver,
+            amount=Decimal("12.34"),
+            status_id=fixture["status_id"],
+            transaction_type_id=fixture["type_id"],
+        )
+
+    def get_transaction_detail(db: Session) -> Any:
+        tx_id = rng.randint(fixture["min_tx_id"], fixture["max_tx_id"])
+        return build_transaction_service(db).get_transaction_detail(tx_id)
+
+    def list_recent_transactions(db: Session) -> Any:
+        return build_transaction_service(db).list_recent_transactions(uid, limit=50)
+
+    def search_by_contractor(db: Session) -> Any:
+        filters = TransactionFilter(contractor_from_id=rng.choice(contractors))
+        return build_transaction_service(db).search_transactions(uid, filters)
+
+    def search_by_contractor_name(db: Session) -> Any:
+        filters = TransactionFilter(contractor_name=f"contractor {rng.randint(1, 9)}")
+        return build_transaction_service(db).search_transactions(uid, filters)
+
+    def search_by_date_and_amount(db: Session) -> Any:
+        filters = TransactionFilter(
+            created_from=datetime.now() - timedelta(days=30),
+            amount_min=Decimal("100"),
+            amount_max=Decimal("200"),
+        )
+        return build_transaction_service(db).search_transactions(uid, filters)
+
+    def status_options(db: Session) -> Any:
+        return StatusService(StatusRepository(db)).get_all_options("en")
+
+    def transaction_type_options(db: Session) -> Any:
+        return TransactionTypeService(TransactionTypeRepository(db)).get_all_options(
+            "en"
+        )
+
+    def login(db: Session) -> Any:
+        service = AuthService(ThreadpoolSessionRunner(db))
+        return asyncio.run(service.authenticate(BENCH_USERNAME, BENCH_PASSWORD))
+
+    return {
+        "create_transaction": create_transaction,
+        "get_transaction_detail": get_transaction_detail,
+        "list_recent_transactions": list_recent_transactions,
+        "search_by_contractor": search_by_contractor,
+        "search_by_contractor_name": search_by_contractor_name,
+        "search_by_date_and_amount": search_by_date_and_amount,
+        "status_options": status_options,
+        "transaction_type_options": transaction_type_options,
+        "login": login,
+    }
+
+
+def run_operation(
+    factory: sessionmaker,
+    counter: QueryCounter,
+    fn: Callable[[Session], Any],
+    iterations: int,
+) -> dict[str, Any]:
+    """Time ``fn`` on a fresh session per call, after one warm-up call."""
+    with factory() as db:
+        fn(db)
+
+    timings: list[float] = []
+    queries: list[int] = []
+    for _ in range(iterations):
+        with factory() as db, counter.measure() as count:
+            start = time.perf_counter()
+            fn(db)
+            timings.append((time.perf_counter() - start) * 1000)
+        queries.append(count[0])
+
+    timings.sort()
+    return {
+        "iterations": iterations,
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[max(0, int(len(timings) * 0.95) - 1)], 3),
+        "p99_ms": round(timings[max(0, int(len(timings) * 0.99) - 1)], 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "min_ms": round(timings[0], 3),
+        "max_ms": round(timings[-1], 3),
+        "queries_per_call": max(queries),
+    }
+
+
+# -------------------------
+# Baseline comparison
+# -------------------------
+def compare(
+    results: dict, baseline: dict, threshold: float, min_delta_ms: float
+) -> list[str]:
+    """
+    Return a line per regression: p50 slower than ``threshold`` times the
+    baseline and by at least ``min_delta_ms``, or more queries per call.
+    """
+    regressions = []
+    for size, ops in results["results"].items():
+        for name, current in ops.items():
+            previous = baseline.get("results", {}).get(size, {}).get(name)
+            if previous is None:
+                continue
+            ratio = current["p50_ms"] / previous["p50_ms"] if previous["p50_ms"] else 1
+            delta = current["p50_ms"] - previous["p50_ms"]
+            if ratio > threshold and delta >= min_delta_ms:
+                regressions.append(
+                    f"{name} @ {size}: p50 {previous['p50_ms']} -> "
+                    f"{current['p50_ms']} ms ({ratio:.2f}x)"
+                )
+            if current["queries_per_call"] > previous["queries_per_call"]:
+                regressions.append(
+                    f"{name} @ {size}: queries {previous['queries_per_call']} -> "
+                    f"{current['queries_per_call']}"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000],
+        help="transaction counts to benchmark at, e.g. 10000 1000000 10000000",
+    )
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--only", nargs="+", help="run only these operations")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="compare against this JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="p50 ratio above which a result counts as a regression",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=1.0,
+        help="ignore p50 slowdowns smaller than this (timer noise)",
+    )
+    parser.add_argument(
+        "--keep-data",
+        action="store_true",
+        help="keep the benchmark user and its transactions afterwards",
+    )
+    parser.add_argument(
+        "--test-db",
+        action="store_true",
+        help="target DATABASE_TEST_URL instead of DATABASE_URL",
+    )
+    args = parser.parse_args(argv)
+
+    url = settings.DATABASE_TEST_URL if args.test_db else settings.DATABASE_URL
+    engine = create_engine(url)
+    factory = sessionmaker(autoflush=False, bind=engine)
+    counter = QueryCounter(engine)
+    rng = random.Random(args.seed)
+
+    results: dict[str, Any] = {
+        "meta": {
+            "started_at": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "iterations": args.iterations,
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+
+    with factory() as db:
+        fixture = ensure_fixture(db)
+
+    try:
+        for size in sorted(args.sizes):
+            print(f"Seeding {size} transactions...", file=sys.stderr)
+            with factory() as db:
+                top_up_transactions(db, fixture, size)
+                fixture["min_tx_id"], fixture["max_tx_id"] = db.execute(
+                    text(
+                        "SELECT min(transaction_id), max(transaction_id) "
+                        "FROM transactions WHERE user_id = :uid"
+                    ),
+                    {"uid": fixture["user_id"]},
+                ).one()
+            reference_cache.invalidate()
+
+            size_results: dict[str, Any] = {}
+            for name, fn in operations(fixture, rng).items():
+                if args.only and name not in args.only:
+                    continue
+                size_results[name] = run_operation(
+                    factory, counter, fn, args.iterations
+                )
+                r = size_results[name]
+                print(
+                    f"{size:>10} {name:<26} p50 {r['p50_ms']:>9.3f} ms  "
+                    f"p95 {r['p95_ms']:>9.3f} ms  queries {r['queries_per_call']}",
+                    file=sys.stderr,
+                )
+            results["results"][str(size)] = size_results
+    finally:
+        if not args.keep_data:
+            with factory() as db:
+                drop_fixture(db, fixture)
+        engine.dispose()
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        regressions = compare(
+            results,
+            json.loads(args.baseline.read_text()),
+            args.threshold,
+            args.min_delta_ms,
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
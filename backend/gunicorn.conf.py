@@ -0,0 +1,21 @@
+"""
+Gunicorn settings for running several uvicorn workers::
+
+    PROMETHEUS_MULTIPROC_DIR=/tmp/prometheus \
+        gunicorn app.main:app -c gunicorn.conf.py --workers 4
+
+See ``app.core.metrics`` for how metrics of the workers are aggregated.
+"""
+
+import os
+
+from prometheus_client import multiprocess
+
+bind = "0.0.0.0:8000"
+worker_class = "uvicorn.workers.UvicornWorker"
+
+
+def child_exit(_server, worker):
+    # Stop summing the exited worker's livesum gauges
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(worker.pid)
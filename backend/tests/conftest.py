@@ -4,8 +4,11 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config.settings import settings
+from app.core.security import token_cache
 from app.db.session import Base, get_db
 from app.main import app
+from app.services.idempotency import idempotency_cache
+from app.services.reference_data import reference_cache
 
 DATABASE_TEST_URL = settings.DATABASE_TEST_URL
 
@@ -52,6 +55,36 @@ def override_get_db(db_session):
     app.dependency_overrides.pop(get_db, None)
 
 
+# ----------------------------------------
+# Start every test with an empty reference data cache
+# ----------------------------------------
+@pytest.fixture(autouse=True)
+def reset_reference_cache():
+    reference_cache.invalidate()
+    yield
+    reference_cache.invalidate()
+
+
+# ----------------------------------------
+# Start every test with an empty verified-token cache
+# ----------------------------------------
+@pytest.fixture(autouse=True)
+def reset_token_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+# ----------------------------------------
+# Start every test with an empty idempotency cache
+# ----------------------------------------
+@pytest.fixture(autouse=True)
+def reset_idempotency_cache():
+    idempotency_cache.clear()
+    yield
+    idempotency_cache.clear()
+
+
 # ----------------------------------------
 # FastAPI TestClient
 # ----------------------------------------
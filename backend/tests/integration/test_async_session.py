@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.config.settings import settings
+from app.db.session import AsyncSessionRunner, to_async_url
+from app.repositories.status_repo import StatusRepository
+
+pytest.importorskip("asyncpg")
+
+
+def test_async_runner_executes_sync_repositories():
+    async def load_status_codes():
+        engine = create_async_engine(to_async_url(settings.DATABASE_TEST_URL))
+        try:
+            async with AsyncSession(engine) as db:
+                statuses = await AsyncSessionRunner(db).run(
+                    lambda s: StatusRepository(s).get_all()
+                )
+        finally:
+            await engine.dispose()
+        return [s.code for s in statuses]
+
+    codes = asyncio.run(load_status_codes())
+
+    assert isinstance(codes, list)
+    assert all(isinstance(code, str) for code in codes)
+
+
+def test_to_async_url_swaps_driver():
+    url = to_async_url("postgresql+psycopg2://user:secret@db:5432/payments")
+    assert url == "postgresql+asyncpg://user:secret@db:5432/payments"
@@ -1,5 +1,11 @@
+from fastapi.testclient import TestClient
+from passlib.hash import bcrypt
 from sqlalchemy import text
 
+from app.core.config.settings import settings
+from app.core.security import password_hasher
+from app.main import app
+
 
 def test_login_success(client, db_session):
     db_session.execute(
@@ -23,3 +29,32 @@ def test_login_failure(client):
         "/auth/login", data={"username": "nosuchuser", "password": "wrong"}
     )
     assert response.status_code == 401
+
+
+def test_login_rehashes_outdated_password_hash(client, db_session):
+    weak_hash = bcrypt.using(rounds=4).hash("s3cre7")
+    db_session.execute(
+        text("INSERT INTO users (username, password_hash) VALUES ('weak', :h)"),
+        {"h": weak_hash},
+    )
+    db_session.commit()
+
+    response = client.post(
+        "/auth/login", data={"username": "weak", "password": "s3cre7"}
+    )
+    assert response.status_code == 200
+
+    stored = db_session.execute(
+        text("SELECT password_hash FROM users WHERE username = 'weak'")
+    ).scalar_one()
+    assert stored != weak_hash
+    assert stored.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+
+
+def test_app_shutdown_joins_password_hash_workers(monkeypatch):
+    calls = []
+    monkeypatch.setattr(password_hasher, "shutdown", lambda: calls.append(1))
+
+    with TestClient(app):
+        assert calls == []
+    assert calls == [1]
@@ -2,3 +2,37 @@ def test_health(client):
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_pool_stats(client):
+    response = client.get("/health/pool")
+    assert response.status_code == 200
+    sync_pool = response.json()["sync"]
+    assert sync_pool["pool_class"] == "InstrumentedQueuePool"
+    assert {"checked_out", "overflow", "checkout_timeouts", "avg_wait_ms"} <= set(
+        sync_pool
+    )
+
+
+def test_metrics_exposes_route_latency_and_runtime_gauges(client):
+    client.get("/health")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/health",status="200"}'
+        in body
+    )
+    assert 'db_pool_connections{engine="primary",state="checked_out"}' in body
+    assert 'app_cache_lookups_total{cache="reference_data",result="miss"}' in body
+
+
+def test_metrics_label_unmatched_paths_as_one_route(client):
+    assert client.get("/nope/1").status_code == 404
+    assert client.get("/nope/2").status_code == 404
+    body = client.get("/metrics").text
+
+    assert 'route="<unmatched>",status="404"' in body
+    assert "/nope/" not in body
@@ -0,0 +1,48 @@
+from sqlalchemy import text
+
+from app.core.config.settings import settings
+from app.db.slow_queries import _explain, capture_slow_queries, slow_query_log
+from app.repositories.status_repo import StatusRepository
+
+
+def test_slow_queries_are_captured_with_call_site_and_plan(
+    client, db_session, test_user, auth_token, monkeypatch
+):
+    capture_slow_queries(db_session.get_bind().engine)
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0.0)
+    monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN_SAMPLE_RATE", 1.0)
+    slow_query_log.clear()
+
+    StatusRepository(db_session).get_by_id(123)
+    # Not from a @read_only method: captured, but never re-run
+    db_session.execute(text("SELECT 1 AS not_explained"))
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 1e9)
+
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    assert client.get("/admin/slow-queries", headers=headers).status_code == 403
+
+    monkeypatch.setattr(settings, "ADMIN_USER_IDS", [test_user["user_id"]])
+    entries = client.get("/admin/slow-queries", headers=headers).json()
+    slow_query_log.clear()
+
+    assert entries[0]["plan"] is None
+    assert "not_explained" in entries[0]["statement"]
+
+    entry = entries[1]
+    assert entry["call_site"] == "StatusRepository.get_by_id"
+    assert "transaction_statuses" in entry["statement"]
+    assert 123 in entry["parameters"].values()
+    assert "actual time" in entry["plan"]
+
+
+def test_explain_rolls_back_side_effects_of_the_statement(db_session):
+    plan = _explain(
+        db_session.connection(),
+        "SELECT ensure_transaction_partition(%(month)s)",
+        {"month": "2001-06-01"},
+    )
+    assert "actual time" in plan
+    assert (
+        db_session.execute(text("SELECT to_regclass('transactions_2001_06')")).scalar()
+        is None
+    )
@@ -1,5 +1,22 @@
+import json
+import logging
+from dataclasses import fields
+from datetime import date
+from decimal import Decimal
+
+import pytest
 from sqlalchemy import text
 
+from app.core.config.settings import settings
+from app.db.instrumentation import instrument_engine
+from app.db.partitions import ensure_monthly_partitions, month_starts, months_in_default
+from app.domain.models import Transaction
+from app.repositories.idempotency_repo import IdempotencyRepository
+from app.repositories.rollup_repo import TransactionRollupRepository
+from app.repositories.transaction_repo import TRANSACTION_COLUMNS, TransactionRepository
+from app.services.idempotency import idempotency_cache
+from app.services.transaction_service import TransactionService
+
 
 def test_create_transaction(client, db_session, auth_token):
     auth_user_id = db_session.execute(
@@ -61,6 +78,49 @@ def test_create_transaction(client, db_session, auth_token):
     assert body["amount"] == "50.00"
 
 
+def test_detail_resolves_reference_data_created_after_cache_fill(
+    client, db_session, tx_refs, auth_token
+):
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    assert client.get("/transactions/recent", headers=headers).status_code == 200
+
+    status_id = db_session.execute(
+        text("""
+        INSERT INTO transaction_statuses (code)
+        VALUES ('ON_HOLD')
+        RETURNING status_id
+    """)
+    ).scalar_one()
+    type_id = db_session.execute(
+        text("""
+        INSERT INTO transaction_types (code)
+        VALUES ('FEE')
+        RETURNING transaction_type_id
+    """)
+    ).scalar_one()
+    db_session.commit()
+
+    response = client.post(
+        "/transactions/create",
+        json={
+            "contractor_from_id": tx_refs["sender"],
+            "contractor_to_id": tx_refs["receiver"],
+            "amount": "5.00",
+            "status_id": status_id,
+            "transaction_type_id": type_id,
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["transaction_type"]["code"] == "FEE"
+    assert body["status"]["code"] == "ON_HOLD"
+
+    detail = client.get(f"/transactions/{body['transaction_id']}", headers=headers)
+    assert detail.status_code == 200
+    assert detail.json()["transaction_type"]["code"] == "FEE"
+
+
 def test_create_transaction_unauthorized(client):
     response = client.post(
         "/transactions/create",
@@ -73,3 +133,876 @@ def test_create_transaction_unauthorized(client):
         },
     )
     assert response.status_code == 401
+
+
+@pytest.fixture
+def tx_refs(db_session, test_user):
+    """Two contractors of the test user plus a translated status and type."""
+    uid = test_user["user_id"]
+    sender_id, receiver_id = (
+        db_session.execute(
+            text("""
+            INSERT INTO contractors (user_id, name)
+            VALUES (:uid, 'Sender'), (:uid, 'Receiver')
+            RETURNING contractor_id
+        """),
+            {"uid": uid},
+        )
+        .scalars()
+        .all()
+    )
+    status_id = db_session.execute(
+        text("""
+        INSERT INTO transaction_statuses (code)
+        VALUES ('PENDING')
+        RETURNING status_id
+    """)
+    ).scalar_one()
+    db_session.execute(
+        text("""
+        INSERT INTO transaction_status_colors (status_id, color) VALUES (:sid, 'blue');
+        INSERT INTO transaction_status_translations
+            (status_id, language_code, display_name)
+        VALUES (:sid, 'en', 'Pending')
+    """),
+        {"sid": status_id},
+    )
+    type_id = db_session.execute(
+        text("""
+        INSERT INTO transaction_types (code)
+        VALUES ('REFUND')
+        RETURNING transaction_type_id
+    """)
+    ).scalar_one()
+    db_session.execute(
+        text("""
+        INSERT INTO transaction_type_translations
+            (transaction_type_id, language_code, display_name)
+        VALUES (:tid, 'en', 'Refund')
+    """),
+        {"tid": type_id},
+    )
+    db_session.commit()
+    return {
+        "uid": uid,
+        "sender": sender_id,
+        "receiver": receiver_id,
+        "status": status_id,
+        "type": type_id,
+    }
+
+
+def test_list_recent_transactions_enriched_and_paginated(
+    client, db_session, tx_refs, auth_token
+):
+    db_session.execute(
+        text("""
+        INSERT INTO transactions (user_id, contractor_from_id, contractor_to_id,
+                                  amount, transaction_type_id, status_id)
+        SELECT :uid, :sender, :receiver, 10 * g, :tid, :sid
+        FROM generate_series(1, 3) AS g
+    """),
+        {
+            "uid": tx_refs["uid"],
+            "sender": tx_refs["sender"],
+            "receiver": tx_refs["receiver"],
+            "tid": tx_refs["type"],
+            "sid": tx_refs["status"],
+        },
+    )
+    db_session.commit()
+
+    response = client.get(
+        "/transactions/recent?limit=2",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert len(items) == 2
+    assert items[0]["contractor_from"] == "Sender"
+    assert items[0]["contractor_to"] == "Receiver"
+    assert items[0]["transaction_type"] == "Refund"
+    assert items[0]["status"] == {
+        "code": "PENDING",
+        "display_name": "Pending",
+        "color": "blue",
+    }
+
+    body = response.json()
+    assert body["next_cursor"] is not None
+
+    response = client.get(
+        "/transactions/recent",
+        params={"limit": 2, "cursor": body["next_cursor"]},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 200
+    page = response.json()
+    assert len(page["items"]) == 1
+    assert page["next_cursor"] is None
+    assert page["items"][0]["amount"] == "10.00"
+
+
+def test_list_recent_transactions_invalid_cursor(client, auth_token):
+    response = client.get(
+        "/transactions/recent",
+        params={"cursor": "not-a-cursor"},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 400
+
+
+def test_recent_and_detail_answer_304_for_matching_etag(client, tx_refs, auth_token):
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    item = {
+        "contractor_from_id": tx_refs["sender"],
+        "contractor_to_id": tx_refs["receiver"],
+        "amount": "5.00",
+        "status_id": tx_refs["status"],
+        "transaction_type_id": tx_refs["type"],
+    }
+    tx_id = client.post("/transactions/create", json=item, headers=headers).json()[
+        "transaction_id"
+    ]
+
+    for url in (f"/transactions/{tx_id}", "/transactions/recent"):
+        first = client.get(url, headers=headers)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert "last-modified" in first.headers
+
+        cached = client.get(url, headers={**headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+    # A new transaction changes the first page
+    client.post("/transactions/create", json=item, headers=headers)
+    response = client.get(
+        "/transactions/recent", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(response.json()["items"]) == 2
+
+
+@pytest.mark.usefixtures("tx_refs")
+def test_reference_lists_answer_304_for_matching_etag(client):
+    for url in ("/statuses/", "/transaction-types/"):
+        first = client.get(url)
+        assert first.status_code == 200
+
+        cached = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        assert cached.status_code == 304
+
+        other_lang = client.get(
+            url, params={"lang": "de"}, headers={"If-None-Match": first.headers["etag"]}
+        )
+        assert other_lang.status_code == 200
+
+
+def test_server_timing_reports_query_count(
+    client, db_session, auth_token, caplog, monkeypatch
+):
+    instrument_engine(db_session.get_bind().engine)
+    monkeypatch.setattr(settings, "SQL_QUERY_WARN_THRESHOLD", 1)
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    # Warm the reference data cache
+    client.get("/transactions/recent", headers=headers)
+    caplog.clear()
+
+    with caplog.at_level(logging.INFO, logger="app.core.middleware"):
+        response = client.get("/transactions/recent", headers=headers)
+
+    assert response.status_code == 200
+    timing = response.headers["server-timing"]
+    assert timing.startswith("db;dur=")
+    # Page summary plus the enriched page itself
+    assert 'db-count;desc="2"' in timing
+
+    records = [json.loads(r.message) for r in caplog.records]
+    assert records[0]["route"] == "/transactions/recent"
+    assert records[0]["db_queries"] == 2
+    assert "warning" in records[-1]
+
+
+def test_bulk_create_atomic_rejects_whole_batch(
+    client, db_session, tx_refs, auth_token
+):
+    valid = {
+        "contractor_from_id": tx_refs["sender"],
+        "contractor_to_id": tx_refs["receiver"],
+        "amount": "5.00",
+        "status_id": tx_refs["status"],
+        "transaction_type_id": tx_refs["type"],
+    }
+    invalid = {**valid, "contractor_to_id": tx_refs["sender"]}
+
+    response = client.post(
+        "/transactions/bulk",
+        json={"items": [valid, invalid]},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == 0
+    assert body["failed"] == 2
+    assert body["results"][0]["transaction_id"] is None
+    assert body["results"][0]["error"] == "Not created: batch rejected."
+    assert body["results"][1]["error"] == "Receiver and Sender must differ."
+    count = db_session.execute(
+        text("SELECT count(*) FROM transactions WHERE user_id = :uid"),
+        {"uid": tx_refs["uid"]},
+    ).scalar_one()
+    assert count == 0
+
+
+def test_bulk_create_partial_success(client, tx_refs, auth_token):
+    valid = {
+        "contractor_from_id": tx_refs["sender"],
+        "contractor_to_id": tx_refs["receiver"],
+        "amount": "5.00",
+        "status_id": tx_refs["status"],
+        "transaction_type_id": tx_refs["type"],
+    }
+    invalid = {**valid, "transaction_type_id": -1}
+
+    response = client.post(
+        "/transactions/bulk",
+        json={"items": [valid, invalid, valid], "atomic": False},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == 2
+    assert body["failed"] == 1
+    results = body["results"]
+    assert results[0]["transaction_id"] < results[2]["transaction_id"]
+    assert results[1] == {
+        "index": 1,
+        "transaction_id": None,
+        "error": "Invalid transaction type.",
+    }
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+def test_export_transactions(client, db_session, tx_refs, auth_token, fmt):
+    db_session.execute(
+        text("""
+        INSERT INTO transactions (user_id, contractor_from_id, contractor_to_id,
+                                  amount, transaction_type_id, status_id)
+        SELECT :uid, :sender, :receiver, g, :tid, :sid
+        FROM generate_series(1, 5) AS g
+    """),
+        {
+            "uid": tx_refs["uid"],
+            "sender": tx_refs["sender"],
+            "receiver": tx_refs["receiver"],
+            "tid": tx_refs["type"],
+            "sid": tx_refs["status"],
+        },
+    )
+    db_session.commit()
+
+    response = client.get(
+        "/transactions/export",
+        params={"format": fmt},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 200
+    lines = response.text.strip().splitlines()
+    if fmt == "csv":
+        assert response.headers["content-type"].startswith("text/csv")
+        assert lines[0].startswith("transaction_id,created_at")
+        assert len(lines) == 6
+        assert lines[1].endswith("Sender,Receiver,5.00,REFUND,PENDING")
+    else:
+        rows = [json.loads(line) for line in lines]
+        assert len(rows) == 5
+        assert rows[0]["amount"] == "5.00"
+        assert rows[0]["contractor_to"] == "Receiver"
+
+
+def test_import_transactions_csv(client, db_session, tx_refs, auth_token):
+    ledger = (
+        "contractor_from,contractor_to,amount,status,transaction_type,created_at\n"
+        "Sender,Receiver,12.50,PENDING,REFUND,2024-01-02 10:00:00\n"
+        "Sender, New Supplier ,7,PENDING,REFUND,\n"
+        "Sender,Sender ,1,PENDING,REFUND,\n"
+        "Sender,Receiver,abc,PENDING,REFUND,\n"
+        "Sender,Receiver,1,NOPE,REFUND,\n"
+        "Ghost,Receiver,1,PENDING,REFUND,not-a-date\n"
+        " ,Receiver,1,PENDING,REFUND,\n"
+        "New Supplier,Receiver,2,PENDING,REFUND,\n"
+    )
+
+    response = client.post(
+        "/transactions/import",
+        files={"file": ("ledger.csv", ledger, "text/csv")},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 8
+    assert body["imported"] == 3
+    assert body["contractors_created"] == 1
+    assert body["rejected"] == 5
+    assert body["errors"] == [
+        {"row": 3, "reason": "Receiver and Sender must differ."},
+        {"row": 4, "reason": "Invalid amount."},
+        {"row": 5, "reason": "Unknown status."},
+        {"row": 6, "reason": "Invalid created_at."},
+        {"row": 7, "reason": "Missing contractor name."},
+    ]
+    names = (
+        db_session.execute(
+            text("SELECT name FROM contractors WHERE user_id = :uid ORDER BY name"),
+            {"uid": tx_refs["uid"]},
+        )
+        .scalars()
+        .all()
+    )
+    assert names == ["New Supplier", "Receiver", "Sender"]
+
+
+def test_import_transactions_rejects_bad_header(
+    client, db_session, test_user, auth_token
+):
+    response = client.post(
+        "/transactions/import",
+        files={"file": ("ledger.csv", "a,b\n1,2\n", "text/csv")},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 400
+
+    # Only the import was undone, not the surrounding transaction
+    assert (
+        db_session.execute(
+            text("SELECT count(*) FROM users WHERE user_id = :uid"),
+            {"uid": test_user["user_id"]},
+        ).scalar_one()
+        == 1
+    )
+
+
+def test_summary_follows_creates_and_status_changes(
+    client, db_session, tx_refs, auth_token
+):
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    item = {
+        "contractor_from_id": tx_refs["sender"],
+        "contractor_to_id": tx_refs["receiver"],
+        "status_id": tx_refs["status"],
+        "transaction_type_id": tx_refs["type"],
+    }
+    created = client.post(
+        "/transactions/bulk",
+        json={"items": [{**item, "amount": "5.00"}, {**item, "amount": "7.00"}]},
+        headers=headers,
+    ).json()
+    first_id = created["results"][0]["transaction_id"]
+
+    done_id = db_session.execute(
+        text("""
+        INSERT INTO transaction_statuses (code)
+        VALUES ('DONE')
+        RETURNING status_id
+    """)
+    ).scalar_one()
+    db_session.commit()
+    response = client.patch(
+        f"/transactions/{first_id}", json={"status_id": done_id}, headers=headers
+    )
+    assert response.status_code == 200
+
+    response = client.get("/transactions/summary", headers=headers)
+
+    assert response.status_code == 200
+    buckets = {
+        (i["contractor"], i["direction"], i["status"]["code"]): (
+            i["count"],
+            i["total_amount"],
+        )
+        for i in response.json()["items"]
+    }
+    assert buckets == {
+        ("Sender", "outgoing", "PENDING"): (1, "7.00"),
+        ("Sender", "outgoing", "DONE"): (1, "5.00"),
+        ("Receiver", "incoming", "PENDING"): (1, "7.00"),
+        ("Receiver", "incoming", "DONE"): (1, "5.00"),
+    }
+    drift = TransactionRollupRepository(db_session).rebuild(
+        user_id=tx_refs["uid"], dry_run=True
+    )
+    assert drift == []
+
+
+def test_partitions_take_over_rows_from_default(db_session, tx_refs):
+    tx_id = db_session.execute(
+        text("""
+        INSERT INTO transactions (user_id, contractor_from_id, contractor_to_id,
+                                  amount, transaction_type_id, status_id,
+                                  created_at)
+        VALUES (:uid, :sender, :receiver, 1, :type, :status, '2001-03-15 10:00')
+        RETURNING transaction_id
+    """),
+        tx_refs,
+    ).scalar_one()
+
+    def partition():
+        return db_session.execute(
+            text("""
+            SELECT tableoid::regclass::TEXT FROM transactions
+            WHERE transaction_id = :id
+        """),
+            {"id": tx_id},
+        ).scalar_one()
+
+    assert partition() == "transactions_default"
+    assert months_in_default(db_session) == [date(2001, 3, 1)]
+
+    months = month_starts(date(2001, 2, 10), 2)
+    assert months == [date(2001, 2, 1), date(2001, 3, 1)]
+    assert ensure_monthly_partitions(db_session, months) == months
+    assert ensure_monthly_partitions(db_session, months) == []
+
+    assert partition() == "transactions_2001_03"
+    assert months_in_default(db_session) == []
+
+
+def test_search_transactions_combines_filters(client, db_session, tx_refs, auth_token):
+    other_id = db_session.execute(
+        text("""
+        INSERT INTO contractors (user_id, name)
+        VALUES (:uid, 'Acme 100% Ltd')
+        RETURNING contractor_id
+    """),
+        tx_refs,
+    ).scalar_one()
+    rows = [
+        (tx_refs["sender"], tx_refs["receiver"], "10.00", "2025-01-05"),
+        (tx_refs["sender"], other_id, "20.00", "2025-01-10"),
+        (other_id, tx_refs["receiver"], "30.00", "2025-01-15"),
+        (tx_refs["sender"], tx_refs["receiver"], "40.00", "2025-02-01"),
+    ]
+    ids = [
+        db_session.execute(
+            text("""
+            INSERT INTO transactions (user_id, contractor_from_id, contractor_to_id,
+                                      amount, transaction_type_id, status_id,
+                                      created_at)
+            VALUES (:uid, :f, :t, :amount, :type, :status, :at)
+            RETURNING transaction_id
+        """),
+            {**tx_refs, "f": f, "t": t, "amount": amount, "at": at},
+        ).scalar_one()
+        for f, t, amount, at in rows
+    ]
+    db_session.commit()
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    def search(**params):
+        response = client.get("/transactions/search", params=params, headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        return [i["transaction_id"] for i in body["items"]], body["next_cursor"]
+
+    assert search(contractor_name="acme 100%") == ([ids[2], ids[1]], None)
+    assert search(contractor_name="100_") == ([], None)
+    assert search(
+        created_from="2025-01-06T00:00:00",
+        created_to="2025-01-31T00:00:00",
+        amount_min="25",
+    ) == ([ids[2]], None)
+    assert search(
+        contractor_from_id=tx_refs["sender"],
+        contractor_to_id=tx_refs["receiver"],
+        status_id=[tx_refs["status"]],
+        transaction_type_id=[tx_refs["type"]],
+    ) == ([ids[3], ids[0]], None)
+
+    first, cursor = search(contractor_from_id=tx_refs["sender"], limit=2)
+    assert first == [ids[3], ids[1]]
+    assert search(contractor_from_id=tx_refs["sender"], limit=2, cursor=cursor) == (
+        [ids[0]],
+        None,
+    )
+
+    response = client.get(
+        "/transactions/search",
+        params={"amount_min": "5", "amount_max": "1"},
+        headers=headers,
+    )
+    assert response.status_code == 400
+
+
+def test_batch_detail_keeps_request_order_and_marks_missing(
+    client, db_session, tx_refs, auth_token
+):
+    ids = [
+        db_session.execute(
+            text("""
+            INSERT INTO transactions (user_id, contractor_from_id, contractor_to_id,
+                                      amount, transaction_type_id, status_id)
+            VALUES (:uid, :sender, :receiver, :amount, :type, :status)
+            RETURNING transaction_id
+        """),
+            {**tx_refs, "amount": amount},
+        ).scalar_one()
+        for amount in ("1.00", "2.00")
+    ]
+    db_session.commit()
+    missing = ids[-1] + 1000
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    instrument_engine(db_session.get_bind().engine)
+    post = client.post(
+        "/transactions/batch",
+        json={"ids": [ids[1], missing, ids[0]]},
+        headers=headers,
+    )
+    get = client.get(
+        "/transactions",
+        params={"ids": f"{ids[1]},{missing},{ids[0]}"},
+        headers=headers,
+    )
+    single = client.get("/transactions", params={"ids": ids[0]}, headers=headers)
+
+    assert get.status_code == post.status_code == single.status_code == 200
+    assert get.json() == post.json()
+    # Transactions plus contractors, however many IDs are requested
+    assert 'db-count;desc="2"' in get.headers["server-timing"]
+    assert 'db-count;desc="2"' in single.headers["server-timing"]
+    items = get.json()["items"]
+    assert [i["transaction_id"] for i in items] == [ids[1], missing, ids[0]]
+    assert items[0]["transaction"]["amount"] == "2.00"
+    assert items[0]["transaction"]["contractor_from"] == "Sender"
+    assert items[0]["transaction"]["status"]["code"] == "PENDING"
+    assert items[1] == {
+        "transaction_id": missing,
+        "transaction": None,
+        "error": "Transaction not found.",
+    }
+    assert items[2]["transaction"]["amount"] == "1.00"
+
+    response = client.get("/transactions", params={"ids": "1,x"}, headers=headers)
+    assert response.status_code == 400
+
+
+def test_status_update_is_one_statement(client, db_session, tx_refs, auth_token):
+    tx_id = db_session.execute(
+        text("""
+        INSERT INTO transactions (user_id, contractor_from_id, contractor_to_id,
+                                  amount, transaction_type_id, status_id)
+        VALUES (:uid, :sender, :receiver, 3, :type, :status)
+        RETURNING transaction_id
+    """),
+        tx_refs,
+    ).scalar_one()
+    settled_id = db_session.execute(
+        text("""
+        INSERT INTO transaction_statuses (code)
+        VALUES ('SETTLED')
+        RETURNING status_id
+    """)
+    ).scalar_one()
+    TransactionRollupRepository(db_session).rebuild(user_id=tx_refs["uid"])
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    instrument_engine(db_session.get_bind().engine)
+    # Warm the reference data cache
+    client.get("/transactions/recent", headers=headers)
+
+    response = client.patch(
+        f"/transactions/{tx_id}", json={"status_id": settled_id}, headers=headers
+    )
+
+    assert response.status_code == 200
+    assert 'db-count;desc="1"' in response.headers["server-timing"]
+    body = response.json()
+    assert body["status"]["code"] == "SETTLED"
+    assert body["contractor_from"] == "Sender"
+    assert body["transaction_type"]["code"] == "REFUND"
+
+    # Unchanged status: nothing is moved
+    response = client.patch(
+        f"/transactions/{tx_id}", json={"status_id": settled_id}, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.json()["updated_at"] == body["updated_at"]
+
+    drift = TransactionRollupRepository(db_session).rebuild(
+        user_id=tx_refs["uid"], dry_run=True
+    )
+    assert drift == []
+
+    response = client.patch(
+        f"/transactions/{tx_id + 1000}", json={"status_id": settled_id}, headers=headers
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Transaction not found."
+
+    response = client.patch(
+        f"/transactions/{tx_id}", json={"status_id": settled_id + 1000}, headers=headers
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid status."
+
+
+def test_bulk_status_transition(client, db_session, tx_refs, auth_token):
+    settled_id = db_session.execute(
+        text("""
+        INSERT INTO transaction_statuses (code)
+        VALUES ('SETTLED')
+        RETURNING status_id
+    """)
+    ).scalar_one()
+    ids = [
+        db_session.execute(
+            text("""
+            INSERT INTO transactions (user_id, contractor_from_id, contractor_to_id,
+                                      amount, transaction_type_id, status_id)
+            VALUES (:uid, :sender, :receiver, :amount, :type, :status)
+            RETURNING transaction_id
+        """),
+            {**tx_refs, "amount": amount, "status": status},
+        ).scalar_one()
+        for amount, status in (
+            ("1.00", tx_refs["status"]),
+            ("2.00", tx_refs["status"]),
+            ("4.00", settled_id),
+            ("8.00", tx_refs["status"]),
+        )
+    ]
+    foreign_id = db_session.execute(
+        text("SELECT transaction_id FROM transactions WHERE user_id <> :uid LIMIT 1"),
+        tx_refs,
+    ).scalar_one()
+    TransactionRollupRepository(db_session).rebuild(user_id=tx_refs["uid"])
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    response = client.patch(
+        "/transactions/status",
+        json={"status_id": settled_id, "ids": [ids[0], ids[1], ids[2], foreign_id]},
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "updated": [ids[0], ids[1]],
+        "skipped": [ids[2]],
+        "not_found": [foreign_id],
+    }
+
+    response = client.patch(
+        "/transactions/status",
+        json={
+            "status_id": settled_id,
+            "filter": {"status_ids": [tx_refs["status"]], "amount_min": "5"},
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json() == {"updated": [ids[3]], "skipped": [], "not_found": []}
+
+    statuses = db_session.execute(
+        text("SELECT DISTINCT status_id FROM transactions WHERE user_id = :uid"),
+        tx_refs,
+    ).scalars()
+    assert list(statuses) == [settled_id]
+    drift = TransactionRollupRepository(db_session).rebuild(
+        user_id=tx_refs["uid"], dry_run=True
+    )
+    assert drift == []
+
+    response = client.patch(
+        "/transactions/status",
+        json={"status_id": settled_id, "ids": [ids[0]], "filter": {}},
+        headers=headers,
+    )
+    assert response.status_code == 422
+
+
+def test_create_with_idempotency_key_replays_response(
+    client, db_session, tx_refs, auth_token
+):
+    headers = {"Authorization": f"Bearer {auth_token}", "Idempotency-Key": "k-1"}
+    payload = {
+        "contractor_from_id": tx_refs["sender"],
+        "contractor_to_id": tx_refs["receiver"],
+        "amount": "9.99",
+        "status_id": tx_refs["status"],
+        "transaction_type_id": tx_refs["type"],
+    }
+    instrument_engine(db_session.get_bind().engine)
+
+    def count():
+        return db_session.execute(
+            text("SELECT count(*) FROM transactions WHERE user_id = :uid"), tx_refs
+        ).scalar_one()
+
+    first = client.post("/transactions/create", json=payload, headers=headers)
+    assert first.status_code == 200
+    assert "idempotent-replayed" not in first.headers
+
+    # Served from the in-process cache, then from the table
+    replay = client.post("/transactions/create", json=payload, headers=headers)
+    assert 'db-count;desc="0"' in replay.headers["server-timing"]
+    idempotency_cache.clear()
+    replay_db = client.post("/transactions/create", json=payload, headers=headers)
+
+    for response in (replay, replay_db):
+        assert response.status_code == 200
+        assert response.headers["idempotent-replayed"] == "true"
+        assert response.json() == first.json()
+    assert count() == 1
+
+    response = client.post(
+        "/transactions/create", json={**payload, "amount": "1.00"}, headers=headers
+    )
+    assert response.status_code == 422
+
+    # Rejected requests replay their error
+    bad = {**payload, "contractor_to_id": tx_refs["sender"]}
+    for _ in range(2):
+        response = client.post(
+            "/transactions/create",
+            json=bad,
+            headers={**headers, "Idempotency-Key": "k-2"},
+        )
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Receiver and Sender must differ."}
+    assert count() == 1
+
+    db_session.execute(
+        text("""
+        UPDATE idempotency_keys SET created_at = created_at - INTERVAL '2 hours'
+        WHERE user_id = :uid
+    """),
+        tx_refs,
+    )
+    assert IdempotencyRepository(db_session).purge_expired(ttl_seconds=3600) == 2
+
+
+def test_idempotency_expiry_ignores_database_time_zone(db_session, test_user):
+    db_session.execute(text("SET LOCAL TIME ZONE 'Pacific/Kiritimati'"))
+    repo = IdempotencyRepository(db_session)
+    uid = test_user["user_id"]
+
+    assert repo.claim(uid, "k-tz", "hash", ttl_seconds=3600, lock_seconds=60) is None
+    repo.complete(uid, "k-tz", lambda: (200, {}))
+
+    record = repo.claim(uid, "k-tz", "hash", ttl_seconds=3600, lock_seconds=60)
+    assert record is not None and record.status_code == 200
+    assert 3500 < record.expires_in <= 3600
+
+
+def test_stale_claim_of_a_killed_request_is_taken_over(
+    client, db_session, tx_refs, auth_token
+):
+    headers = {"Authorization": f"Bearer {auth_token}", "Idempotency-Key": "k-4"}
+    payload = {
+        "contractor_from_id": tx_refs["sender"],
+        "contractor_to_id": tx_refs["receiver"],
+        "amount": "4.00",
+        "status_id": tx_refs["status"],
+        "transaction_type_id": tx_refs["type"],
+    }
+    repo = IdempotencyRepository(db_session)
+    # A claim whose worker died before completing it
+    assert repo.claim(tx_refs["uid"], "k-4", "other", 3600, 60) is None
+
+    response = client.post("/transactions/create", json=payload, headers=headers)
+    assert response.status_code == 422
+
+    db_session.execute(
+        text("""
+        UPDATE idempotency_keys SET created_at = created_at - INTERVAL '2 minutes'
+        WHERE user_id = :uid
+    """),
+        tx_refs,
+    )
+    response = client.post("/transactions/create", json=payload, headers=headers)
+    assert response.status_code == 200
+    assert "idempotent-replayed" not in response.headers
+
+    replay = client.post("/transactions/create", json=payload, headers=headers)
+    assert replay.headers["idempotent-replayed"] == "true"
+
+    empty_key = {**headers, "Idempotency-Key": ""}
+    response = client.post("/transactions/create", json=payload, headers=empty_key)
+    assert response.status_code == 422
+
+
+def test_failure_after_insert_commits_nothing_and_frees_the_key(
+    client, db_session, tx_refs, auth_token, monkeypatch
+):
+    headers = {"Authorization": f"Bearer {auth_token}", "Idempotency-Key": "k-3"}
+    payload = {
+        "contractor_from_id": tx_refs["sender"],
+        "contractor_to_id": tx_refs["receiver"],
+        "amount": "3.00",
+        "status_id": tx_refs["status"],
+        "transaction_type_id": tx_refs["type"],
+    }
+
+    def count(table):
+        return db_session.execute(
+            text(f"SELECT count(*) FROM {table} WHERE user_id = :uid"), tx_refs
+        ).scalar_one()
+
+    def fail(*_):
+        raise RuntimeError("boom")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(TransactionService, "present_transaction", fail)
+        with pytest.raises(RuntimeError):
+            client.post("/transactions/create", json=payload, headers=headers)
+    assert count("transactions") == count("idempotency_keys") == 0
+
+    response = client.post("/transactions/create", json=payload, headers=headers)
+    assert response.status_code == 200
+    assert "idempotent-replayed" not in response.headers
+    assert count("transactions") == count("idempotency_keys") == 1
+
+
+def test_core_reads_map_rows_onto_domain_fields(db_session, tx_refs):
+    own_fields = [f.name for f in fields(Transaction)][: len(TRANSACTION_COLUMNS)]
+    assert [c.key for c in TRANSACTION_COLUMNS] == own_fields
+
+    db_session.execute(
+        text("""
+        INSERT INTO transactions (user_id, contractor_from_id, contractor_to_id,
+                                  amount, transaction_type_id, status_id,
+                                  created_at)
+        VALUES (:uid, :sender, :receiver, 7.50, :type, :status,
+                NOW() - interval '1 day'),
+               (:uid, :receiver, :sender, 2.25, :type, :status, NOW())
+    """),
+        tx_refs,
+    )
+    repo = TransactionRepository(db_session)
+
+    recent = repo.get_recent(tx_refs["uid"], limit=10)
+    assert [tx.amount for tx in recent] == [Decimal("2.25"), Decimal("7.50")]
+    assert recent[0].contractor_from_id == tx_refs["receiver"]
+    assert recent[0].status_id == tx_refs["status"]
+    assert recent[0].contractor_from_name is None
+
+    assert repo.get_for_contractors([tx_refs["sender"]]) == recent
+    assert repo.get_by_id(recent[1].transaction_id) == recent[1]
+
+    (enriched, _) = repo.get_recent_enriched(tx_refs["uid"], limit=10)
+    assert enriched.amount == Decimal("2.25")
+    assert enriched.contractor_from_name == "Receiver"
+    assert enriched.contractor_to_name == "Sender"
+    assert enriched.transaction_type_code == "REFUND"
+    assert enriched.transaction_type_display_name == "Refund"
+    assert enriched.status_code == "PENDING"
+    assert enriched.status_display_name == "Pending"
+    assert enriched.status_color == "blue"
@@ -0,0 +1,36 @@
+import random
+from collections import Counter
+from datetime import datetime
+
+from app.cli.generate_data import transaction_lines
+
+
+def _lines(seed: int) -> list[str]:
+    return list(
+        transaction_lines(
+            random.Random(seed),
+            count=2000,
+            user_ids=[1, 2, 3, 4],
+            contractors_by_user={
+                u: [u * 10 + i for i in range(5)] for u in range(1, 5)
+            },
+            status_ids=[1, 2],
+            type_ids=[7],
+            end=datetime(2025, 1, 1),
+            days=30,
+            user_skew=1.1,
+            contractor_skew=1.2,
+        )
+    )
+
+
+def test_transaction_lines_are_deterministic_and_skewed():
+    lines = _lines(seed=3)
+    assert lines == _lines(seed=3)
+    assert lines != _lines(seed=4)
+
+    rows = [line.rstrip("\n").split("\t") for line in lines]
+    assert all(sender != receiver for _, sender, receiver, *_ in rows)
+
+    per_user = Counter(row[0] for row in rows).most_common()
+    assert per_user[0][1] > 2 * per_user[-1][1]
@@ -0,0 +1,28 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.db.pool import InstrumentedQueuePool, pool_status
+
+
+def test_pool_status_counts_checkouts_and_timeouts():
+    engine = create_engine(
+        "sqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+
+    conn = engine.connect()
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+
+    status = pool_status(engine)
+    conn.close()
+    engine.dispose()
+
+    assert status["checked_out"] == 1
+    assert status["checkouts"] == 1
+    assert status["checkout_timeouts"] == 1
+    assert status["overflow"] == 0
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+
+from app.domain.models import (
+    TransactionStatus,
+    TransactionStatusColor,
+    TransactionStatusTranslation,
+    TransactionType,
+    TransactionTypeTranslation,
+)
+from app.services.reference_data import ReferenceDataCache
+from app.services.status_service import StatusService
+from app.services.transaction_type_service import TransactionTypeService
+
+
+def make_status_repo():
+    status_repo = MagicMock()
+    status_repo.get_all.return_value = [
+        TransactionStatus(status_id=1, code="SENT"),
+        TransactionStatus(status_id=2, code="PAID"),
+    ]
+    status_repo.get_all_colors.return_value = [
+        TransactionStatusColor(status_id=1, color="red"),
+    ]
+    status_repo.get_all_translations.return_value = [
+        TransactionStatusTranslation(
+            status_id=1, language_code="en", display_name="Sent"
+        ),
+        TransactionStatusTranslation(
+            status_id=1, language_code="bg", display_name="Изпратено"
+        ),
+    ]
+    return status_repo
+
+
+def test_status_options_are_loaded_once():
+    status_repo = make_status_repo()
+    service = StatusService(status_repo, cache=ReferenceDataCache(ttl_seconds=60))
+
+    first = service.get_all_options("en")
+    second = service.get_all_options("bg")
+
+    assert [o.display_name for o in first] == ["Sent", "PAID"]
+    assert [o.color for o in first] == ["red", "#000000"]
+    assert second[0].display_name == "Изпратено"
+    status_repo.get_all.assert_called_once()
+    status_repo.get_all_colors.assert_called_once()
+    status_repo.get_all_translations.assert_called_once()
+
+
+def test_invalidate_forces_reload():
+    status_repo = make_status_repo()
+    cache = ReferenceDataCache(ttl_seconds=60)
+    service = StatusService(status_repo, cache=cache)
+
+    service.get_all_options()
+    cache.invalidate()
+    service.get_all_options()
+
+    assert status_repo.get_all.call_count == 2
+
+
+def test_expired_catalog_is_reloaded():
+    type_repo = MagicMock()
+    type_repo.get_all.return_value = [TransactionType(transaction_type_id=1, code="IN")]
+    type_repo.get_all_translations.return_value = [
+        TransactionTypeTranslation(
+            transaction_type_id=1, language_code="en", display_name="Incoming"
+        ),
+    ]
+    service = TransactionTypeService(type_repo, cache=ReferenceDataCache(ttl_seconds=0))
+
+    options = service.get_all_options()
+    service.get_all_options()
+
+    assert options[0].display_name == "Incoming"
+    assert type_repo.get_all.call_count == 2
@@ -0,0 +1,43 @@
+from sqlalchemy import create_engine, select, text
+
+from app.db.routing import RoutingSession, use_primary, use_replica
+
+
+def _session() -> RoutingSession:
+    return RoutingSession(
+        writer=create_engine("sqlite://"), readers=[create_engine("sqlite://")]
+    )
+
+
+def test_reads_go_to_replica_only_inside_use_replica():
+    db = _session()
+    stmt = select(1)
+
+    assert db.get_bind(clause=stmt) is db.writer
+    with use_replica(db):
+        assert db.get_bind(clause=stmt) is db.readers[0]
+    assert db.get_bind(clause=stmt) is db.writer
+
+
+def test_session_sticks_to_writer_after_a_write():
+    db = _session()
+
+    db.get_bind(clause=text("DELETE FROM t"))
+    with use_replica(db):
+        assert db.get_bind(clause=select(1)) is db.writer
+
+
+def test_use_primary_overrides_nested_replica_reads():
+    db = _session()
+
+    with use_primary(db), use_replica(db):
+        assert db.get_bind(clause=select(1)) is db.writer
+    with use_replica(db):
+        assert db.get_bind(clause=select(1)) is db.readers[0]
+
+
+def test_without_readers_everything_uses_writer():
+    db = RoutingSession(writer=create_engine("sqlite://"))
+
+    with use_replica(db):
+        assert db.get_bind(clause=select(1)) is db.writer
@@ -0,0 +1,54 @@
+import time
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from app.core.config.settings import settings
+from app.core.security import VerifiedTokenCache, get_current_user, token_cache
+
+
+def _token(user_id: int, expires_in: float = 3600) -> str:
+    return jwt.encode(
+        {"sub": str(user_id), "exp": int(time.time() + expires_in)},
+        settings.JWT_SECRET,
+        algorithm=settings.JWT_ALGORITHM,
+    )
+
+
+def test_get_current_user_caches_verified_tokens():
+    token = _token(7)
+
+    assert get_current_user(token) == 7
+    assert get_current_user(token) == 7
+
+    stats = token_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["size"] == 1
+
+
+def test_cache_evicts_least_recently_used_and_expired_entries():
+    cache = VerifiedTokenCache(maxsize=2)
+    now = time.time()
+    cache.put("a", 1, now + 60)
+    cache.put("b", 2, now + 60)
+    cache.get("a")
+    cache.put("c", 3, now + 60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.put("old", 4, now - 1)
+    assert cache.get("old") is None
+
+
+def test_secret_rotation_clears_cache(monkeypatch):
+    token = _token(7)
+    get_current_user(token)
+
+    monkeypatch.setattr(settings, "JWT_SECRET", settings.JWT_SECRET + "-rotated")
+
+    with pytest.raises(HTTPException) as exc:
+        get_current_user(token)
+    assert exc.value.status_code == 401
@@ -2,6 +2,8 @@
 -- Drop existing tables (development only)
 -- ============================
 
+DROP TABLE IF EXISTS idempotency_keys CASCADE;
+DROP TABLE IF EXISTS transaction_rollups CASCADE;
 DROP TABLE IF EXISTS transactions CASCADE;
 DROP TABLE IF EXISTS transaction_status_translations CASCADE;
 DROP TABLE IF EXISTS transaction_status_colors CASCADE;
@@ -85,8 +87,10 @@ CREATE TABLE transaction_type_translations (
 -- Transactions
 -- ============================
 
+-- Range-partitioned by month on created_at. The primary key has to include
+-- the partition key; transaction_id alone stays unique through its sequence.
 CREATE TABLE transactions (
-    transaction_id SERIAL PRIMARY KEY,
+    transaction_id SERIAL,
     user_id INTEGER NOT NULL REFERENCES users(user_id),
     contractor_from_id INTEGER NOT NULL REFERENCES contractors(contractor_id),
     contractor_to_id INTEGER NOT NULL REFERENCES contractors(contractor_id),
@@ -94,8 +98,61 @@ CREATE TABLE transactions (
     transaction_type_id INT  NOT NULL REFERENCES transaction_types(transaction_type_id),
     status_id INTEGER NOT NULL REFERENCES transaction_statuses(status_id),
     created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
-);
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (transaction_id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Catches rows whose month has no partition yet
+CREATE TABLE transactions_default PARTITION OF transactions DEFAULT;
+
+-- Create the partition for the month containing the given date, unless it
+-- exists. Rows of that month already parked in transactions_default are
+-- moved into it. Returns whether a partition was created. Called ahead of
+-- time by app.cli.create_partitions.
+CREATE OR REPLACE FUNCTION ensure_transaction_partition(month DATE)
+RETURNS BOOLEAN AS $$
+DECLARE
+    start_at DATE := date_trunc('month', month);
+    end_at DATE := date_trunc('month', month) + INTERVAL '1 month';
+    part TEXT := 'transactions_' || to_char(month, 'YYYY_MM');
+BEGIN
+    IF to_regclass(part) IS NOT NULL THEN
+        RETURN FALSE;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM transactions_default
+        WHERE created_at >= start_at AND created_at < end_at
+    ) THEN
+        ALTER TABLE transactions DETACH PARTITION transactions_default;
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF transactions FOR VALUES FROM (%L) TO (%L)',
+            part, start_at, end_at
+        );
+        WITH moved AS (
+            DELETE FROM transactions_default
+            WHERE created_at >= start_at AND created_at < end_at
+            RETURNING *
+        )
+        INSERT INTO transactions SELECT * FROM moved;
+        ALTER TABLE transactions ATTACH PARTITION transactions_default DEFAULT;
+    ELSE
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF transactions FOR VALUES FROM (%L) TO (%L)',
+            part, start_at, end_at
+        );
+    END IF;
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Two years back and three months ahead
+SELECT ensure_transaction_partition(m::DATE)
+FROM generate_series(
+    date_trunc('month', NOW()) - INTERVAL '24 months',
+    date_trunc('month', NOW()) + INTERVAL '3 months',
+    INTERVAL '1 month'
+) AS m;
 
 -- update trigger
 CREATE OR REPLACE FUNCTION update_timestamp()
@@ -112,10 +169,72 @@ FOR EACH ROW
 EXECUTE FUNCTION update_timestamp();
 
 
+-- ============================
+-- Transaction Rollups
+-- ============================
+
+-- Per-user totals, maintained by the application on every transaction write.
+-- Each transaction counts once for its sender ('outgoing') and once for its
+-- receiver ('incoming').
+CREATE TABLE transaction_rollups (
+    user_id INTEGER NOT NULL REFERENCES users(user_id),
+    contractor_id INTEGER NOT NULL REFERENCES contractors(contractor_id),
+    direction TEXT NOT NULL CHECK (direction IN ('outgoing', 'incoming')),
+    status_id INTEGER NOT NULL REFERENCES transaction_statuses(status_id),
+    transaction_type_id INT NOT NULL REFERENCES transaction_types(transaction_type_id),
+    tx_count BIGINT NOT NULL DEFAULT 0,
+    total_amount NUMERIC(18,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, contractor_id, direction, status_id, transaction_type_id)
+);
+
+
+-- ============================
+-- Idempotency keys
+-- ============================
+
+-- Responses of POST /transactions/create keyed by the client's
+-- Idempotency-Key. status_code and response stay NULL while the first request
+-- is in flight. Rows older than IDEMPOTENCY_TTL_SECONDS are removed by
+-- app.cli.purge_idempotency_keys.
+CREATE TABLE idempotency_keys (
+    user_id INTEGER NOT NULL REFERENCES users(user_id),
+    idempotency_key TEXT NOT NULL,
+    request_hash TEXT NOT NULL,
+    status_code INTEGER,
+    response JSONB,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (user_id, idempotency_key)
+);
+
+
 -- ============================
 -- Indexes (performance)
 -- ============================
 
-CREATE INDEX idx_transactions_from_contractor ON transactions(contractor_from_id);
-CREATE INDEX idx_transactions_to_contractor ON transactions(contractor_to_id);
 CREATE INDEX idx_transactions_created_at ON transactions(created_at);
+
+-- Keyset pagination of a user's transactions (newest first); also serves the
+-- date and amount filters of /transactions/search
+CREATE INDEX idx_transactions_user_created_id
+    ON transactions(user_id, created_at DESC, transaction_id DESC);
+
+-- /transactions/search by sender / receiver, in page order. A contractor
+-- belongs to one user, so user_id is implied. These also cover the foreign
+-- keys to contractors.
+CREATE INDEX idx_transactions_from_contractor
+    ON transactions(contractor_from_id, created_at DESC, transaction_id DESC);
+CREATE INDEX idx_transactions_to_contractor
+    ON transactions(contractor_to_id, created_at DESC, transaction_id DESC);
+
+-- /transactions/search by status or type, in page order
+CREATE INDEX idx_transactions_user_status_created
+    ON transactions(user_id, status_id, created_at DESC, transaction_id DESC);
+CREATE INDEX idx_transactions_user_type_created
+    ON transactions(user_id, transaction_type_id, created_at DESC, transaction_id DESC);
+
+-- TTL sweep of idempotency keys
+CREATE INDEX idx_idempotency_keys_created_at ON idempotency_keys(created_at);
+
+-- Contractor name substring search (ILIKE '%...%')
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX idx_contractors_name_trgm ON contractors USING gin (name gin_trgm_ops);
@@ -197,3 +197,18 @@ VALUES
   (2, 3, 1, 20.00, 2, 1, TIMESTAMP '2025-11-10 11:00:00', TIMESTAMP '2025-11-10 11:00:00'),
   (1, 2, 4, 75.00, 3, 2, TIMESTAMP '2025-11-05 12:00:00', TIMESTAMP '2025-11-05 12:00:00'),
   (2, 4, 2, 15.00, 1, 2, TIMESTAMP '2025-10-30 13:00:00', TIMESTAMP '2025-10-30 13:00:00');
+
+-- ============================
+-- Transaction Rollups (derived from the rows above)
+-- ============================
+
+INSERT INTO transaction_rollups (user_id, contractor_id, direction, status_id,
+                                 transaction_type_id, tx_count, total_amount)
+SELECT t.user_id, d.contractor_id, d.direction, t.status_id,
+       t.transaction_type_id, count(*), sum(t.amount)
+FROM transactions t,
+     LATERAL (VALUES (t.contractor_from_id, 'outgoing'),
+                     (t.contractor_to_id, 'incoming'))
+         AS d(contractor_id, direction)
+GROUP BY t.user_id, d.contractor_id, d.direction, t.status_id,
+         t.transaction_type_id;
@@ -1,5 +1,7 @@
 import apiClient from "./api";
 import type {
+  TransactionBatchDetailResponse,
+  TransactionBulkStatusResponse,
   TransactionDetail,
   TransactionListResponse,
   TransactionCreateRequest,
@@ -26,6 +28,18 @@ export const transactionService = {
     return response.data;
   },
 
+  // Move many transactions to one status in a single request
+  async setStatus(
+    txIds: number[],
+    statusId: number,
+  ): Promise<TransactionBulkStatusResponse> {
+    const response = await apiClient.patch<TransactionBulkStatusResponse>(
+      "/transactions/status",
+      { ids: txIds, status_id: statusId },
+    );
+    return response.data;
+  },
+
   async getRecent(): Promise<TransactionListResponse> {
     const response = await apiClient.get<TransactionListResponse>(
       "/transactions/recent",
@@ -39,4 +53,14 @@ export const transactionService = {
     );
     return response.data;
   },
+
+  // Details of many transactions (e.g. a visible page) in one request,
+  // in the order given
+  async getMany(txIds: number[]): Promise<TransactionBatchDetailResponse> {
+    const response = await apiClient.post<TransactionBatchDetailResponse>(
+      "/transactions/batch",
+      { ids: txIds },
+    );
+    return response.data;
+  },
 };
@@ -15,6 +15,16 @@ export interface TransactionDetail {
   updated_at: string;
 }
 
+export interface TransactionBatchDetailItem {
+  transaction_id: number;
+  transaction: TransactionDetail | null; // null when not found
+  error: string | null;
+}
+
+export interface TransactionBatchDetailResponse {
+  items: TransactionBatchDetailItem[];
+}
+
 export interface TransactionListItem {
   transaction_id: number;
   contractor_from: string;
@@ -40,3 +50,9 @@ export interface TransactionCreateRequest {
 export interface TransactionUpdateRequest {
   status_id?: number;
 }
+
+export interface TransactionBulkStatusResponse {
+  updated: number[];
+  skipped: number[]; // already in the target status
+  not_found: number[];
+}